@@ -0,0 +1,191 @@
+# Copyright (c) 2018-2026 William Emerison Six
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+
+"""Bake a :class:`~cayleyscene.Animation` to arrays once, replay it for free.
+
+A lecture or a video export plays the same scene many times over.
+:func:`bake` samples the animation at a fixed ``rate`` across the whole
+``Timeline.duration`` -- every placed space's model matrix, the world->camera
+inverse and the GPU progress values -- and writes them to one ``.npz``:
+
+* ``rate`` and ``times``: the sample rate and the ``(frames,)`` sample
+  times, ``frame / rate``;
+* ``transform.<space>``: ``(frames, 4, 4)`` float32 per placed space (named
+  by :func:`~cayleygraph.node_label`);
+* ``inverse_transform``: ``(frames, 4, 4)`` float32;
+* ``gpu_labels`` / ``gpu_progress``: the GPU step labels and a
+  ``(frames, steps)`` float32 array.
+
+The archive is written **uncompressed**, so each member is a plain ``.npy``
+at some offset in the file.  :meth:`BakedAnimation.load` memory-maps every
+member in place: opening costs nothing, and a frame is read from the page
+cache only when it is scrubbed to.  Playback answers the same questions as
+the :class:`~cayleyscene.Animation` it was baked from
+(``transform_matrix``, ``inverse_transform_matrix``, ``gpu_progress``), with
+a lookup instead of any math.
+
+No OpenGL here, like the rest of the package.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import typing
+import zipfile
+
+import numpy as np
+
+from modelviewprojection.cayley import cayleygraph, cayleyscene
+
+#: the GL demos' frame rate, and the default sample rate
+DEFAULT_BAKE_RATE = 60.0
+
+
+def bake(
+    animation: cayleyscene.Animation,
+    path: str | os.PathLike[str],
+    rate: float = DEFAULT_BAKE_RATE,
+) -> None:
+    """Sample ``animation`` at ``rate`` frames per second and write the
+    arrays to ``path``.  Samples start at 0 and step by ``1 / rate`` up to
+    the timeline's ``duration``: the last one lands on ``duration`` only when
+    ``duration * rate`` is whole, since playback finds a frame by
+    ``round(time * rate)`` and needs them evenly spaced."""
+    if rate <= 0.0:
+        raise ValueError(f"bake: rate must be positive, got {rate}")
+    frames: int = int(animation.timeline.duration * rate) + 1
+    times: np.ndarray = np.arange(frames) / rate
+    spaces = [
+        placement.space for placement in animation.scene.coordinate_frames
+    ]
+    labels = [g.label for g in animation.timeline.gpu_steps]
+
+    arrays: typing.Dict[str, np.ndarray] = {
+        f"transform.{cayleygraph.node_label(space)}": np.empty(
+            (frames, 4, 4), np.float32
+        )
+        for space in spaces
+    }
+    inverse_transform: np.ndarray = np.empty((frames, 4, 4), np.float32)
+    gpu_progress: np.ndarray = np.empty((frames, len(labels)), np.float32)
+    for frame, time in enumerate(times):
+        for space in spaces:
+            arrays[f"transform.{cayleygraph.node_label(space)}"][frame] = (
+                animation.transform_matrix(space, time)
+            )
+        inverse_transform[frame] = animation.inverse_transform_matrix(time)
+        gpu_progress[frame] = [p for _label, p in animation.gpu_progress(time)]
+
+    # savez (not savez_compressed): stored members are what load() maps
+    np.savez(
+        path,
+        rate=np.array(rate),
+        times=times,
+        inverse_transform=inverse_transform,
+        gpu_labels=np.array(labels, dtype=str),
+        gpu_progress=gpu_progress,
+        **arrays,
+    )
+
+
+def _map_members(path: str | os.PathLike[str]) -> typing.Dict[str, np.ndarray]:
+    """Every array in the ``.npz`` at ``path``: memory-mapped where the member
+    is stored uncompressed (as :func:`bake` writes them), read otherwise."""
+    arrays: typing.Dict[str, np.ndarray] = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as raw:
+        for info in archive.infolist():
+            name: str = info.filename.removesuffix(".npy")
+            if info.compress_type != zipfile.ZIP_STORED:
+                with archive.open(info) as member:
+                    arrays[name] = np.lib.format.read_array(member)
+                continue
+            # skip the member's local header (30 fixed bytes, then its name
+            # and extra field) to reach the .npy inside, then its own header
+            raw.seek(info.header_offset + 26)
+            name_length, extra_length = np.frombuffer(raw.read(4), "<u2")
+            raw.seek(int(name_length) + int(extra_length), os.SEEK_CUR)
+            match np.lib.format.read_magic(raw):
+                case (1, 0):
+                    header = np.lib.format.read_array_header_1_0(raw)
+                case (2, 0):
+                    header = np.lib.format.read_array_header_2_0(raw)
+                case version:
+                    raise ValueError(
+                        f"_map_members: unsupported .npy version {version}"
+                    )
+            shape, fortran_order, dtype = header
+            arrays[name] = np.memmap(
+                path,
+                dtype=dtype,
+                mode="r",
+                offset=raw.tell(),
+                shape=shape,
+                order="F" if fortran_order else "C",
+            )
+    return arrays
+
+
+@dataclasses.dataclass
+class BakedAnimation:
+    """A baked animation, played back by frame lookup.
+
+    ``time`` is rounded to the nearest baked frame and clamped to the
+    timeline, so scrubbing anywhere is a constant-time index.
+    """
+
+    rate: float
+    times: np.ndarray
+    transforms: typing.Dict[str, np.ndarray]
+    inverse_transforms: np.ndarray
+    gpu_labels: typing.List[str]
+    gpu_progresses: np.ndarray
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> "BakedAnimation":
+        """Memory-map a file written by :func:`bake`."""
+        arrays = _map_members(path)
+        return cls(
+            rate=float(arrays["rate"]),
+            times=arrays["times"],
+            transforms={
+                name.removeprefix("transform."): array
+                for name, array in arrays.items()
+                if name.startswith("transform.")
+            },
+            inverse_transforms=arrays["inverse_transform"],
+            gpu_labels=[str(label) for label in arrays["gpu_labels"]],
+            gpu_progresses=arrays["gpu_progress"],
+        )
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def frame(self, time: float) -> int:
+        """The baked frame nearest ``time``."""
+        return min(max(round(time * self.rate), 0), len(self) - 1)
+
+    def transform_matrix(self, space: typing.Any, time: float) -> np.ndarray:
+        """The baked ``Animation.transform_matrix(space, time)``."""
+        label: str = cayleygraph.node_label(space)
+        if label not in self.transforms:
+            raise ValueError(f"transform_matrix: {label!r} was not baked")
+        return self.transforms[label][self.frame(time)]
+
+    def inverse_transform_matrix(self, time: float) -> np.ndarray:
+        """The baked ``Animation.inverse_transform_matrix(time)``."""
+        return self.inverse_transforms[self.frame(time)]
+
+    def gpu_progress(
+        self, time: float
+    ) -> typing.List[typing.Tuple[str, float]]:
+        """The baked ``Animation.gpu_progress(time)``."""
+        progress: np.ndarray = self.gpu_progresses[self.frame(time)]
+        return [
+            (label, float(p))
+            for label, p in zip(self.gpu_labels, progress, strict=True)
+        ]
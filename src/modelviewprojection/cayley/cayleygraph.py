@@ -28,6 +28,14 @@ Design (per Bill):
   also
   work).  :func:`node_label` gives a readable name for either.
 
+Because the structure never changes, routes are indexed once at construction.
+When the edges form a forest (no cycle even ignoring direction -- every demo
+graph so far), each component is rooted and every space records its parent
+edge and depth; a route then climbs from both ends to their lowest common
+ancestor, so :meth:`CayleyGraph.path` costs O(route length) rather than a
+search of the whole graph.  Other graphs fall back to a breadth-first search.
+Either way each ``(a, b)`` route is memoized on first use.
+
 A ``Step``'s ``fn`` stays mutable on purpose: that is a transform *parameter*
 (e.g. the editable virtual camera rewrites it in place), not the graph
 structure.
@@ -209,6 +217,66 @@ class Path:
         return compose(list(reversed(edge_fns)))
 
 
+@dataclasses.dataclass
+class _TreeIndex(typing.Generic[N]):
+    """The rooted-forest view of a graph whose undirected edges have no cycle.
+
+    ``parents`` maps each space to ``(parent, edge, forward)`` -- ``forward``
+    is True when walking *up* from the space to its parent follows the arrow
+    -- or to None at its component's root; ``depth`` counts edges from that
+    root; ``roots`` names each space's root, so two spaces are connected
+    exactly when they share one.
+    """
+
+    parents: typing.Dict[N, typing.Optional[typing.Tuple[N, Edge, bool]]]
+    depth: typing.Dict[N, int]
+    roots: typing.Dict[N, N]
+
+    def lowest_common_ancestor(self, a: N, b: N) -> N:
+        """The deepest space that is an ancestor of (or equal to) both ``a``
+        and ``b`` -- found by lifting the deeper one to the other's depth and
+        then both together, which is O(route length)."""
+        while self.depth[a] > self.depth[b]:
+            a = self._parent(a)
+        while self.depth[b] > self.depth[a]:
+            b = self._parent(b)
+        while a != b:
+            a, b = self._parent(a), self._parent(b)
+        return a
+
+    def _parent(self, space: N) -> N:
+        up = self.parents[space]
+        assert up is not None  # only the root has none, and it is never lifted
+        return up[0]
+
+    def _climb(
+        self, space: N, ancestor: N
+    ) -> typing.List[typing.Tuple[Edge, bool]]:
+        """The edges walked going up from ``space`` to ``ancestor``."""
+        route: typing.List[typing.Tuple[Edge, bool]] = []
+        while space != ancestor:
+            up = self.parents[space]
+            assert up is not None
+            space, edge, forward = up
+            route.append((edge, forward))
+        return route
+
+    def route(self, a: N, b: N) -> typing.List[typing.Tuple[Edge, bool]]:
+        """The unique route a->b: up from ``a`` to the common ancestor, then
+        down to ``b`` -- ``b``'s climb reversed, each edge walked the other
+        way."""
+        if self.roots[a] != self.roots[b]:
+            raise ValueError(
+                f"no path from {node_label(a)!r} to {node_label(b)!r}"
+            )
+        ancestor: N = self.lowest_common_ancestor(a, b)
+        down = [
+            (edge, not forward)
+            for edge, forward in reversed(self._climb(b, ancestor))
+        ]
+        return self._climb(a, ancestor) + down
+
+
 class CayleyGraph(typing.Generic[N]):
     """An immutable directed acyclic graph of spaces, built from all its edges
     at once: ``CayleyGraph([Edge(a, b, ...), Edge(c, b, ...), ...])``.
@@ -239,9 +307,15 @@ class CayleyGraph(typing.Generic[N]):
     Traceback (most recent call last):
         ...
     ValueError: Cayley graph must be acyclic; cycle through ...
+
+    Paths are memoized per ``(a, b)``; pass ``memoize=False`` to trace every
+    request afresh (each call still returns its own :class:`Path`, so the
+    cache never hands out a shared, mutable route).
     """
 
-    def __init__(self, edges: typing.Iterable[Edge]) -> None:
+    def __init__(
+        self, edges: typing.Iterable[Edge], memoize: bool = True
+    ) -> None:
         self._edges: typing.Tuple[Edge, ...] = tuple(edges)
         # undirected adjacency: space -> ((neighbor, edge, walked_forward), ...)
         adj: typing.Dict[N, list] = {}
@@ -250,6 +324,11 @@ class CayleyGraph(typing.Generic[N]):
             adj.setdefault(e.dst, []).append((e.src, e, False))
         self._adj: typing.Dict[N, tuple] = {k: tuple(v) for k, v in adj.items()}
         self._assert_acyclic()
+        self._tree: typing.Optional[_TreeIndex[N]] = self._index_tree()
+        self._memoize: bool = memoize
+        self._routes: typing.Dict[
+            typing.Tuple[N, N], typing.Tuple[typing.Tuple[Edge, bool], ...]
+        ] = {}
 
     def _assert_acyclic(self) -> None:
         """Validate the DIRECTED edges have no cycle (DFS 3-coloring)."""
@@ -275,6 +354,36 @@ class CayleyGraph(typing.Generic[N]):
             if color.get(n, _DfsColor.WHITE) == _DfsColor.WHITE:
                 visit(n)
 
+    def _index_tree(self) -> typing.Optional[_TreeIndex[N]]:
+        """Root each connected component at its first space (breadth-first)
+        and record parents and depths -- or None if some component has more
+        edges than a tree on its spaces, i.e. a cycle ignoring direction,
+        where routes are no longer unique and :meth:`_route` must search."""
+        parents: typing.Dict[N, typing.Optional[typing.Tuple[N, Edge, bool]]]
+        parents = {}
+        depth: typing.Dict[N, int] = {}
+        roots: typing.Dict[N, N] = {}
+        for root in self._adj:
+            if root in parents:
+                continue
+            parents[root] = None
+            depth[root] = 0
+            roots[root] = root
+            q: typing.Deque[N] = deque([root])
+            while q:
+                n = q.popleft()
+                for neighbor, edge, forward in self._adj[n]:
+                    if neighbor not in parents:
+                        # walking up, neighbor -> n, is against n -> neighbor
+                        parents[neighbor] = (n, edge, not forward)
+                        depth[neighbor] = depth[n] + 1
+                        roots[neighbor] = root
+                        q.append(neighbor)
+        tree_edges: int = len(parents) - len(set(roots.values()))
+        if len(self._edges) != tree_edges:
+            return None
+        return _TreeIndex(parents, depth, roots)
+
     @property
     def spaces(self) -> typing.Tuple[N, ...]:
         return tuple(self._adj.keys())
@@ -284,7 +393,8 @@ class CayleyGraph(typing.Generic[N]):
         return self._edges
 
     def _route(self, a: N, b: N) -> typing.List[typing.Tuple[Edge, bool]]:
-        """Shortest route a->b over the undirected graph (BFS).  Acyclicity is
+        """Shortest route a->b over the undirected graph: the unique tree
+        route when the graph is a forest, a BFS otherwise.  Acyclicity is
         already guaranteed, so this always terminates."""
 
         # BFS bookkeeping: node -> (parent, edge, walked_forward), None at the
@@ -341,9 +451,16 @@ class CayleyGraph(typing.Generic[N]):
                 # mistake is usually a typo'd Enum member.
                 unknown = start if start not in self._adj else end
                 raise ValueError(f"unknown space {node_label(unknown)!r}")
+            case _ if self._tree is not None:
+                return self._tree.route(a, b)
             case _:
                 return walk_back(breadth_first_parents())
 
     def path(self, a: N, b: N) -> Path:
         """Trace a :class:`Path` from space ``a`` to space ``b``."""
-        return Path(a, b, self._route(a, b))
+        route = self._routes.get((a, b))
+        if route is None:
+            route = tuple(self._route(a, b))
+            if self._memoize:
+                self._routes[(a, b)] = route
+        return Path(a, b, list(route))
@@ -29,7 +29,11 @@ unit-testable with no display.
 
 from __future__ import annotations
 
+import bisect
+import collections
 import dataclasses
+import enum
+import math
 import typing
 
 import numpy as np
@@ -220,12 +224,25 @@ class GuiGroup:
     children: typing.List["GuiGroup"] = dataclasses.field(default_factory=list)
 
 
+def _group_title(op: InverseOperations) -> str:
+    """``op``'s imgui group title: its own, or ``"from->to"`` by default."""
+    return op.group_title or (
+        f"{cayleygraph.node_label(op.from_space)}->"
+        f"{cayleygraph.node_label(op.to_space)}"
+    )
+
+
 class Timeline(typing.Generic[N]):
     """Assigns every substep a ``(start, dur)`` slot by walking the
     coordinate_frames
     then the to_ndc operations in order (accumulating ``dwell_before`` + the
     step
-    durations), and answers per-node lifecycle questions."""
+    durations), and answers per-node lifecycle questions.
+
+    Scenes are authored interactively, so an edit need not rebuild it from
+    scratch: after changing the scene, :meth:`rebuild` re-lays only from the
+    first edited placement on.
+    """
 
     def __init__(self, scene: Scene[N]) -> None:
         self.scene = scene
@@ -236,42 +253,85 @@ class Timeline(typing.Generic[N]):
         self.gpu_steps: typing.List[GpuStep] = []
         self._slot: typing.Dict[int, typing.Tuple[float, float]] = {}
         self._window: typing.Dict[N, typing.Tuple[float, float]] = {}
-
+        # per laid-out placement: its space, where its substeps begin in
+        # ``steps`` and the time before its dwell -- where a rebuild resumes
+        self._marks: typing.List[typing.Tuple[N, int, float]] = []
+        self._placements_end: float = 0.0
+        # the slots indexed for the per-frame queries, so the imgui trees do
+        # a ``bisect`` or a dict lookup instead of rescanning every step.
+        # Every placement substep lasts ``step_duration`` and they are laid
+        # out in order, so ``_starts`` is sorted and the steps live at
+        # ``time`` are exactly those starting in ``(time - step_duration,
+        # time]``.
+        self._starts: typing.List[float] = []
+        self._steps_by_space: typing.Dict[N, typing.List[TimedStep]] = {}
+        self.rebuild()
+
+    def rebuild(self, first_placement: int = 0) -> float:
+        """Re-lay the timeline after its scene was edited; returns the time
+        from which slots may have moved (every slot ending by then is kept).
+
+        Every placement before ``first_placement`` is kept as laid out; from
+        there on the placements are laid out again, and then the to_ndc
+        operations, which follow them.  So an edit to ``coordinate_frames[i]``
+        (its dwell, its edge's steps, or a frame inserted or removed there)
+        is ``rebuild(i)``; an edit only to ``to_ndc`` or ``end_dwell`` is
+        ``rebuild(len(scene.coordinate_frames))``; a new ``step_duration``
+        moves everything, ``rebuild()``.  Routes come from the graph's memo.
+        """
+        kept: int = max(0, min(first_placement, len(self._marks)))
+        if kept < len(self._marks):
+            _space, first_step, t = self._marks[kept]
+        else:
+            first_step, t = len(self.steps), self._placements_end
+        for space, _first, _t in self._marks[kept:]:
+            self._window.pop(space, None)
+            self._steps_by_space.pop(space, None)
+        for ts in self.steps[first_step:]:
+            self._slot.pop(id(ts.step), None)
+        del self._marks[kept:]
+        del self.steps[first_step:]
+        del self._starts[first_step:]
+
+        scene = self.scene
         dur = scene.step_duration
-        t = 0.0
 
         # 1) object-placement tree (forward edges, visit order)
-        for placement in scene.coordinate_frames:
+        for placement in scene.coordinate_frames[kept:]:
+            self._marks.append((placement.space, len(self.steps), t))
             t += placement.dwell_before
             ((edge_obj, _fwd),) = scene.graph.path(
                 placement.space, placement.parent
             ).route
             first = t
+            timed: typing.List[TimedStep] = []
             for s in edge_obj.steps:
-                self.steps.append(
-                    TimedStep(s.label, s, t, dur, placement.space)
-                )
+                timed.append(TimedStep(s.label, s, t, dur, placement.space))
                 self._slot[id(s)] = (t, dur)
                 t += dur
+            self.steps.extend(timed)
+            self._starts.extend(ts.start for ts in timed)
+            self._steps_by_space[placement.space] = timed
             self._window[placement.space] = (first, t)
+        self._placements_end = t
+        resumed: float = self._marks[kept][2] if kept < len(self._marks) else t
 
         # 2) toward-NDC operations (CPU inverse, then GPU squash/ortho)
+        self.inverse_tracks = []
+        self.gpu_steps = []
         for op in scene.to_ndc:
             t += op.dwell_before
             if isinstance(op, InverseOperations):
-                title = op.group_title or (
-                    f"{cayleygraph.node_label(op.from_space)}->"
-                    f"{cayleygraph.node_label(op.to_space)}"
-                )
+                title = _group_title(op)
                 for edge, forward in scene.graph.path(
                     op.from_space, op.to_space
                 ).route:
-                    timed = []
+                    track = []
                     for s in edge.steps:
-                        timed.append((s, t, dur))
+                        track.append((s, t, dur))
                         t += dur
                     self.inverse_tracks.append(
-                        InverseOpsTrack(edge, forward, timed, title)
+                        InverseOpsTrack(edge, forward, track, title)
                     )
             else:  # NonInvertibleTransformation
                 for label in op.step_labels:
@@ -282,6 +342,36 @@ class Timeline(typing.Generic[N]):
 
         t += scene.end_dwell
         self.duration = t
+        # the first track of each title, as the old linear scan found it
+        self._track_by_title: typing.Dict[str, InverseOpsTrack] = {}
+        for tr in self.inverse_tracks:
+            self._track_by_title.setdefault(tr.group_title, tr)
+        self._gpu_steps_by_title: typing.Dict[str, typing.List[GpuStep]] = {}
+        for g in self.gpu_steps:
+            self._gpu_steps_by_title.setdefault(g.group_title, []).append(g)
+        return resumed
+
+    def steps_for(self, space: N) -> typing.List[TimedStep]:
+        """The placement substeps of ``space``'s edge, in timeline order."""
+        return self._steps_by_space.get(space, [])
+
+    def track_for(self, title: str) -> typing.Optional[InverseOpsTrack]:
+        """The (first) inverse-operations track with this group title."""
+        return self._track_by_title.get(title)
+
+    def gpu_steps_for(self, title: str) -> typing.List[GpuStep]:
+        """The GPU substeps of the group with this title, in timeline order."""
+        return self._gpu_steps_by_title.get(title, [])
+
+    def active_step(self, time: float) -> typing.Optional[TimedStep]:
+        """The placement substep animating at ``time`` (the first, should
+        several), found by bisecting the sorted start times."""
+        first: int = bisect.bisect_right(
+            self._starts, time - self.scene.step_duration
+        )
+        if first < len(self.steps) and self._starts[first] <= time:
+            return self.steps[first]
+        return None
 
     def slot(self, step: cayleygraph.Step) -> typing.Tuple[float, float]:
         """``(start, dur)`` of a placement substep; ``(0, 0)`` (fully applied)
@@ -304,8 +394,87 @@ class Timeline(typing.Generic[N]):
         return time >= self.built_time(space)
 
 
+@dataclasses.dataclass
+class _SaturatedRun:
+    """Consecutive substeps of one edge whose local ``t`` is saturated -- each
+    either not started (0.0) or fully applied (1.0) -- composed once.
+
+    Valid while the substeps still hold the same ``fns`` at the same ``ts``;
+    :class:`CameraControls` swaps a Step's ``fn`` for a new object, which is
+    how an edit invalidates the run.  The 4x4 and the inverse are realized on
+    first use.
+    """
+
+    fns: typing.Tuple[InvertibleFunction, ...]
+    ts: typing.Tuple[float, ...]
+    fn: InvertibleFunction
+    _inverse: typing.Optional[InvertibleFunction] = None
+    _matrix: typing.Optional[np.ndarray] = None
+
+    def matches(
+        self,
+        fns: typing.Sequence[InvertibleFunction],
+        ts: typing.Sequence[float],
+    ) -> bool:
+        return tuple(ts) == self.ts and all(
+            a is b for a, b in zip(fns, self.fns, strict=True)
+        )
+
+    def inverse(self) -> InvertibleFunction:
+        if self._inverse is None:
+            self._inverse = inverse(self.fn)
+        return self._inverse
+
+    def matrix(self) -> np.ndarray:
+        if self._matrix is None:
+            # from the Steps' own functions, which stay cached, rather than
+            # the fn.at(0 / 1) objects composed into ``fn``
+            matrix: np.ndarray = np.identity(4)
+            for step_fn, t in zip(self.fns, self.ts, strict=True):
+                if t == 1.0:
+                    matrix = matrix @ _realize(step_fn).matrix
+                elif t != 0.0:
+                    raise ValueError(f"matrix: substep not saturated, t={t}")
+            self._matrix = matrix
+        return self._matrix
+
+
+@dataclasses.dataclass
+class _LiveStep:
+    """The one substep of an edge that is animating: ``step_fn`` at ``t``.
+
+    ``matrix`` comes from ``step_fn``'s cached parameters, so a frame makes
+    no ``step_fn.at(t)`` unless the function itself is asked for."""
+
+    step_fn: InvertibleFunction
+    t: float
+
+    @property
+    def fn(self) -> InvertibleFunction:
+        return self.step_fn.at(self.t)
+
+    def matrix(self) -> np.ndarray:
+        return _realize(self.step_fn).matrices_at(np.array([self.t]))[0]
+
+
+#: each substep's ``(start, dur)`` on the timeline, in edge order
+type _Slots = typing.Tuple[typing.Tuple[float, float], ...]
+
+#: one piece of a live edge: a cached saturated run, or the single substep
+#: that is animating right now
+type _EdgePart = _SaturatedRun | _LiveStep
+
+
 class Animation(typing.Generic[N]):
-    """Evaluates a :class:`Scene`/:class:`Timeline` at a given frame time."""
+    """Evaluates a :class:`Scene`/:class:`Timeline` at a given frame time.
+
+    At almost any moment every substep but one is saturated (not started, or
+    fully applied), so each edge is evaluated as cached saturated runs
+    around at most one live ``fn.at(t)``: per frame only the animating
+    substep is re-evaluated.  ``transform_matrix`` /
+    ``inverse_transform_matrix`` go one further and multiply the runs' cached
+    4x4s, for a GL shell that wants matrices anyway.
+    """
 
     def __init__(
         self,
@@ -314,6 +483,88 @@ class Animation(typing.Generic[N]):
     ) -> None:
         self.scene = scene
         self.timeline = timeline or Timeline(scene)
+        # (id(edge), the substeps' slots, index of the run's first substep) ->
+        # its cached run.  The slots tell the camera edge's placement apart
+        # from its world->camera inverse track; the edges live as long as the
+        # scene's graph, so their ids stay put.
+        self._runs: typing.Dict[
+            typing.Tuple[int, _Slots, int], _SaturatedRun
+        ] = {}
+
+    def rebuild(self, first_placement: int = 0) -> None:
+        """:meth:`Timeline.rebuild` after an edit to the scene, dropping only
+        the cached runs whose slots it may have moved; the runs of the kept
+        placements stay composed."""
+        resumed: float = self.timeline.rebuild(first_placement)
+        self._runs = {
+            key: run
+            for key, run in self._runs.items()
+            if all(start + dur <= resumed for start, dur in key[1])
+        }
+
+    def _edge_parts(
+        self,
+        edge: cayleygraph.Edge,
+        slots: _Slots,
+        time: float,
+    ) -> typing.List[_EdgePart]:
+        """``edge``'s substeps at ``time`` (in edge order, so ``compose``-ready)
+        with every maximal saturated run replaced by its cached composition.
+        ``slots`` is each substep's ``(start, dur)``."""
+        ts = [interp(time, start, dur) for start, dur in slots]
+        parts: typing.List[_EdgePart] = []
+        first: int = 0
+        while first < len(ts):
+            if 0.0 < ts[first] < 1.0:
+                parts.append(_LiveStep(edge.steps[first].fn, ts[first]))
+                first += 1
+                continue
+            stop: int = first
+            while stop < len(ts) and ts[stop] in (0.0, 1.0):
+                stop += 1
+            fns = [step.fn for step in edge.steps[first:stop]]
+            key = (id(edge), slots, first)
+            run = self._runs.get(key)
+            if run is None or not run.matches(fns, ts[first:stop]):
+                run = _SaturatedRun(
+                    tuple(fns),
+                    tuple(ts[first:stop]),
+                    compose([fn.at(t) for fn, t in zip(fns, ts[first:stop])]),
+                )
+                self._runs[key] = run
+            parts.append(run)
+            first = stop
+        return parts
+
+    def _live_edge(
+        self,
+        edge: cayleygraph.Edge,
+        forward: bool,
+        slots: _Slots,
+        time: float,
+    ) -> InvertibleFunction:
+        parts = self._edge_parts(edge, slots, time)
+        match parts:
+            case []:
+                return identity()
+            case [_SaturatedRun() as run]:
+                return run.fn if forward else run.inverse()
+            case _:
+                live = compose([p.fn for p in parts])
+                return live if forward else inverse(live)
+
+    def _live_edge_matrix(
+        self,
+        edge: cayleygraph.Edge,
+        forward: bool,
+        slots: _Slots,
+        time: float,
+    ) -> np.ndarray:
+        matrix: np.ndarray = np.identity(4)
+        for p in self._edge_parts(edge, slots, time):
+            # compose's first function is outermost, so its matrix is leftmost
+            matrix = matrix @ p.matrix()
+        return matrix if forward else np.linalg.inv(matrix)
 
     # --- object placement ---------------------------------------------------
 
@@ -324,19 +575,38 @@ class Animation(typing.Generic[N]):
         child rides on its already-placed ancestors (theirs read ``at(1.0)``).
         """
         route = self.scene.graph.path(space, self.scene.root).route
-        edge_fns: typing.List[InvertibleFunction] = []
-        for edge, forward in route:
-            live = compose(
-                [
-                    s.fn.at(interp(time, *self.timeline.slot(s)))
-                    for s in edge.steps
-                ]
+        edge_fns: typing.List[InvertibleFunction] = [
+            self._live_edge(
+                edge,
+                forward,
+                tuple(self.timeline.slot(s) for s in edge.steps),
+                time,
             )
-            edge_fns.append(live if forward else inverse(live))
+            for edge, forward in route
+        ]
         if not edge_fns:
             return identity()
         return compose(list(reversed(edge_fns)))
 
+    def transform_matrix(self, space: N, time: float) -> np.ndarray:
+        """``to_matrix(self.transform(space, time))``, multiplied together from
+        the cached per-run 4x4s instead of probing the whole composition."""
+        matrix: np.ndarray = np.identity(4)
+        for edge, forward in self.scene.graph.path(
+            space, self.scene.root
+        ).route:
+            # the src-incident edge is innermost, so its matrix is rightmost
+            matrix = (
+                self._live_edge_matrix(
+                    edge,
+                    forward,
+                    tuple(self.timeline.slot(s) for s in edge.steps),
+                    time,
+                )
+                @ matrix
+            )
+        return matrix
+
     def axis_visible(self, space: N, time: float) -> bool:
         return self.timeline.axis_visible(space, time)
 
@@ -353,7 +623,33 @@ class Animation(typing.Generic[N]):
         if not tracks:
             return identity()
         # first-declared track innermost -> reverse for compose (like edges)
-        return compose([tr.live(time) for tr in reversed(tracks)])
+        return compose(
+            [
+                self._live_edge(
+                    tr.edge,
+                    tr.forward,
+                    tuple((start, dur) for _s, start, dur in tr.timed),
+                    time,
+                )
+                for tr in reversed(tracks)
+            ]
+        )
+
+    def inverse_transform_matrix(self, time: float) -> np.ndarray:
+        """``to_matrix(self.inverse_transform(time))`` from the cached per-run
+        4x4s."""
+        matrix: np.ndarray = np.identity(4)
+        for tr in self.timeline.inverse_tracks:
+            matrix = (
+                self._live_edge_matrix(
+                    tr.edge,
+                    tr.forward,
+                    tuple((start, dur) for _s, start, dur in tr.timed),
+                    time,
+                )
+                @ matrix
+            )
+        return matrix
 
     def gpu_progress(
         self, time: float
@@ -371,10 +667,8 @@ class Animation(typing.Generic[N]):
     def active_label(self, time: float) -> typing.Optional[str]:
         """Label of the placement substep currently animating (imgui
         highlight)."""
-        for ts in self.timeline.steps:
-            if ts.start <= time < ts.start + ts.dur:
-                return ts.label
-        return None
+        active = self.timeline.active_step(time)
+        return active.label if active is not None else None
 
     def _is_active(self, start: float, time: float) -> bool:
         return start <= time < start + self.scene.step_duration
@@ -388,8 +682,7 @@ class Animation(typing.Generic[N]):
         for placement in self.scene.coordinate_frames:
             buttons = [
                 GuiButton(ts.label, ts.start, self._is_active(ts.start, time))
-                for ts in self.timeline.steps
-                if ts.space == placement.space
+                for ts in self.timeline.steps_for(placement.space)
             ]
             g = GuiGroup(
                 f"{cayleygraph.node_label(placement.space)}->"
@@ -422,14 +715,11 @@ class Animation(typing.Generic[N]):
                 ]
                 out.append(GuiGroup(track.group_title, buttons))
             else:  # NonInvertibleTransformation
-                steps = [
-                    g
-                    for g in self.timeline.gpu_steps
-                    if g.group_title == op.group_title
-                ]
                 buttons = [
                     GuiButton(g.label, g.start, self._is_active(g.start, time))
-                    for g in reversed(steps)
+                    for g in reversed(
+                        self.timeline.gpu_steps_for(op.group_title)
+                    )
                 ]
                 out.append(GuiGroup(op.group_title, buttons))
         return out
@@ -437,17 +727,266 @@ class Animation(typing.Generic[N]):
     def _track_for(
         self, op: InverseOperations
     ) -> typing.Optional[InverseOpsTrack]:
-        title = op.group_title or (
-            f"{cayleygraph.node_label(op.from_space)}->"
-            f"{cayleygraph.node_label(op.to_space)}"
+        return self.timeline.track_for(_group_title(op))
+
+
+def _probe(f: InvertibleFunction) -> np.ndarray:
+    """The 4x4 of an affine ``f`` by evaluating it on the origin and the three
+    basis vectors -- works for any affine function, however it was built."""
+    o = f(Vector3(0.0, 0.0, 0.0))
+    cx = f(Vector3(1.0, 0.0, 0.0)) - o
+    cy = f(Vector3(0.0, 1.0, 0.0)) - o
+    cz = f(Vector3(0.0, 0.0, 1.0)) - o
+    # gacalc coefficients can be sympy expressions (magnitude() uses sympy.sqrt,
+    # so rotor-based rotations yield sympy-typed components). Force float64
+    # here: otherwise np.array infers dtype=object and downstream np.linalg.inv
+    # / GL upload fail with a cast error. This boundary cast stays even once
+    # gacalc returns plain numbers for numeric input -- numpy/GL want float64
+    # regardless.
+    return np.array(
+        [
+            [cx.coeff_e_1, cy.coeff_e_1, cz.coeff_e_1, o.coeff_e_1],
+            [cx.coeff_e_2, cy.coeff_e_2, cz.coeff_e_2, o.coeff_e_2],
+            [cx.coeff_e_3, cy.coeff_e_3, cz.coeff_e_3, o.coeff_e_3],
+            [0.0, 0.0, 0.0, 1.0],
+        ],
+        dtype=float,
+    )
+
+
+def _components(f: InvertibleFunction) -> typing.Sequence[InvertibleFunction]:
+    """The functions ``compose`` kept ``f`` as (first outermost), or ``()``
+    for a primitive -- a translate, a rotor, a scale."""
+    return getattr(f, "components", None) or ()
+
+
+class _LeafKind(enum.Enum):
+    """Which primitive a leaf function is, by its parameters."""
+
+    translation = enum.auto()  #: ``offset``; at ``t``, ``offset * t``
+    rotation = enum.auto()  #: ``angle`` about ``axis``; at ``t``, ``angle * t``
+    scale = enum.auto()  #: per-axis ``factors``; at ``t``, ``1 + (f - 1) * t``
+    other = enum.auto()  #: none of those -- probed, and probed at each ``t``
+
+
+#: where a closed form for ``f.at(t)`` is checked against ``f.at`` itself,
+#: the first time one is asked for (not 0.5: an nlerp and a slerp rotor
+#: agree at the midpoint)
+_CHECK_TIMES: np.ndarray = np.array([0.3, 0.8])
+
+
+def _probed_at(f: InvertibleFunction, ts: np.ndarray) -> np.ndarray:
+    """``(T, 4, 4)``: ``f.at(t)`` probed for each ``t``."""
+    return np.array([_probe(f.at(float(t))) for t in ts])
+
+
+@dataclasses.dataclass
+class _Primitive:
+    """A leaf function as its parameters: a translate's offset, a rotor's
+    axis (the dual of its unit bivector) and angle, a scale's factors.  Its
+    4x4, and the 4x4 of its ``at(t)`` for any ``t``, are built from them;
+    an ``other`` leaf is probed instead."""
+
+    kind: _LeafKind
+    fn: InvertibleFunction
+    #: ``fn``'s 4x4, read-only
+    matrix: np.ndarray
+    offset: np.ndarray = dataclasses.field(default_factory=lambda: np.zeros(3))
+    axis: np.ndarray = dataclasses.field(default_factory=lambda: np.zeros(3))
+    angle: float = 0.0
+    factors: np.ndarray = dataclasses.field(default_factory=lambda: np.ones(3))
+    # whether fn.at follows the closed form of ``kind``; None until the
+    # first matrices_at checks it
+    _closed_form_at: typing.Optional[bool] = dataclasses.field(
+        init=False, default=None, repr=False
+    )
+
+    def matrices_at(self, ts: np.ndarray) -> np.ndarray:
+        """``(T, 4, 4)``: the 4x4 of ``fn.at(t)`` for each ``t``.  The first
+        call checks the closed form against ``fn.at`` at ``_CHECK_TIMES``; a
+        leaf that breaks it -- a turn past half a turn, which the probe read
+        the short way round -- is probed at each ``t`` from then on."""
+        if self._closed_form_at is None:
+            self._closed_form_at = self.kind is not _LeafKind.other and bool(
+                np.allclose(
+                    self._closed_form(_CHECK_TIMES),
+                    _probed_at(self.fn, _CHECK_TIMES),
+                )
+            )
+        if not self._closed_form_at:
+            return _probed_at(self.fn, ts)
+        return self._closed_form(ts)
+
+    def _closed_form(self, ts: np.ndarray) -> np.ndarray:
+        matrices: np.ndarray = np.tile(np.identity(4), (len(ts), 1, 1))
+        match self.kind:
+            case _LeafKind.translation:
+                matrices[:, :3, 3] = ts[:, np.newaxis] * self.offset
+            case _LeafKind.rotation:
+                matrices[:, :3, :3] = _rotation_matrices(
+                    self.axis, self.angle, ts
+                )
+            case _LeafKind.scale:
+                diagonal = 1.0 + (self.factors - 1.0) * ts[:, np.newaxis]
+                matrices[:, [0, 1, 2], [0, 1, 2]] = diagonal
+            case _LeafKind.other:
+                matrices = _probed_at(self.fn, ts)
+            case _:
+                raise ValueError(f"_closed_form: unhandled kind {self.kind}")
+        return matrices
+
+
+def _rotation_matrices(
+    axis: np.ndarray, angle: float, ts: np.ndarray
+) -> np.ndarray:
+    """``(T, 3, 3)`` rotations by ``t * angle`` about the unit ``axis``
+    (Rodrigues' formula, vectorized over ``ts``)."""
+    k = np.array(
+        [
+            [0.0, -axis[2], axis[1]],
+            [axis[2], 0.0, -axis[0]],
+            [-axis[1], axis[0], 0.0],
+        ]
+    )
+    angles: np.ndarray = (ts * angle)[:, np.newaxis, np.newaxis]
+    return (
+        np.identity(3) + np.sin(angles) * k + (1.0 - np.cos(angles)) * (k @ k)
+    )
+
+
+def _read_primitive(f: InvertibleFunction) -> _Primitive:
+    """Recognize the leaf ``f`` as a translate, rotor or scale, and read its
+    parameters.  gacalc's primitives expose no accessors for them, so they
+    are read off ``f``'s image of the origin and the basis -- one probe, and
+    no ``f.at``: the ``at(t)`` law is checked only once one is asked for."""
+    probed: np.ndarray = _probe(f)
+    linear: np.ndarray = probed[:3, :3]
+    offset: np.ndarray = probed[:3, 3]
+    primitive: _Primitive
+    if np.allclose(linear, np.identity(3)):
+        primitive = _Primitive(
+            _LeafKind.translation, f, probed, offset=offset.copy()
         )
-        for tr in self.timeline.inverse_tracks:
-            if tr.group_title == title:
-                return tr
-        return None
+    elif not np.allclose(offset, 0.0):
+        primitive = _Primitive(_LeafKind.other, f, probed)
+    elif np.allclose(linear, np.diag(np.diag(linear))):
+        primitive = _Primitive(
+            _LeafKind.scale, f, probed, factors=np.diag(linear).copy()
+        )
+    elif np.allclose(linear @ linear.T, np.identity(3)) and np.isclose(
+        np.linalg.det(linear), 1.0
+    ):
+        angle: float = math.acos(
+            min(1.0, max(-1.0, (float(np.trace(linear)) - 1.0) / 2.0))
+        )
+        if math.isclose(math.sin(angle), 0.0, abs_tol=1e-9):
+            # a half turn: the axis is the column of (R + I) / 2 = n n^T
+            # with the largest diagonal entry
+            half: np.ndarray = (linear + np.identity(3)) / 2.0
+            axis: np.ndarray = half[:, int(np.argmax(np.diag(half)))]
+        else:
+            skew: np.ndarray = (linear - linear.T) / 2.0
+            axis = np.array([skew[2, 1], skew[0, 2], skew[1, 0]])
+        primitive = _Primitive(
+            _LeafKind.rotation,
+            f,
+            probed,
+            axis=axis / np.linalg.norm(axis),
+            angle=angle,
+        )
+    else:
+        primitive = _Primitive(_LeafKind.other, f, probed)
+    primitive.matrix.flags.writeable = False
+    return primitive
 
 
-def to_matrix(f: InvertibleFunction) -> np.ndarray:
+@dataclasses.dataclass
+class _Realization:
+    """How a function, and its ``at(t)``, are realized as 4x4s: the product
+    of its leaves' matrices -- each read once as a :class:`_Primitive`."""
+
+    fn: InvertibleFunction
+    leaves: typing.Tuple[_Primitive, ...]
+    #: ``fn``'s 4x4, read-only
+    matrix: np.ndarray
+    #: whether ``fn.at(t)`` is the product of the leaves' ``at(t)``; when
+    #: not (a staggered composition, say), each ``fn.at(t)`` is probed.
+    #: ``None`` until the first ``matrices_at`` checks it against ``fn.at``
+    leafwise_at: typing.Optional[bool] = None
+
+    def matrices_at(self, ts: np.ndarray) -> np.ndarray:
+        """``(T, 4, 4)``: the 4x4 of ``fn.at(t)`` for each ``t``."""
+        if self.leafwise_at is None:
+            self.leafwise_at = bool(
+                np.allclose(
+                    self._leafwise(_CHECK_TIMES),
+                    _probed_at(self.fn, _CHECK_TIMES),
+                )
+            )
+        if not self.leafwise_at:
+            return _probed_at(self.fn, ts)
+        return self._leafwise(ts)
+
+    def _leafwise(self, ts: np.ndarray) -> np.ndarray:
+        matrices: np.ndarray = np.tile(np.identity(4), (len(ts), 1, 1))
+        for leaf in self.leaves:
+            # compose's first function is outermost, so its matrix is leftmost
+            np.matmul(matrices, leaf.matrices_at(ts), out=matrices)
+        return matrices
+
+
+_REALIZATION_CACHE_SIZE: int = 1024
+
+# id(f) -> (f, its realization), least recently used first.  Holding ``f``
+# keeps it alive, so its id cannot be recycled while the entry is cached (as
+# in mathutils.compile_affine).  The animation realizes its Steps' own
+# functions, which live as long as the scene, so a frame adds no entries.
+_realizations: collections.OrderedDict[
+    int, typing.Tuple[InvertibleFunction, _Realization]
+] = collections.OrderedDict()
+
+
+def _cached_realization(
+    f: InvertibleFunction,
+) -> typing.Optional[_Realization]:
+    """``f``'s :class:`_Realization` if one is cached, else ``None``."""
+    key: int = id(f)
+    cached = _realizations.get(key)
+    if cached is None or cached[0] is not f:
+        return None
+    _realizations.move_to_end(key)
+    return cached[1]
+
+
+def _realize(f: InvertibleFunction) -> _Realization:
+    """``f``'s :class:`_Realization`, worked out once per function object."""
+    cached: typing.Optional[_Realization] = _cached_realization(f)
+    if cached is not None:
+        return cached
+    parts = _components(f)
+    realization: _Realization
+    if not parts:
+        primitive: _Primitive = _read_primitive(f)
+        # a leaf's at(t) is its own: nothing to check beyond the leaf's
+        realization = _Realization(f, (primitive,), primitive.matrix, True)
+    else:
+        leaves = tuple(leaf for part in parts for leaf in _realize(part).leaves)
+        matrix: np.ndarray = np.identity(4)
+        for leaf in leaves:
+            matrix = matrix @ leaf.matrix
+        matrix.flags.writeable = False
+        realization = _Realization(f, leaves, matrix)
+    key: int = id(f)
+    _realizations[key] = (f, realization)
+    if len(_realizations) > _REALIZATION_CACHE_SIZE:
+        _realizations.popitem(last=False)
+    return realization
+
+
+def to_matrix(
+    f: InvertibleFunction,
+    times: typing.Optional[typing.Sequence[float] | np.ndarray] = None,
+) -> np.ndarray:
     """Realize an **affine** ``InvertibleFunction`` on ``Vector3`` as a 4x4
     (row-major, ``M @ [x, y, z, 1]``) for upload as a GL model matrix.
 
@@ -455,6 +994,11 @@ def to_matrix(f: InvertibleFunction) -> np.ndarray:
     ``to_matrix(f) @ [p, 1] == f(p)`` for any affine ``f``.  Not valid for the
     projective squash (which stays a shader; see decision #4).
 
+    Without ``times``, a function met before -- an animation's Step
+    functions -- reuses its cached matrix, and any other is probed (four
+    evaluations) and not kept, so a path rebuilt every frame costs no more
+    than that and fills no cache.
+
     A translation becomes a 4x4 whose last column is the offset:
 
     >>> import numpy as np
@@ -469,23 +1013,20 @@ def to_matrix(f: InvertibleFunction) -> np.ndarray:
 
     >>> (m @ np.array([1.0, 2.0, 3.0, 1.0])).tolist()
     [4.0, 6.0, 8.0, 1.0]
+
+    Given ``times``, the result is ``(T, 4, 4)``: ``to_matrix(f.at(t))`` for
+    each ``t``.  ``f`` is then realized as the product of its primitives'
+    matrices, built from their parameters -- a translate's offset, a rotor's
+    axis and angle, a scale's factors -- read once per function object and
+    cached.  Translations, rotations and scales are interpolated from their
+    parameters and batched; anything else falls back to probing each
+    ``f.at(t)``:
+
+    >>> to_matrix(translate(Vector3(2.0, 0.0, 0.0)), [0.0, 0.5, 1.0])[:, 0, 3]
+    array([0., 1., 2.])
     """
-    o = f(Vector3(0.0, 0.0, 0.0))
-    cx = f(Vector3(1.0, 0.0, 0.0)) - o
-    cy = f(Vector3(0.0, 1.0, 0.0)) - o
-    cz = f(Vector3(0.0, 0.0, 1.0)) - o
-    # gacalc coefficients can be sympy expressions (magnitude() uses sympy.sqrt,
-    # so rotor-based rotations yield sympy-typed components). Force float64
-    # here: otherwise np.array infers dtype=object and downstream np.linalg.inv
-    # / GL upload fail with a cast error. This boundary cast stays even once
-    # gacalc returns plain numbers for numeric input -- numpy/GL want float64
-    # regardless.
-    return np.array(
-        [
-            [cx.coeff_e_1, cy.coeff_e_1, cz.coeff_e_1, o.coeff_e_1],
-            [cx.coeff_e_2, cy.coeff_e_2, cz.coeff_e_2, o.coeff_e_2],
-            [cx.coeff_e_3, cy.coeff_e_3, cz.coeff_e_3, o.coeff_e_3],
-            [0.0, 0.0, 0.0, 1.0],
-        ],
-        dtype=float,
-    )
+    if times is None:
+        cached: typing.Optional[_Realization] = _cached_realization(f)
+        # a copy: the cached matrices are shared and read-only
+        return _probe(f) if cached is None else np.array(cached.matrix)
+    return _realize(f).matrices_at(np.asarray(times, dtype=float))
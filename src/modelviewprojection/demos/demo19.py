@@ -28,6 +28,7 @@ from numpy.typing import NDArray
 
 import modelviewprojection.util.colorutils as colorutils
 from modelviewprojection.util.clipping import draw_in_square_viewport
+from modelviewprojection.util.framepacer import FramePacer
 from modelviewprojection.util.windowing import on_key
 
 if not glfw.init():
@@ -159,15 +160,12 @@ square_vertices: NDArray = np.array(
 
 TARGET_FRAMERATE: int = 60
 
-time_at_beginning_of_previous_frame: float = glfw.get_time()
+# sleeps out the rest of each frame rather than spinning on glfw.get_time(),
+# and times the frames (set $MVP_FRAME_STATS to a path to get the numbers)
+frame_pacer = FramePacer(target_framerate=TARGET_FRAMERATE)
 
 while not glfw.window_should_close(window):
-    while (
-        glfw.get_time()
-        < time_at_beginning_of_previous_frame + 1.0 / TARGET_FRAMERATE
-    ):
-        pass
-    time_at_beginning_of_previous_frame = glfw.get_time()
+    frame_pacer.begin_frame()
 
     glfw.poll_events()
 
@@ -192,6 +190,7 @@ while not glfw.window_should_close(window):
             camera.rot_x -= 3 * axes_list[0][3] * 0.01
         if math.fabs(axes_list[0][2]) > 0.10:
             camera.rot_y -= axes_list[0][2] * 0.01
+    frame_pacer.end_cpu()
 
     # just like putting the identity function on the lambda stack
     # doc-region-begin load identity
@@ -305,7 +304,10 @@ while not glfw.window_should_close(window):
         )
     GL.glEnd()
     # doc-region-end draw paddle 2
+    frame_pacer.end_render()
     glfw.swap_buffers(window)
+    frame_pacer.end_frame()
 
 
+frame_pacer.write_stats()
 glfw.terminate()
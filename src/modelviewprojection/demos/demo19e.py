@@ -38,6 +38,7 @@ import OpenGL.GL as GL
 import OpenGL.GLU as GLU
 
 from modelviewprojection.util.cameracontrols import walk_around_camera
+from modelviewprojection.util.framepacer import FramePacer
 from modelviewprojection.util.windowing import on_key
 
 if not glfw.init():
@@ -157,15 +158,12 @@ def handle_inputs() -> None:
 y_rot: float = 0.0
 
 TARGET_FRAMERATE: int = 60
-time_at_beginning_of_previous_frame: float = glfw.get_time()
+# sleeps out the rest of each frame rather than spinning on glfw.get_time(),
+# and times the frames (set $MVP_FRAME_STATS to a path to get the numbers)
+frame_pacer = FramePacer(target_framerate=TARGET_FRAMERATE)
 
 while not glfw.window_should_close(window):
-    while (
-        glfw.get_time()
-        < time_at_beginning_of_previous_frame + 1.0 / TARGET_FRAMERATE
-    ):
-        pass
-    time_at_beginning_of_previous_frame = glfw.get_time()
+    frame_pacer.begin_frame()
 
     glfw.poll_events()
 
@@ -177,6 +175,7 @@ while not glfw.window_should_close(window):
     handle_inputs()
 
     y_rot += 0.5
+    frame_pacer.end_cpu()
 
     GL.glMatrixMode(GL.GL_PROJECTION)
     GL.glLoadIdentity()
@@ -230,6 +229,9 @@ while not glfw.window_should_close(window):
 
     GL.glPopMatrix()
 
+    frame_pacer.end_render()
     glfw.swap_buffers(window)
+    frame_pacer.end_frame()
 
+frame_pacer.write_stats()
 glfw.terminate()
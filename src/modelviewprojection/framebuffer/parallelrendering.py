@@ -0,0 +1,336 @@
+# Copyright (c) 2025-2026 William Emerison Six
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+
+"""The software :class:`FrameBuffer`, rasterized by a pool of processes.
+
+Screen tiles never share a pixel, so they can be rasterized independently.
+:class:`ParallelFrameBuffer` keeps its color (and depth) array in
+:mod:`multiprocessing.shared_memory`; each worker process attaches to the
+same blocks once, when the pool starts, and writes its tiles straight into
+them.  Only the triangles binned to a tile travel to a worker -- no pixels
+are ever pickled back -- so when ``draw_triangles`` returns, the parent's
+``_framebuffer`` already holds the picture.  A texture is not pickled into
+every tile's task either: each textured draw puts it in a shared block of
+its own, and the tasks carry only that block's name.
+
+Within a tile the triangles are still drawn in submission order, so the
+output is pixel-identical to the single-process :class:`FrameBuffer`, depth
+test and painter's order included.
+
+Use it as a context manager (or call :meth:`ParallelFrameBuffer.close`): the
+shared blocks and the worker processes outlive the object otherwise.
+
+>>> import numpy as np
+>>> with ParallelFrameBuffer(width=64, height=64, workers=2) as fb:
+...     fb.clear_framebuffer()
+...     fb.draw_triangles(
+...         np.array([[[0.0, 0.0], [63.0, 0.0], [0.0, 63.0]]]),
+...         np.array([[255, 0, 0]]),
+...     )
+>>> int((fb._framebuffer[:, :, 0] == 255).sum())
+2080
+"""
+
+import concurrent.futures
+import dataclasses
+import os
+import typing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from modelviewprojection.framebuffer.softwarerendering import (
+    DEFAULT_TILE_SIZE,
+    DepthFunction,
+    FrameBuffer,
+    _fill_tile,
+    _tile_bins,
+)
+
+# Per-worker-process state, set once by _attach_worker when the pool starts:
+# a plain FrameBuffer whose arrays are views of the parent's shared blocks.
+_worker_framebuffer: typing.Optional[FrameBuffer] = None
+# the worker's handles on those blocks, kept open for the views' lifetime
+_worker_memory: typing.List[shared_memory.SharedMemory] = []
+# the texture of the draw the worker last shaded tiles for: its block's name,
+# the block, and the array viewing it
+_worker_texture: typing.Optional[
+    typing.Tuple[str, shared_memory.SharedMemory, np.ndarray]
+] = None
+
+#: how a texture travels to the workers: its shared block's name, its shape
+#: and its dtype string -- the pixels themselves stay in the block
+SharedArray = typing.Tuple[str, typing.Tuple[int, ...], str]
+
+
+def _attach_worker(
+    width: int,
+    height: int,
+    color_block: str,
+    depth_block: typing.Optional[str],
+) -> None:
+    """Pool initializer: map the parent's shared color / depth blocks."""
+    global _worker_framebuffer
+    framebuffer = FrameBuffer(width=width, height=height)
+    color = shared_memory.SharedMemory(name=color_block)
+    _worker_memory.append(color)
+    framebuffer._framebuffer = np.ndarray(
+        (height, width, 3), dtype=np.uint8, buffer=color.buf
+    )
+    if depth_block is not None:
+        depth = shared_memory.SharedMemory(name=depth_block)
+        _worker_memory.append(depth)
+        framebuffer._depthbuffer = np.ndarray(
+            (height, width), dtype=np.float32, buffer=depth.buf
+        )
+    _worker_framebuffer = framebuffer
+
+
+def _attach_texture(texture: SharedArray) -> np.ndarray:
+    """The worker's view of the draw's shared ``texture`` block, attached on
+    the first of the draw's tiles this worker gets; the previous draw's block
+    is let go then."""
+    global _worker_texture
+    name, shape, dtype = texture
+    if _worker_texture is None or _worker_texture[0] != name:
+        if _worker_texture is not None:
+            _worker_texture[1].close()
+            _worker_texture = None
+        memory = shared_memory.SharedMemory(name=name)
+        _worker_texture = (
+            name,
+            memory,
+            np.ndarray(shape, dtype=np.dtype(dtype), buffer=memory.buf),
+        )
+    return _worker_texture[2]
+
+
+def _fill_shared_tile(
+    origin: typing.Tuple[int, int],
+    tile_size: int,
+    vertices: np.ndarray,
+    boxes: np.ndarray,
+    colors: np.ndarray,
+) -> None:
+    """Worker task: one tile of :meth:`FrameBuffer.draw_triangles`."""
+    assert _worker_framebuffer is not None
+    x0, y0 = origin
+    _fill_tile(
+        _worker_framebuffer._framebuffer[
+            y0 : y0 + tile_size, x0 : x0 + tile_size
+        ],
+        origin,
+        vertices,
+        boxes,
+        colors,
+    )
+
+
+def _shade_shared_tile(
+    origin: typing.Tuple[int, int],
+    tile_size: int,
+    depth_function: DepthFunction,
+    window: np.ndarray,
+    inverse_w: np.ndarray,
+    boxes: np.ndarray,
+    colors: np.ndarray,
+    uvs: typing.Optional[np.ndarray],
+    texture: typing.Optional[SharedArray],
+) -> None:
+    """Worker task: one tile of :meth:`FrameBuffer.draw_triangles_3d`, each
+    triangle's bounding box cut down to the tile."""
+    assert _worker_framebuffer is not None
+    pixels: typing.Optional[np.ndarray] = (
+        None if texture is None else _attach_texture(texture)
+    )
+    _worker_framebuffer.depth_function = depth_function
+    x0, y0 = origin
+    tile: np.ndarray = np.array(
+        [x0, x0 + tile_size - 1, y0, y0 + tile_size - 1]
+    )
+    for index in range(len(window)):
+        box: np.ndarray = np.array(
+            [
+                max(boxes[index, 0], tile[0]),
+                min(boxes[index, 1], tile[1]),
+                max(boxes[index, 2], tile[2]),
+                min(boxes[index, 3], tile[3]),
+            ]
+        )
+        _worker_framebuffer._shade_triangle(
+            window[index],
+            inverse_w[index],
+            box,
+            colors[index],
+            None if uvs is None else uvs[index],
+            pixels,
+        )
+
+
+@dataclasses.dataclass
+class ParallelFrameBuffer(FrameBuffer):
+    """A :class:`FrameBuffer` in shared memory, rasterized by ``workers``
+    processes (``None``: one per CPU, as :class:`ProcessPoolExecutor` picks).
+
+    ``tile_size`` is the tile :meth:`draw_triangles_3d` distributes; the 2D
+    :meth:`draw_triangles` keeps taking its own ``tile_size`` argument.
+    """
+
+    workers: typing.Optional[int] = None
+    tile_size: int = DEFAULT_TILE_SIZE
+    _memory: typing.List[shared_memory.SharedMemory] = dataclasses.field(
+        init=False, default_factory=list, repr=False
+    )
+    _pool: typing.Optional[concurrent.futures.ProcessPoolExecutor] = (
+        dataclasses.field(init=False, default=None, repr=False)
+    )
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._framebuffer = self._share(self._framebuffer)
+        if self._depthbuffer is not None:
+            self._depthbuffer = self._share(self._depthbuffer)
+        self._pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_attach_worker,
+            initargs=(
+                self.width,
+                self.height,
+                self._memory[0].name,
+                self._memory[1].name if len(self._memory) > 1 else None,
+            ),
+        )
+
+    def _share(self, array: np.ndarray) -> np.ndarray:
+        """Move ``array`` into a new shared block; return the view onto it."""
+        memory = shared_memory.SharedMemory(create=True, size=array.nbytes)
+        self._memory.append(memory)
+        shared: np.ndarray = np.ndarray(
+            array.shape, dtype=array.dtype, buffer=memory.buf
+        )
+        shared[...] = array
+        return shared
+
+    def close(self) -> None:
+        """Stop the workers and free the shared blocks.  The pixels are copied
+        out first, so the picture stays readable; drawing raises from here on.
+        """
+        if self._pool is None:
+            return
+        self._pool.shutdown()
+        self._pool = None
+        # a block cannot be closed while a NumPy view still exports it
+        self._framebuffer = self._framebuffer.copy()
+        if self._depthbuffer is not None:
+            self._depthbuffer = self._depthbuffer.copy()
+        for memory in self._memory:
+            memory.close()
+            memory.unlink()
+        self._memory.clear()
+
+    def __enter__(self) -> "ParallelFrameBuffer":
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
+
+    def _run(
+        self,
+        task: typing.Callable[..., None],
+        arguments: typing.List[typing.Tuple[typing.Any, ...]],
+    ) -> None:
+        """Run ``task`` once per argument tuple on the pool, and wait."""
+        if self._pool is None:
+            raise ValueError("ParallelFrameBuffer: used after close()")
+        if not arguments:
+            return
+        # a few chunks per worker: big enough to amortize the pickling, small
+        # enough that a worker stuck on a dense tile does not idle the rest
+        workers: int = self.workers or os.cpu_count() or 1
+        chunksize: int = max(1, len(arguments) // (4 * workers))
+        # consuming the results waits for every tile and re-raises any error
+        for _ in self._pool.map(task, *zip(*arguments), chunksize=chunksize):
+            pass
+
+    def _fill_tiles(
+        self,
+        vertices: np.ndarray,
+        boxes: np.ndarray,
+        colors: np.ndarray,
+        tile_size: int,
+    ) -> None:
+        self._run(
+            _fill_shared_tile,
+            [
+                (
+                    origin,
+                    tile_size,
+                    vertices[binned],
+                    boxes[binned],
+                    colors[binned],
+                )
+                for origin, binned in _tile_bins(boxes, tile_size)
+            ],
+        )
+
+    def _shade_triangles(
+        self,
+        window: np.ndarray,
+        inverse_w: np.ndarray,
+        boxes: np.ndarray,
+        colors: np.ndarray,
+        uvs: typing.Optional[np.ndarray],
+        texture: typing.Optional[np.ndarray],
+    ) -> None:
+        # the texture goes into a block of its own for this draw, like the
+        # framebuffer, so each tile task carries only the block's name
+        memory: typing.Optional[shared_memory.SharedMemory] = None
+        shared: typing.Optional[SharedArray] = None
+        if texture is not None:
+            memory = shared_memory.SharedMemory(
+                create=True, size=max(texture.nbytes, 1)
+            )
+            staged: np.ndarray = np.ndarray(
+                texture.shape, dtype=texture.dtype, buffer=memory.buf
+            )
+            staged[...] = texture
+            del staged  # the block cannot be closed while a view exports it
+            shared = (memory.name, texture.shape, texture.dtype.str)
+        try:
+            self._run(
+                _shade_shared_tile,
+                [
+                    (
+                        origin,
+                        self.tile_size,
+                        self.depth_function,
+                        window[binned],
+                        inverse_w[binned],
+                        boxes[binned],
+                        colors[binned],
+                        None if uvs is None else uvs[binned],
+                        shared,
+                    )
+                    for origin, binned in _tile_bins(boxes, self.tile_size)
+                ],
+            )
+        finally:
+            # workers still mapping it keep their view until their next
+            # textured draw; the name is gone from here on
+            if memory is not None:
+                memory.close()
+                memory.unlink()
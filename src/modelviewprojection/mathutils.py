@@ -32,15 +32,20 @@ carry: angle-based 2D/axis rotations (built on top of gacalc vectors), the
 ``ortho`` / ``perspective`` projections, the plane-geometry helpers
 (``find_normal`` via the geometric-algebra ``wedge`` + ``dual``,
 ``plane_equation``,
-``distance_to_plane``), the 2D orientation predicates, and the
-``FunctionStack`` (the Python analogue of OpenGL's matrix stack).
+``distance_to_plane``), the 2D orientation predicates, the
+``FunctionStack`` (the Python analogue of OpenGL's matrix stack), and
+``compile_affine`` / ``apply_batch`` for pushing whole vertex arrays through
+a composed transform at once.
 """
 
+import collections
 import contextlib
 import dataclasses
 import math
 import typing
 
+import numpy as np
+
 # gacalc pieces used INTERNALLY by the helpers below (not re-exported -- callers
 # import these from gacalc directly).
 from gacalc.base import MultiVectorBase
@@ -53,6 +58,7 @@ from gacalc.transforms import (
     inverse,
     plane_rotation,
     scale_non_uniform,
+    to_matrix,
     translate,
 )
 
@@ -79,6 +85,9 @@ __all__ = [
     "FunctionStack",
     "push_transformation",
     "fn_stack",
+    "CompiledAffine",
+    "compile_affine",
+    "apply_batch",
 ]
 
 
@@ -583,6 +592,11 @@ class FunctionStack(typing.Generic[V]):
     Push transformations as you descend a scene hierarchy, pop as you come back
     up, and ask for the composed function whenever you need to draw.
 
+    Alongside ``stack`` it keeps the composition of every prefix of it, so a
+    push composes once, a pop just drops the top, and asking for the whole
+    composed function -- once per vertex, in the demos -- is free.  Change the
+    stack through ``push`` / ``pop`` / ``clear``.
+
     >>> from gacalc.g3 import Vector3
     >>> from gacalc.transforms import translate
     >>> stack = FunctionStack()
@@ -599,6 +613,14 @@ class FunctionStack(typing.Generic[V]):
     stack: list[InvertibleFunction[V]] = dataclasses.field(
         default_factory=lambda: []
     )
+    # _prefixes[i] is compose(stack[: i + 1])
+    _prefixes: list[InvertibleFunction[V]] = dataclasses.field(
+        default_factory=lambda: [], init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        for o in self.stack:
+            self._prefixes.append(compose([*self._prefixes[-1:], o]))
 
     def push(self, o: InvertibleFunction[V]) -> None:
         # doc-region-end function stack push signature
@@ -611,6 +633,7 @@ class FunctionStack(typing.Generic[V]):
         """
         # doc-region-begin function stack push body
         self.stack.append(o)
+        self._prefixes.append(compose([*self._prefixes[-1:], o]))
 
     def pop(self) -> InvertibleFunction[V]:
         # doc-region-end function stack pop signature
@@ -623,6 +646,7 @@ class FunctionStack(typing.Generic[V]):
         0
         """
         # doc-region-begin function stack pop body
+        self._prefixes.pop()
         return self.stack.pop()
 
     def clear(self) -> None:
@@ -638,6 +662,7 @@ class FunctionStack(typing.Generic[V]):
         """
         # doc-region-begin function stack clear body
         self.stack.clear()
+        self._prefixes.clear()
 
     def modelspace_to_ndc_fn(self) -> InvertibleFunction[V]:
         # doc-region-end function stack compose signature
@@ -660,9 +685,15 @@ class FunctionStack(typing.Generic[V]):
         >>> composed = stack.modelspace_to_ndc_fn()
         >>> [round(float(c), 6) for c in composed(1.0 * Vector3.e_1)]
         [3.0, 0.0, 0.0]
+
+        Nothing is recomposed until the stack changes -- the same function
+        comes back:
+
+        >>> stack.modelspace_to_ndc_fn() is composed
+        True
         """
         # doc-region-begin function stack compose body
-        return compose(self.stack)
+        return self._prefixes[-1] if self._prefixes else compose([])
 
 
 fn_stack = FunctionStack()
@@ -718,3 +749,100 @@ def push_transformation(
         yield fn_stack
     finally:
         fn_stack.pop()
+
+
+@dataclasses.dataclass(frozen=True)
+class CompiledAffine:
+    """An affine ``InvertibleFunction[Vector3]`` realized as 4x4 float64
+    homogeneous matrices (column-vector convention, ``M @ [x, y, z, 1]``), for
+    the function and for its inverse."""
+
+    matrix: np.ndarray
+    inverse: np.ndarray
+
+
+#: How many compiled functions :func:`compile_affine` remembers.
+_COMPILED_CACHE_SIZE: int = 256
+
+# id(fn) -> (fn, compiled), least recently used first.  Holding fn itself
+# keeps it alive, so its id cannot be recycled by another function while the
+# entry is cached.
+_compiled: collections.OrderedDict[
+    int, typing.Tuple[InvertibleFunction[Vector3], CompiledAffine]
+] = collections.OrderedDict()
+
+
+def compile_affine(fn: InvertibleFunction[Vector3]) -> CompiledAffine:
+    """The 4x4 float64 matrices of an affine 3D ``fn`` and of its inverse.
+
+    Evaluating a composed gacalc function costs Python objects and rotor
+    products per call; the matrix does the same work in one NumPy operation.
+    The result is cached per function object (least recently used evicted),
+    so compiling the same ``fn`` every frame probes it only once.  That
+    assumes the function is not changed in place -- replace it instead.
+
+    >>> from gacalc.g3 import Vector3
+    >>> from gacalc.transforms import translate, uniform_scale
+    >>> fn = compose([translate(1.0 * Vector3.e_1), uniform_scale(2.0)])
+    >>> compiled = compile_affine(fn)
+    >>> compiled.matrix[0].tolist()
+    [2.0, 0.0, 0.0, 1.0]
+    >>> compiled.inverse[0].tolist()
+    [0.5, 0.0, 0.0, -0.5]
+    >>> compile_affine(fn) is compiled
+    True
+
+    A function with no matrix -- the perspective divide -- is refused:
+
+    >>> compile_affine(cs_to_ndc_space_fn(0.0 * Vector3.e_1))
+    Traceback (most recent call last):
+        ...
+    ValueError: compile_affine: Perspective is not affine
+    """
+    key: int = id(fn)
+    cached = _compiled.get(key)
+    if cached is not None and cached[0] is fn:
+        _compiled.move_to_end(key)
+        return cached[1]
+    if fn.linearity is Linearity.NONLINEAR:
+        raise ValueError(f"compile_affine: {fn.latex_repr} is not affine")
+    # gacalc coefficients can be sympy expressions; numpy wants float64.
+    matrix: np.ndarray = np.array(to_matrix(fn, Vector3), dtype=np.float64)
+    compiled = CompiledAffine(matrix=matrix, inverse=np.linalg.inv(matrix))
+    _compiled[key] = (fn, compiled)
+    if len(_compiled) > _COMPILED_CACHE_SIZE:
+        _compiled.popitem(last=False)
+    return compiled
+
+
+def apply_batch(
+    fn: InvertibleFunction[Vector3], points: np.ndarray
+) -> np.ndarray:
+    """Apply ``fn`` to every row of an ``(N, 3)`` array of points at once.
+
+    An affine ``fn`` becomes one matrix multiply (via :func:`compile_affine`);
+    anything else, such as :func:`perspective`, falls back to calling ``fn``
+    point by point -- slower, but the same answer.
+
+    >>> from gacalc.g3 import Vector3
+    >>> from gacalc.transforms import translate
+    >>> points = np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 3.0]])
+    >>> apply_batch(translate(1.0 * Vector3.e_1), points).tolist()
+    [[1.0, 0.0, 0.0], [2.0, 2.0, 3.0]]
+    >>> to_ndc = cs_to_ndc_space_fn(0.0 * Vector3.e_1)
+    >>> apply_batch(to_ndc, np.array([[0.0, 0.0, -10.0]])).round(6).tolist()
+    [[0.0, 0.0, 0.980198]]
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise ValueError(
+            f"apply_batch: points must have shape (N, 3), got {points.shape}"
+        )
+    try:
+        matrix: np.ndarray = compile_affine(fn).matrix
+    except ValueError:
+        return np.array(
+            [[float(c) for c in fn(Vector3(*point))] for point in points],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
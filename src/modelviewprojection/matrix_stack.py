@@ -19,6 +19,8 @@
 # SOFTWARE.
 
 import contextlib
+import contextvars
+import dataclasses
 import enum
 import math
 import typing
@@ -34,48 +36,261 @@ class MatrixStack(enum.Enum):
     modelviewprojection = 5
 
 
-__modelStack__: list[np.ndarray] = [
-    np.array(
-        [
-            [1.0, 0.0, 0.0, 0.0],
-            [0.0, 1.0, 0.0, 0.0],
-            [0.0, 0.0, 1.0, 0.0],
-            [0.0, 0.0, 0.0, 1.0],
-        ],
-        dtype=np.float32,
-    )
-]
+#: How many matrices each stored stack holds at most -- the 32 OpenGL
+#: guarantees for ``GL_MAX_MODELVIEW_STACK_DEPTH``.
+MAX_STACK_DEPTH: int = 32
 
-__viewStack__: list[np.ndarray] = [
-    np.array(
-        [
-            [1.0, 0.0, 0.0, 0.0],
-            [0.0, 1.0, 0.0, 0.0],
-            [0.0, 0.0, 1.0, 0.0],
-            [0.0, 0.0, 0.0, 1.0],
-        ],
-        dtype=np.float32,
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """A view of ``array`` that refuses writes, for handing out state that
+    only this module may change (a write would bypass the cache bookkeeping).
+    """
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+@dataclasses.dataclass
+class _Stack:
+    """One stored stack: a preallocated ``(max_depth, 4, 4)`` float32 block,
+    of which the first ``depth`` matrices are live (the top is the last).
+
+    Pushing copies the top into the next slot and popping just lowers
+    ``depth`` -- no arrays are allocated after construction.  ``version``
+    counts changes to the top, so a cached product can tell it is stale.
+    """
+
+    matrix_stack: MatrixStack
+    max_depth: int = MAX_STACK_DEPTH
+    block: np.ndarray = dataclasses.field(init=False, repr=False)
+    depth: int = dataclasses.field(init=False, default=1)
+    version: int = dataclasses.field(init=False, default=0)
+    #: a read-only view of the top matrix -- a plain attribute, moved by
+    #: push and pop, since reading it is the hottest path in the module
+    top: np.ndarray = dataclasses.field(init=False, repr=False)
+    # one read-only view per slot, made once, so reading the top allocates
+    # nothing
+    _tops: typing.List[np.ndarray] = dataclasses.field(init=False, repr=False)
+    # scratch for the in-place kernels below (rotate_*, translate, scale,
+    # multiply), so a transform allocates no temporary 4x4.  One set per stack
+    # -- so per context -- hence never shared between threads.
+    _columns: np.ndarray = dataclasses.field(
+        init=False,
+        repr=False,
+        default_factory=lambda: np.empty((4, 2), np.float32),
+    )
+    _rotation: np.ndarray = dataclasses.field(
+        init=False,
+        repr=False,
+        default_factory=lambda: np.empty((2, 2), np.float32),
+    )
+    # (x, y, z, 1) for translate and scale; only the first three are written
+    _vector: np.ndarray = dataclasses.field(
+        init=False, repr=False, default_factory=lambda: np.ones(4, np.float32)
+    )
+    _column: np.ndarray = dataclasses.field(
+        init=False, repr=False, default_factory=lambda: np.empty(4, np.float32)
+    )
+    _product: np.ndarray = dataclasses.field(
+        init=False,
+        repr=False,
+        default_factory=lambda: np.empty((4, 4), np.float32),
     )
-]
 
-__projectionStack__: list[np.ndarray] = [
-    np.array(
-        [
-            [1.0, 0.0, 0.0, 0.0],
-            [0.0, 1.0, 0.0, 0.0],
-            [0.0, 0.0, 1.0, 0.0],
-            [0.0, 0.0, 0.0, 1.0],
-        ],
-        dtype=np.float32,
+    def __post_init__(self) -> None:
+        self.block = np.tile(
+            np.identity(4, dtype=np.float32), (self.max_depth, 1, 1)
+        )
+        self._tops = [_read_only(slot) for slot in self.block]
+        self.top = self._tops[0]
+
+    def top_for_update(self) -> np.ndarray:
+        """The writable top matrix.  The caller is about to change it, so
+        every product computed from the old value is now stale."""
+        self.version += 1
+        return self.block[self.depth - 1]
+
+    def push(self) -> None:
+        if self.depth == self.max_depth:
+            raise ValueError(
+                f"push_matrix: {self.matrix_stack.name} stack overflow, it "
+                f"holds at most {self.max_depth} matrices"
+            )
+        self.block[self.depth] = self.block[self.depth - 1]
+        self.depth += 1
+        self.version += 1
+        self.top = self._tops[self.depth - 1]
+
+    def pop(self) -> None:
+        if self.depth == 1:
+            raise ValueError(
+                f"pop_matrix: {self.matrix_stack.name} stack underflow, its "
+                f"bottom matrix cannot be popped"
+            )
+        self.depth -= 1
+        self.version += 1
+        self.top = self._tops[self.depth - 1]
+
+    def post_multiply(self, rhs: np.ndarray) -> None:
+        """``top = top @ rhs``, through scratch: matmul cannot write over one
+        of its own inputs."""
+        m: np.ndarray = self.top_for_update()
+        np.matmul(m, rhs, out=self._product)
+        m[...] = self._product
+
+    def rotate_columns(self, first: int, second: int, rads: float) -> None:
+        """Post-multiply the top by a rotation in the plane of axes ``first``
+        and ``second`` (0-based).  Only those two columns of the top change:
+
+            new first  = first * cos + second * sin
+            new second = first * -sin + second * cos
+
+        so they are copied to scratch and rewritten with one ``(4, 2) @
+        (2, 2)`` product, straight into the stack's block.
+        """
+        m: np.ndarray = self.top_for_update()
+        pair: np.ndarray = m[:, first : second + 1 : second - first]
+        c: float = math.cos(rads)
+        s: float = math.sin(rads)
+        self._rotation[0, 0] = c
+        self._rotation[0, 1] = -s
+        self._rotation[1, 0] = s
+        self._rotation[1, 1] = c
+        np.copyto(self._columns, pair)
+        np.matmul(self._columns, self._rotation, out=pair)
+
+
+@dataclasses.dataclass
+class _Product:
+    """``left.top @ right.top``, cached: recomputed into the same buffer only
+    when either factor's ``version`` has moved since the last computation.
+    ``right`` may itself be a product, so ``projection @ (view @ model)``
+    reuses the cached modelview."""
+
+    left: _Stack
+    right: typing.Union[_Stack, "_Product"]
+    version: int = dataclasses.field(init=False, default=0)
+    _matrix: np.ndarray = dataclasses.field(
+        init=False,
+        repr=False,
+        default_factory=lambda: np.identity(4, np.float32),
     )
-]
+    _top: np.ndarray = dataclasses.field(init=False, repr=False)
+    # the factor versions _matrix was computed from; -1 forces the first one
+    _left_version: int = dataclasses.field(init=False, repr=False, default=-1)
+    _right_version: int = dataclasses.field(init=False, repr=False, default=-1)
+
+    def __post_init__(self) -> None:
+        self._top = _read_only(self._matrix)
+
+    @property
+    def top(self) -> np.ndarray:
+        right: np.ndarray = self.right.top  # brings a nested product current
+        if (
+            self._left_version != self.left.version
+            or self._right_version != self.right.version
+        ):
+            np.matmul(self.left.top, right, out=self._matrix)
+            self._left_version = self.left.version
+            self._right_version = self.right.version
+            self.version += 1
+        return self._top
+
+
+@dataclasses.dataclass
+class MatrixStackContext:
+    """One independent set of ``model`` / ``view`` / ``projection`` stacks
+    and their cached products.
+
+    The free functions in this module act on the *current* context: a single
+    shared default unless a thread has installed its own with
+    :func:`use_context`.  Give each window, panel or worker thread its own
+    context and they stop stepping on each other's matrices.
+
+    >>> left, right = MatrixStackContext(), MatrixStackContext()
+    >>> with use_context(left):
+    ...     translate(MatrixStack.model, 1.0, 0.0, 0.0)
+    >>> with use_context(right):
+    ...     translate(MatrixStack.model, 0.0, 2.0, 0.0)
+    >>> with use_context(left):
+    ...     get_current_matrix(MatrixStack.model)[:3, 3].tolist()
+    [1.0, 0.0, 0.0]
+    """
+
+    max_depth: int = MAX_STACK_DEPTH
+    _model: _Stack = dataclasses.field(init=False, repr=False)
+    _view: _Stack = dataclasses.field(init=False, repr=False)
+    _projection: _Stack = dataclasses.field(init=False, repr=False)
+    _modelview: _Product = dataclasses.field(init=False, repr=False)
+    _modelviewprojection: _Product = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._model = _Stack(MatrixStack.model, self.max_depth)
+        self._view = _Stack(MatrixStack.view, self.max_depth)
+        self._projection = _Stack(MatrixStack.projection, self.max_depth)
+        self._modelview = _Product(self._view, self._model)
+        self._modelviewprojection = _Product(self._projection, self._modelview)
+
+
+#: the context every thread uses until it installs its own
+_default_context: MatrixStackContext = MatrixStackContext()
+
+#: the current context.  A new thread starts with the default, not whatever
+#: the thread that started it had installed.  Every free function reads it,
+#: and a ``ContextVar`` with a default is read in a few tens of ns, several
+#: times faster than a ``threading.local`` attribute.
+_current: contextvars.ContextVar[MatrixStackContext] = contextvars.ContextVar(
+    "matrix_stack_context", default=_default_context
+)
+
+
+def current_context() -> MatrixStackContext:
+    """The context the free functions act on in this thread."""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def use_context(
+    context: MatrixStackContext,
+) -> typing.Iterator[MatrixStackContext]:
+    """Make ``context`` current for this thread for the duration of a
+    ``with`` block, restoring the previous one on exit (even on an exception).
+
+    Other threads are unaffected, so two threads rendering under their own
+    contexts never see each other's pushes:
+
+    >>> import threading
+    >>> def render(depth):
+    ...     with use_context(MatrixStackContext()):
+    ...         translate(MatrixStack.view, 0.0, 0.0, -depth)
+    ...         results[depth] = get_current_matrix(MatrixStack.view)[2, 3]
+    >>> results = {}
+    >>> workers = [threading.Thread(target=render, args=(d,)) for d in (3, 7)]
+    >>> for worker in workers:
+    ...     worker.start()
+    >>> for worker in workers:
+    ...     worker.join()
+    >>> sorted(float(value) for value in results.values())
+    [-7.0, -3.0]
+    """
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
 
 
 def get_current_matrix(matrix_stack: MatrixStack) -> np.ndarray:
     """The matrix on top of the requested stack.
 
     ``model`` / ``view`` / ``projection`` return their own stored top; the two
-    combined members are **products computed on demand**, not stored stacks.
+    combined members are **products**, not stored stacks, cached until one of
+    their factors changes -- so asking for the same product every draw call
+    multiplies (and allocates) nothing.
+
+    The result is a **read-only** view of the stack's own storage: change the
+    stack through this module's functions, which keep the cached products
+    honest, and copy the result if you need to keep it past the next change.
 
     >>> import numpy as np
     >>> set_to_identity_matrix(MatrixStack.model)
@@ -90,6 +305,12 @@ def get_current_matrix(matrix_stack: MatrixStack) -> np.ndarray:
     >>> translate(MatrixStack.model, 3.0, 4.0, 5.0)
     >>> get_current_matrix(MatrixStack.modelview)[:, 3].tolist()
     [3.0, 4.0, 5.0, 1.0]
+
+    Asking again without changing anything returns the very same array:
+
+    >>> mvp = get_current_matrix(MatrixStack.modelviewprojection)
+    >>> get_current_matrix(MatrixStack.modelviewprojection) is mvp
+    True
     """
     # A chain of `if`s with no `else` fell off the end and returned None for
     # any unhandled member -- while the signature promises an ndarray, and
@@ -97,24 +318,15 @@ def get_current_matrix(matrix_stack: MatrixStack) -> np.ndarray:
     # unreachable branch loud instead of silent.
     match matrix_stack:
         case MatrixStack.model:
-            return __modelStack__[-1]
+            return _current.get()._model.top
         case MatrixStack.view:
-            return __viewStack__[-1]
+            return _current.get()._view.top
         case MatrixStack.projection:
-            return __projectionStack__[-1]
+            return _current.get()._projection.top
         case MatrixStack.modelview:
-            return np.matmul(
-                __viewStack__[-1],
-                __modelStack__[-1],
-            )
+            return _current.get()._modelview.top
         case MatrixStack.modelviewprojection:
-            return np.matmul(
-                __projectionStack__[-1],
-                np.matmul(
-                    __viewStack__[-1],
-                    __modelStack__[-1],
-                ),
-            )
+            return _current.get()._modelviewprojection.top
         case _:
             raise ValueError(
                 f"get_current_matrix: unhandled MatrixStack member "
@@ -135,56 +347,52 @@ def _not_a_stack(operation: str, matrix_stack: MatrixStack) -> ValueError:
     )
 
 
-def set_current_matrix(matrix_stack: MatrixStack, m: np.ndarray) -> None:
+def _stored(operation: str, matrix_stack: MatrixStack) -> _Stack:
+    """The current context's stored stack behind ``matrix_stack``; raises for
+    the derived products, which ``operation`` cannot write to."""
     match matrix_stack:
         case MatrixStack.model:
-            __modelStack__[-1] = m
+            return _current.get()._model
         case MatrixStack.view:
-            __viewStack__[-1] = m
+            return _current.get()._view
         case MatrixStack.projection:
-            __projectionStack__[-1] = m
+            return _current.get()._projection
         case MatrixStack.modelview | MatrixStack.modelviewprojection:
-            raise _not_a_stack("set_current_matrix", matrix_stack)
+            raise _not_a_stack(operation, matrix_stack)
         case _:
             raise ValueError(
-                f"set_current_matrix: unhandled MatrixStack member "
-                f"{matrix_stack!r}"
+                f"{operation}: unhandled MatrixStack member {matrix_stack!r}"
             )
 
 
-def _push_matrix(matrix_stack: MatrixStack) -> None:
-    def top_copy() -> np.ndarray:
-        return np.copy(get_current_matrix(matrix_stack))
+def get_version(matrix_stack: MatrixStack) -> int:
+    """How many times the top of a stored stack has changed in the current
+    context.  A consumer that keeps a copy of the matrix -- a GL uniform
+    buffer, say -- re-reads it only when this has moved.
 
-    match matrix_stack:
-        case MatrixStack.model:
-            __modelStack__.append(top_copy())
-        case MatrixStack.view:
-            __viewStack__.append(top_copy())
-        case MatrixStack.projection:
-            __projectionStack__.append(top_copy())
-        case MatrixStack.modelview | MatrixStack.modelviewprojection:
-            raise _not_a_stack("push_matrix", matrix_stack)
-        case _:
-            raise ValueError(
-                f"push_matrix: unhandled MatrixStack member {matrix_stack!r}"
-            )
+    >>> set_to_identity_matrix(MatrixStack.view)
+    >>> before = get_version(MatrixStack.view)
+    >>> translate(MatrixStack.model, 1.0, 0.0, 0.0)
+    >>> get_version(MatrixStack.view) == before
+    True
+    >>> translate(MatrixStack.view, 1.0, 0.0, 0.0)
+    >>> get_version(MatrixStack.view) == before
+    False
+    """
+    return _stored("get_version", matrix_stack).version
+
+
+def set_current_matrix(matrix_stack: MatrixStack, m: np.ndarray) -> None:
+    """Replace the top of a stored stack with (a float32 copy of) ``m``."""
+    _stored("set_current_matrix", matrix_stack).top_for_update()[...] = m
+
+
+def _push_matrix(matrix_stack: MatrixStack) -> None:
+    _stored("push_matrix", matrix_stack).push()
 
 
 def _pop_matrix(matrix_stack: MatrixStack) -> None:
-    match matrix_stack:
-        case MatrixStack.model:
-            __modelStack__.pop()
-        case MatrixStack.view:
-            __viewStack__.pop()
-        case MatrixStack.projection:
-            __projectionStack__.pop()
-        case MatrixStack.modelview | MatrixStack.modelviewprojection:
-            raise _not_a_stack("pop_matrix", matrix_stack)
-        case _:
-            raise ValueError(
-                f"pop_matrix: unhandled MatrixStack member {matrix_stack!r}"
-            )
+    _stored("pop_matrix", matrix_stack).pop()
 
 
 @contextlib.contextmanager
@@ -210,25 +418,18 @@ def push_matrix(m: MatrixStack) -> typing.Iterator[MatrixStack]:
     [1.0, 1.0, 1.0, 1.0]
     """
     matrix_stack = m
+    # pushed OUTSIDE the try: a push that fails (stack overflow) must not be
+    # "undone" by popping a matrix it never added.
+    _push_matrix(matrix_stack)
     try:
-        _push_matrix(matrix_stack)
         yield matrix_stack
     finally:
         _pop_matrix(matrix_stack)
 
 
 def set_to_identity_matrix(m: MatrixStack) -> None:
-    set_current_matrix(
-        m,
-        np.array(
-            [
-                [1.0, 0.0, 0.0, 0.0],
-                [0.0, 1.0, 0.0, 0.0],
-                [0.0, 0.0, 1.0, 0.0],
-                [0.0, 0.0, 0.0, 1.0],
-            ],
-            dtype=np.float32,
-        ),
+    _stored("set_to_identity_matrix", m).top_for_update()[...] = np.identity(
+        4, dtype=np.float32
     )
 
 
@@ -253,22 +454,8 @@ def rotate_x(matrix_stack: MatrixStack, rads: float) -> None:
     M(3,1)  M(3,2)*cos+M(3,3)*sin  M(3,2)*-sin+M(3,3)*cos  M(3,4)
     M(4,1)  M(4,2)*cos+M(4,3)*sin  M(4,2)*-sin+M(4,3)*cos  M(4,4)
     """
-
-    m = get_current_matrix(matrix_stack)
-    copy_of_m = np.copy(m)
-
-    c = math.cos(rads)
-    s = math.sin(rads)
-
-    m[0, 1] = copy_of_m[0, 1] * c + copy_of_m[0, 2] * s
-    m[1, 1] = copy_of_m[1, 1] * c + copy_of_m[1, 2] * s
-    m[2, 1] = copy_of_m[2, 1] * c + copy_of_m[2, 2] * s
-    m[3, 1] = copy_of_m[3, 1] * c + copy_of_m[3, 2] * s
-
-    m[0, 2] = copy_of_m[0, 1] * -s + copy_of_m[0, 2] * c
-    m[1, 2] = copy_of_m[1, 1] * -s + copy_of_m[1, 2] * c
-    m[2, 2] = copy_of_m[2, 1] * -s + copy_of_m[2, 2] * c
-    m[3, 2] = copy_of_m[3, 1] * -s + copy_of_m[3, 2] * c
+    # only columns 2 and 3 (0-based 1 and 2) change
+    _stored("rotate_x", matrix_stack).rotate_columns(1, 2, rads)
 
 
 def rotate_y(matrix_stack: MatrixStack, rads: float) -> None:
@@ -292,21 +479,9 @@ def rotate_y(matrix_stack: MatrixStack, rads: float) -> None:
     M(3,1)*cos+M(3,3)*-sin    M(3,2)     M(3,1)*sin+M(3,3)*cos     M(3,4)
     M(4,1)*cos+M(4,3)*-sin    M(4,2)     M(4,1)*sin+M(4,3)*cos     M(4,4)
     """
-    m = get_current_matrix(matrix_stack)
-    copy_of_m = np.copy(m)
-
-    c = math.cos(rads)
-    s = math.sin(rads)
-
-    m[0, 0] = copy_of_m[0, 0] * c + copy_of_m[0, 2] * -s
-    m[1, 0] = copy_of_m[1, 0] * c + copy_of_m[1, 2] * -s
-    m[2, 0] = copy_of_m[2, 0] * c + copy_of_m[2, 2] * -s
-    m[3, 0] = copy_of_m[3, 0] * c + copy_of_m[3, 2] * -s
-
-    m[0, 2] = copy_of_m[0, 0] * s + copy_of_m[0, 2] * c
-    m[1, 2] = copy_of_m[1, 0] * s + copy_of_m[1, 2] * c
-    m[2, 2] = copy_of_m[2, 0] * s + copy_of_m[2, 2] * c
-    m[3, 2] = copy_of_m[3, 0] * s + copy_of_m[3, 2] * c
+    # only columns 1 and 3 (0-based 0 and 2) change; sin and -sin sit the
+    # other way round than in rotate_x and rotate_z, hence the negated angle
+    _stored("rotate_y", matrix_stack).rotate_columns(0, 2, -rads)
 
 
 def rotate_z(matrix_stack: MatrixStack, rads: float) -> None:
@@ -330,21 +505,8 @@ def rotate_z(matrix_stack: MatrixStack, rads: float) -> None:
     M(3,1)*cos+M(3,2)*sin    M(3,1)*-sin+M(3,2)*cos M(3,3) M(3,4)
     M(4,1)*cos+M(4,2)*sin    M(4,1)*-sin+M(4,2)*cos M(4,3) M(4,4)
     """
-    m = get_current_matrix(matrix_stack)
-    copy_of_m = np.copy(m)
-
-    c = math.cos(rads)
-    s = math.sin(rads)
-
-    m[0, 0] = copy_of_m[0, 0] * c + copy_of_m[0, 1] * s
-    m[1, 0] = copy_of_m[1, 0] * c + copy_of_m[1, 1] * s
-    m[2, 0] = copy_of_m[2, 0] * c + copy_of_m[2, 1] * s
-    m[3, 0] = copy_of_m[3, 0] * c + copy_of_m[3, 1] * s
-
-    m[0, 1] = copy_of_m[0, 0] * -s + copy_of_m[0, 1] * c
-    m[1, 1] = copy_of_m[1, 0] * -s + copy_of_m[1, 1] * c
-    m[2, 1] = copy_of_m[2, 0] * -s + copy_of_m[2, 1] * c
-    m[3, 1] = copy_of_m[3, 0] * -s + copy_of_m[3, 1] * c
+    # only columns 1 and 2 (0-based 0 and 1) change
+    _stored("rotate_z", matrix_stack).rotate_columns(0, 1, rads)
 
 
 def translate(matrix_stack: MatrixStack, x: float, y: float, z: float) -> None:
@@ -368,12 +530,17 @@ def translate(matrix_stack: MatrixStack, x: float, y: float, z: float) -> None:
     M(3,1) M(3,2) M(3,3) (M(3,1)*x + M(3,2)*y + M(3,3)*z + M(3,4)*w)
     M(4,1) M(4,2) M(4,3) (M(4,1)*x + M(4,2)*y + M(4,3)*z + M(4,4)*w)
     """
-    m = get_current_matrix(matrix_stack)
+    stack = _stored("translate", matrix_stack)
+    m = stack.top_for_update()
 
-    m[0, 3] = m[0, 0] * x + m[0, 1] * y + m[0, 2] * z + m[0, 3]
-    m[1, 3] = m[1, 0] * x + m[1, 1] * y + m[1, 2] * z + m[1, 3]
-    m[2, 3] = m[2, 0] * x + m[2, 1] * y + m[2, 2] * z + m[2, 3]
-    m[3, 3] = m[3, 0] * x + m[3, 1] * y + m[3, 2] * z + m[3, 3]
+    # only column 4 changes: it becomes M @ (x, y, z, 1).  The three
+    # scalars are stored one by one -- far cheaper than converting a tuple
+    vector = stack._vector
+    vector[0] = x
+    vector[1] = y
+    vector[2] = z
+    np.matmul(m, vector, out=stack._column)
+    m[:, 3] = stack._column
 
 
 def scale(matrix_stack: MatrixStack, x: float, y: float, z: float) -> None:
@@ -397,28 +564,21 @@ def scale(matrix_stack: MatrixStack, x: float, y: float, z: float) -> None:
     M(3,1)*x  M(3,2)*y  M(3,3)*z  M(3,4)
     M(4,1)*x  M(4,2)*y  M(4,3)*z  M(4,4)
     """
-    m = get_current_matrix(matrix_stack)
-
-    m[0, 0] = m[0, 0] * x
-    m[1, 0] = m[1, 0] * x
-    m[2, 0] = m[2, 0] * x
-    m[3, 0] = m[3, 0] * x
-
-    m[0, 1] = m[0, 1] * y
-    m[1, 1] = m[1, 1] * y
-    m[2, 1] = m[2, 1] * y
-    m[3, 1] = m[3, 1] * y
+    stack = _stored("scale", matrix_stack)
+    m = stack.top_for_update()
 
-    m[0, 2] = m[0, 2] * z
-    m[1, 2] = m[1, 2] * z
-    m[2, 2] = m[2, 2] * z
-    m[3, 2] = m[3, 2] * z
+    # columns 1, 2 and 3 are each scaled by their own factor, column 4 by
+    # the vector's 1
+    vector = stack._vector
+    vector[0] = x
+    vector[1] = y
+    vector[2] = z
+    m *= vector
 
 
 def multiply(matrix_stack: MatrixStack, rhs: np.ndarray) -> None:
     """Matrix multiply"""
-    m = get_current_matrix(matrix_stack)
-    m[0:4, 0:4] = np.matmul(m.copy(), rhs)
+    _stored("multiply", matrix_stack).post_multiply(rhs)
 
 
 def planar_shadow(
@@ -484,8 +644,110 @@ def planar_shadow(
     )
     # fmt: on
 
-    m = get_current_matrix(matrix_stack)
-    m[0:4, 0:4] = np.matmul(m.copy(), shadow)
+    _stored("planar_shadow", matrix_stack).post_multiply(shadow)
+
+
+def _axis_rotations(axis: int, rads: np.ndarray) -> np.ndarray:
+    """``(N, 3, 3)`` rotations about ``axis`` (0, 1, 2 for x, y, z), laid out
+    as in ``rotate_x`` / ``rotate_y`` / ``rotate_z``."""
+    first, second = [(1, 2), (0, 2), (0, 1)][axis]
+    # rotate_y's sin / -sin sit the other way round, as in rotate_columns
+    sign: float = -1.0 if axis == 1 else 1.0
+    c: np.ndarray = np.cos(rads)
+    s: np.ndarray = np.sin(rads) * sign
+    rotations: np.ndarray = np.zeros((len(rads), 3, 3))
+    rotations[:, axis, axis] = 1.0
+    rotations[:, first, first] = c
+    rotations[:, first, second] = -s
+    rotations[:, second, first] = s
+    rotations[:, second, second] = c
+    return rotations
+
+
+def instance_matrices(
+    translations: np.ndarray,
+    angles: typing.Optional[np.ndarray] = None,
+    scales: typing.Optional[np.ndarray] = None,
+    matrix_stack: MatrixStack = MatrixStack.modelview,
+    out: typing.Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Per-instance matrices for an instanced draw, built in one vectorized
+    pass instead of one ``push_matrix`` / upload / draw per object.
+
+    ``translations``, ``angles`` (radians about x, y, z) and ``scales`` are
+    ``(N, 3)`` arrays; ``angles`` defaults to no rotation and ``scales`` to
+    unit scale.  Instance ``i`` gets the matrix that
+
+        with push_matrix(MatrixStack.model):
+            translate(MatrixStack.model, *translations[i])
+            rotate_x(MatrixStack.model, angles[i, 0])
+            rotate_y(MatrixStack.model, angles[i, 1])
+            rotate_z(MatrixStack.model, angles[i, 2])
+            scale(MatrixStack.model, *scales[i])
+            get_current_matrix(matrix_stack)
+
+    would leave -- by default the ``modelview``, so the current view (and
+    any enclosing model transforms) is already folded in.  The stacks are not
+    touched.  The result is an ``(N, 4, 4)`` float32 array, row-major like
+    the rest of this module; a per-instance ``mat4`` attribute is read
+    column-major and, unlike ``glUniformMatrix4fv``, has no transpose flag,
+    so upload ``np.ascontiguousarray(matrices.transpose(0, 2, 1))``.  Pass
+    ``out`` to reuse one buffer every frame.
+
+    >>> import numpy as np
+    >>> set_to_identity_matrix(MatrixStack.model)
+    >>> set_to_identity_matrix(MatrixStack.view)
+    >>> translate(MatrixStack.view, 0.0, 0.0, -10.0)
+    >>> matrices = instance_matrices(
+    ...     np.array([[1.0, 0.0, 0.0], [0.0, 2.0, 0.0]]),
+    ...     scales=np.array([[2.0, 2.0, 2.0], [1.0, 1.0, 1.0]]),
+    ... )
+    >>> matrices.shape, matrices.dtype
+    ((2, 4, 4), dtype('float32'))
+    >>> matrices[:, :3, 3].tolist()
+    [[1.0, 0.0, -10.0], [0.0, 2.0, -10.0]]
+    >>> np.diag(matrices[0]).tolist()
+    [2.0, 2.0, 2.0, 1.0]
+    """
+    translations = np.asarray(translations, dtype=np.float64)
+    count: int = len(translations)
+    if angles is None:
+        angles = np.zeros((count, 3))
+    if scales is None:
+        scales = np.ones((count, 3))
+    angles = np.asarray(angles, dtype=np.float64)
+    scales = np.asarray(scales, dtype=np.float64)
+    for name, array in (
+        ("translations", translations),
+        ("angles", angles),
+        ("scales", scales),
+    ):
+        if array.shape != (count, 3):
+            raise ValueError(
+                f"instance_matrices: {name} must have shape ({count}, 3), "
+                f"got {array.shape}"
+            )
+    if out is not None and out.shape != (count, 4, 4):
+        raise ValueError(
+            f"instance_matrices: out must have shape ({count}, 4, 4), "
+            f"got {out.shape}"
+        )
+
+    # T @ Rx @ Ry @ Rz @ S: the rotation block, its columns scaled, with the
+    # translation in the last column -- exactly the calls in the docstring
+    rotations: np.ndarray = _axis_rotations(0, angles[:, 0])
+    rotations = np.matmul(rotations, _axis_rotations(1, angles[:, 1]))
+    rotations = np.matmul(rotations, _axis_rotations(2, angles[:, 2]))
+    local: np.ndarray = np.zeros((count, 4, 4))
+    local[:, :3, :3] = rotations * scales[:, np.newaxis, :]
+    local[:, :3, 3] = translations
+    local[:, 3, 3] = 1.0
+
+    if out is None:
+        out = np.empty((count, 4, 4), dtype=np.float32)
+    current: np.ndarray = get_current_matrix(matrix_stack).astype(np.float64)
+    np.matmul(current, local, out=out)
+    return out
 
 
 def ortho(
@@ -510,8 +772,9 @@ def ortho(
     ry = -(top + bottom) / (top - bottom)
     rz = -(far + near) / (far - near)
 
+    projection = _stored("ortho", MatrixStack.projection).top_for_update()
     # fmt: off
-    __projectionStack__[-1] = np.array(
+    projection[...] = np.array(
         [
             [2.0 / dx, 0.0,      0.0,       rx],
             [0.0,      2.0 / dy, 0.0,       ry],
@@ -542,12 +805,13 @@ def perspective(
 
     # m34 is a constant, inlining it would make the line > 80 chars
     m34 = -2 * (far_z * near_z) / (far_z - near_z)
+    projection = _stored("perspective", MatrixStack.projection).top_for_update()
     # fmt: off
     # The rows are hand-aligned into matrix columns and run a few chars past 80.
     # In a book about matrices that layout IS the documentation, so these keep
     # their alignment (hence the `fmt: off` above) and opt out of E501 rather
     # than being reflowed into an unreadable stack.
-    __projectionStack__[-1] = np.array(
+    projection[...] = np.array(
         [
             [near_z / right, 0.0,          0.0,                                  0.0],  # noqa: E501
             [0.0,            near_z / top, 0.0,                                  0.0],  # noqa: E501
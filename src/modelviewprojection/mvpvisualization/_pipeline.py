@@ -11,19 +11,27 @@ What this module owns:
     - GLFW + ImGui boilerplate: ``setup_window(title)``, ``install_esc_close``,
       ``install_camera_scroll``.
     - Shader compilation: ``compile_program(vert, frag, geom=None,
-      project=None)`` / ``build_pipeline(...)``.  All shaders are shared and
+      project=None)`` / ``build_pipeline(...)``, with linked programs cached
+      on disk under ``program_cache_dir``.  All shaders are shared and
       live next to this module in the package; the two
       vertex shaders (``per_vertex_color.vert`` / ``uniform_color.vert``) get a
       per-demo ``project_*.glsl`` snippet appended at compile time.
-    - VAO builders: ``make_triangle_vao(...)`` and ``make_lines_vao(...)``.
+    - VAO builders: ``make_triangle_vao(...)``, ``make_lines_vao(...)`` and
+      its per-instance twin ``make_instanced_lines_vao(...)``.
       Both register their handles into ``all_vaos`` / ``all_vbos`` for
       cleanup; ``compile_program`` registers into ``all_programs``.
     - Standard mesh data: ``paddle_vertices``, ``square_vertices``,
       ``build_ground_vertices()``, ``build_axis_vertices()``,
       ``build_ndc_cube_vertices()``.
-    - Per-frame uniform set: ``set_uniforms(u_m, u_v, u_p)``.
+    - Per-draw uniform set: ``set_uniforms(u_m)``, which also refreshes the
+      shared ``Camera`` uniform block (view + projection) when either moved.
+    - ``gl_state``, a ``GLStateCache`` that binds programs / VAOs / textures
+      and sets uniforms only when the value actually changes, counting the
+      calls it saved.  It and the camera block describe one GL context;
+      ``follow_context(handle)`` forgets both when another is made current.
     - Common dataclass: ``Camera`` (orbit camera with r, rot_y, rot_x).
-    - ``cleanup()`` releases every registered handle on shutdown.
+    - ``cleanup()`` releases every registered handle (and ``profiler``'s
+      timer queries) on shutdown, or before an offscreen context goes.
 
 What stays in the demo file:
     - Pipeline creation (each demo has different shader programs / uniform
@@ -35,11 +43,13 @@ What stays in the demo file:
 """
 
 import ctypes
+import functools
+import hashlib
 import math
 import os
 import sys
 import typing
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 import glfw
@@ -50,8 +60,10 @@ from imgui_bundle import imgui, imgui_md
 from imgui_bundle.python_backends.glfw_backend import GlfwRenderer
 from numpy import ndarray
 from OpenGL.constant import Constant
+from OpenGL.error import GLError
 
 import modelviewprojection.matrix_stack as ms
+from modelviewprojection.mvpvisualization.profiling import profiler
 
 if typing.TYPE_CHECKING:
     # glfw types window handles as `_GLFWwindowPointerT`: private, absent at
@@ -90,13 +102,23 @@ all_programs: list[int] = []
 
 def cleanup() -> None:
     """Release every GL handle registered through this module.  Call once
-    after the main loop exits, before ``glfw.terminate()``."""
+    after the main loop exits, before ``glfw.terminate()`` -- or, rendering
+    offscreen, before the context is destroyed: the registries are emptied,
+    so the next context starts with none of this one's names."""
     if all_vaos:
         GL.glDeleteVertexArrays(len(all_vaos), all_vaos)
     if all_vbos:
         GL.glDeleteBuffers(len(all_vbos), all_vbos)
     for prog in all_programs:
         GL.glDeleteProgram(prog)
+    all_vaos.clear()
+    all_vbos.clear()
+    all_programs.clear()
+    if _camera_block.ubo:
+        GL.glDeleteBuffers(1, [_camera_block.ubo])
+    _camera_block.reset()
+    gl_state.reset()
+    profiler.release()
 
 
 # ---------------------------------------------------------------------------
@@ -135,6 +157,7 @@ def setup_window(
         glfw.terminate()
         sys.exit("Could not initialize Window")
     glfw.make_context_current(window)
+    follow_context(window)
 
     # macOS Core Profile requires a non-zero VAO bound at all times for
     # any vertex-attribute or draw call (VAO 0 is prohibited).  We
@@ -210,6 +233,163 @@ def _read_shader(name: str, shader_dir: str) -> str:
         return f.read()
 
 
+#: Where ``compile_program`` keeps linked program binaries between launches:
+#: ``$MVP_PROGRAM_CACHE``, else ``modelviewprojection/programs`` under
+#: ``$XDG_CACHE_HOME`` (default ``~/.cache``).  Set it to ``None`` -- or the
+#: variable to an empty string -- to always compile from source.
+program_cache_dir: Optional[str] = (
+    os.environ.get(
+        "MVP_PROGRAM_CACHE",
+        os.path.join(
+            os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+            "modelviewprojection",
+            "programs",
+        ),
+    )
+    or None
+)
+
+
+def program_key(driver: str, sources: typing.Sequence[str]) -> str:
+    """The cache key of a program: a hash of the GL driver string and the
+    final source of each stage, in link order.  A binary is only good for
+    the driver that produced it, so either changing invalidates the entry.
+
+    >>> key = program_key("Mesa llvmpipe 4.5", ["void main() {}", "frag"])
+    >>> len(key), key == program_key("Mesa llvmpipe 4.5", ["void main() {}"])
+    (64, False)
+    >>> key == program_key("NVIDIA 550.54", ["void main() {}", "frag"])
+    False
+    """
+    digest = hashlib.sha256(driver.encode())
+    for source in sources:
+        # length-prefixed, so moving text across a stage boundary changes it
+        digest.update(len(source).to_bytes(8, "little"))
+        digest.update(source.encode())
+    return digest.hexdigest()
+
+
+def write_program_binary(path: str, binary_format: int, binary: bytes) -> None:
+    """Store a ``glGetProgramBinary`` result: its format enum as a
+    little-endian uint32, then the bytes.  Written to a temporary name and
+    renamed into place, so a concurrent reader (another demo, or an export
+    worker) never sees half a file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    partial = f"{path}.{os.getpid()}.tmp"
+    with open(partial, "wb") as f:
+        f.write(binary_format.to_bytes(4, "little"))
+        f.write(binary)
+    os.replace(partial, path)
+
+
+def read_program_binary(path: str) -> Optional[tuple[int, bytes]]:
+    """The ``(format, bytes)`` stored at ``path`` by
+    ``write_program_binary``, or ``None`` if there is no usable entry."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) <= 4:
+        return None
+    return int.from_bytes(data[:4], "little"), data[4:]
+
+
+def _driver() -> str:
+    """Vendor, renderer and version of the current context's GL driver."""
+    return " | ".join(
+        GL.glGetString(name).decode()
+        for name in (GL.GL_VENDOR, GL.GL_RENDERER, GL.GL_VERSION)
+    )
+
+
+def _program_cache_path(sources: typing.Sequence[str]) -> Optional[str]:
+    """Where the binary for ``sources`` is cached, or ``None`` when caching
+    is off or the driver offers no binary formats (GL < 4.1 without
+    ``ARB_get_program_binary``)."""
+    if program_cache_dir is None:
+        return None
+    try:
+        formats = int(GL.glGetIntegerv(GL.GL_NUM_PROGRAM_BINARY_FORMATS))
+    except GLError:
+        return None
+    if formats == 0:
+        return None
+    return os.path.join(
+        program_cache_dir, program_key(_driver(), sources) + ".bin"
+    )
+
+
+def _load_program_binary(path: str) -> Optional[int]:
+    """A program linked from the binary cached at ``path``; ``None`` when
+    there is none or the driver rejects it (e.g. after a driver update that
+    kept the version string)."""
+    cached = read_program_binary(path)
+    if cached is None:
+        return None
+    binary_format, binary = cached
+    prog = GL.glCreateProgram()
+    try:
+        GL.glProgramBinary(
+            prog, binary_format, np.frombuffer(binary, np.uint8), len(binary)
+        )
+        linked = GL.glGetProgramiv(prog, GL.GL_LINK_STATUS) == GL.GL_TRUE
+    except GLError:
+        linked = False
+    if not linked:
+        GL.glDeleteProgram(prog)
+        return None
+    return prog
+
+
+def _link_program(stages: list[tuple[GLenum, str]], retrievable: bool) -> int:
+    """Compile each ``(kind, source)`` stage and link them.  ``retrievable``
+    asks the driver to keep the program's binary retrievable for the cache;
+    it is set only when there is a cache to write, since the hint is part of
+    ``ARB_get_program_binary``.  A stage that fails to compile or a program
+    that fails to link raises, and leaves no shader or program behind."""
+    compiled: list[int] = []
+    try:
+        for kind, src in stages:
+            compiled.append(shaders.compileShader(src, kind))
+        prog = GL.glCreateProgram()
+        for shader in compiled:
+            GL.glAttachShader(prog, shader)
+        if retrievable:
+            GL.glProgramParameteri(
+                prog, GL.GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL.GL_TRUE
+            )
+        GL.glLinkProgram(prog)
+        if GL.glGetProgramiv(prog, GL.GL_LINK_STATUS) != GL.GL_TRUE:
+            log = GL.glGetProgramInfoLog(prog).decode()
+            GL.glDeleteProgram(prog)  # detaches its shaders, too
+            raise RuntimeError(log)
+        for shader in compiled:
+            GL.glDetachShader(prog, shader)
+    finally:
+        for shader in compiled:
+            GL.glDeleteShader(shader)
+    return prog
+
+
+def _store_program_binary(prog: int, path: str) -> None:
+    """Cache ``prog``'s binary at ``path``.  Best effort: a read-only or full
+    cache directory only costs the next launch a compile."""
+    size = int(GL.glGetProgramiv(prog, GL.GL_PROGRAM_BINARY_LENGTH))
+    if size == 0:
+        return
+    binary = np.empty(size, np.uint8)
+    length = np.zeros(1, np.int32)
+    binary_format = np.zeros(1, np.uint32)
+    GL.glGetProgramBinary(prog, size, length, binary_format, binary)
+    try:
+        write_program_binary(
+            path, int(binary_format[0]), binary[: int(length[0])].tobytes()
+        )
+    except OSError:
+        pass
+
+
 def compile_program(
     vert: str,
     frag: str,
@@ -229,21 +409,25 @@ def compile_program(
     forward-declared ``vec4 project(vec4)`` that ``per_vertex_color.vert`` /
     ``uniform_color.vert`` call.  GLSL 330 has no ``#include``, so this string
     concatenation is how each demo's projection animation is injected into the
-    two shared vertex shaders."""
+    two shared vertex shaders.
+
+    Linking from source dominates startup under llvmpipe, so the linked
+    binary is cached under ``program_cache_dir``, keyed by ``program_key``
+    of the final sources and the driver string.  A cached binary the driver
+    rejects is compiled from source again and replaced."""
     vsrc = _read_shader(vert, shader_dir)
     if project is not None:
         vsrc = vsrc + "\n" + _read_shader(project, shader_dir)
-    vs = shaders.compileShader(vsrc, GL.GL_VERTEX_SHADER)
-    fs = shaders.compileShader(
-        _read_shader(frag, shader_dir), GL.GL_FRAGMENT_SHADER
-    )
-    if geom is None:
-        prog = shaders.compileProgram(vs, fs)
-    else:
-        gs = shaders.compileShader(
-            _read_shader(geom, shader_dir), GL.GL_GEOMETRY_SHADER
-        )
-        prog = shaders.compileProgram(vs, gs, fs)
+    stages: list[tuple[GLenum, str]] = [(GL.GL_VERTEX_SHADER, vsrc)]
+    if geom is not None:
+        stages.append((GL.GL_GEOMETRY_SHADER, _read_shader(geom, shader_dir)))
+    stages.append((GL.GL_FRAGMENT_SHADER, _read_shader(frag, shader_dir)))
+    path = _program_cache_path([src for _kind, src in stages])
+    prog = _load_program_binary(path) if path is not None else None
+    if prog is None:
+        prog = _link_program(stages, retrievable=path is not None)
+        if path is not None:
+            _store_program_binary(prog, path)
     all_programs.append(prog)
     return prog
 
@@ -258,16 +442,16 @@ class Pipeline:
     """A shader program with its cached uniform / attribute locations.
 
     The mvpvisualization demos keep model / view / projection as three
-    separate uniforms (``mMatrix`` / ``vMatrix`` / ``pMatrix``) so the stages
-    can be shown independently -- hence ``u_m`` / ``u_v`` / ``u_p`` rather than
-    a single ``u_mvp``.  ``u_color`` / ``attr_color`` are ``-1`` for programs
+    separate matrices (``mMatrix`` / ``vMatrix`` / ``pMatrix``) so the stages
+    can be shown independently, rather than a single ``u_mvp``.  Only
+    ``mMatrix`` is a plain uniform, hence ``u_m``: view and projection live
+    in the ``Camera`` uniform block every program shares (see
+    ``set_uniforms``).  ``u_color`` / ``attr_color`` are ``-1`` for programs
     that don't use them.
     """
 
     program: int
     u_m: int
-    u_v: int
-    u_p: int
     attr_position: int
     u_color: int = -1
     attr_color: int = -1
@@ -281,6 +465,10 @@ class Pipeline:
     # Screen-space frustum-edge uniforms (``screenspace=True``).
     u_thickness: int = -1
     u_viewport: int = -1
+    # Per-instance attributes (``instanced=True``): a model matrix (four
+    # consecutive locations) and a colour, in place of ``mMatrix``/``color``.
+    attr_instance_model: int = -1
+    attr_instance_color: int = -1
 
 
 def build_pipeline(
@@ -292,36 +480,40 @@ def build_pipeline(
     per_vertex_color: bool = False,
     anim: bool = False,
     screenspace: bool = False,
+    instanced: bool = False,
     geom: Optional[str] = None,
     project: str = "project_identity.glsl",
 ) -> "Pipeline":
     """Compile ``vert`` + ``frag`` (+ optional ``geom``) from ``shader_dir``
-    (the
-    calling demo's own directory) and cache its ``mMatrix`` / ``vMatrix`` /
-    ``pMatrix`` uniforms and
-    ``position`` attribute.  ``project`` selects the appended ``project_*.glsl``
-    animation snippet (default: the static identity).  Optional flags cache
-    extra locations: ``color`` -> ``color`` uniform; ``per_vertex_color`` ->
-    ``color_in`` attribute; ``anim`` -> the frustum-animation uniforms
-    (``field_of_view`` / ``aspect_ratio`` / ``near_z`` / ``far_z`` / ``time``);
-    ``screenspace`` -> ``u_thickness`` / ``u_viewport_size``."""
+    (the calling demo's own directory), cache its ``mMatrix`` uniform and
+    ``position`` attribute, and bind its ``Camera`` block (``vMatrix`` /
+    ``pMatrix``) to ``CAMERA_BLOCK_BINDING``.  ``project`` selects the
+    appended ``project_*.glsl`` animation snippet (default: the static
+    identity).  Optional flags cache extra locations: ``color`` -> ``color``
+    uniform; ``per_vertex_color`` -> ``color_in`` attribute; ``anim`` -> the
+    frustum-animation uniforms (``field_of_view`` / ``aspect_ratio`` /
+    ``near_z`` / ``far_z`` / ``time``); ``screenspace`` -> ``u_thickness`` /
+    ``u_viewport_size``; ``instanced`` -> the ``instance_model`` /
+    ``instance_color`` attributes."""
 
     def u(name: str, enabled: bool) -> int:
         return GL.glGetUniformLocation(prog, name) if enabled else -1
 
+    def a(name: str, enabled: bool) -> int:
+        return GL.glGetAttribLocation(prog, name) if enabled else -1
+
     prog = compile_program(
         vert, frag, geom=geom, project=project, shader_dir=shader_dir
     )
+    camera = GL.glGetUniformBlockIndex(prog, "Camera")
+    if camera != GL.GL_INVALID_INDEX:
+        GL.glUniformBlockBinding(prog, camera, CAMERA_BLOCK_BINDING)
     return Pipeline(
         program=prog,
         u_m=GL.glGetUniformLocation(prog, "mMatrix"),
-        u_v=GL.glGetUniformLocation(prog, "vMatrix"),
-        u_p=GL.glGetUniformLocation(prog, "pMatrix"),
         attr_position=GL.glGetAttribLocation(prog, "position"),
         u_color=u("color", color),
-        attr_color=(
-            GL.glGetAttribLocation(prog, "color_in") if per_vertex_color else -1
-        ),
+        attr_color=a("color_in", per_vertex_color),
         u_fov=u("field_of_view", anim),
         u_aspect=u("aspect_ratio", anim),
         u_near=u("near_z", anim),
@@ -329,6 +521,8 @@ def build_pipeline(
         u_time=u("time", anim),
         u_thickness=u("u_thickness", screenspace),
         u_viewport=u("u_viewport_size", screenspace),
+        attr_instance_model=a("instance_model", instanced),
+        attr_instance_color=a("instance_color", instanced),
     )
 
 
@@ -361,12 +555,15 @@ class AttribSpec:
         layout:   ``(stride_bytes, offset_bytes)``.  Kept as a tuple
                   because the two are coupled -- they describe one
                   buffer-layout decision together.
+        divisor:  ``0`` to advance per vertex; ``1`` to advance once per
+                  instance of an instanced draw.
     """
 
     vbo: int
     location: int
     size: int
     layout: tuple[int, int]
+    divisor: int = 0
 
 
 def make_vbo(data: ndarray, usage: GLenum = GL.GL_STATIC_DRAW) -> int:
@@ -387,7 +584,7 @@ def make_vao(attribs: list[AttribSpec]) -> int:
     handle is registered into ``all_vaos`` for cleanup."""
     vao = GL.glGenVertexArrays(1)
     all_vaos.append(vao)
-    GL.glBindVertexArray(vao)
+    gl_state.bind_vertex_array(vao)
     for a in attribs:
         GL.glBindBuffer(GL.GL_ARRAY_BUFFER, a.vbo)
         GL.glEnableVertexAttribArray(a.location)
@@ -400,6 +597,8 @@ def make_vao(attribs: list[AttribSpec]) -> int:
             stride,
             ctypes.c_void_p(offset),
         )
+        if a.divisor:
+            GL.glVertexAttribDivisor(a.location, a.divisor)
     return vao
 
 
@@ -466,6 +665,58 @@ def make_lines_vao(vertices: ndarray, attr_position: int) -> tuple[int, int]:
     return vao, n_verts
 
 
+#: floats per instance in an instanced-lines VBO: a ``mat4`` model matrix
+#: (column-major, as GL reads a matrix attribute) then an RGB colour
+floats_per_instance: int = 16 + floats_per_color
+
+
+def make_instanced_lines_vao(
+    vertices: ndarray,
+    attr_position: int,
+    attr_instance_model: int,
+    attr_instance_color: int,
+) -> tuple[int, int, int]:
+    """Like ``make_lines_vao``, plus per-instance attributes read from a
+    second, initially empty VBO: ``floats_per_instance`` floats per instance,
+    the model matrix's four columns then the colour.  Returns (vao,
+    vertex_count, instance_vbo); re-upload the instances into
+    ``instance_vbo`` before each ``glDrawArraysInstanced``."""
+    vertices = np.ascontiguousarray(vertices, dtype=np.float32).flatten()
+    n_verts = vertices.size // floats_per_vertex
+    vbo = make_vbo(vertices)
+    instance_vbo = make_vbo(np.empty(0), usage=GL.GL_STREAM_DRAW)
+    stride = glfloat_size * floats_per_instance
+    columns = [
+        AttribSpec(
+            vbo=instance_vbo,
+            location=attr_instance_model + column,
+            size=4,
+            layout=(stride, glfloat_size * 4 * column),
+            divisor=1,
+        )
+        for column in range(4)
+    ]
+    vao = make_vao(
+        [
+            AttribSpec(
+                vbo=vbo,
+                location=attr_position,
+                size=floats_per_vertex,
+                layout=(0, 0),
+            ),
+            *columns,
+            AttribSpec(
+                vbo=instance_vbo,
+                location=attr_instance_color,
+                size=floats_per_color,
+                layout=(stride, glfloat_size * 16),
+                divisor=1,
+            ),
+        ]
+    )
+    return vao, n_verts, instance_vbo
+
+
 # ---------------------------------------------------------------------------
 # Standard mesh data shared across the visualizations.
 # ---------------------------------------------------------------------------
@@ -645,8 +896,12 @@ def build_origin_sphere_solid(
     return np.array(verts, dtype=np.float32)
 
 
+#: a cylinder's end points, ``((x0, y0, z0), (x1, y1, z1))``
+CylinderEdge = tuple[tuple[float, float, float], tuple[float, float, float]]
+
+
 def build_cylinders_for_edges(
-    edges: list,
+    edges: typing.Iterable[typing.Sequence[typing.Sequence[float]]],
     radius: float = 0.05,
     slices: int = 20,
 ) -> ndarray:
@@ -655,63 +910,82 @@ def build_cylinders_for_edges(
     runs from p0 to p1 with the given radius, capped at both ends.
 
     Returns a flat float32 array suitable for ``make_lines_vao`` +
-    ``glDrawArrays(GL_TRIANGLES, ...)``.  5 triangles per slice per edge
-    (cylinder side = 2, bottom cap = 1, top cap = 1, plus 1 spare for
-    diagonal symmetry of the side strip)."""
-    verts: list[float] = []
-    for raw_p0, raw_p1 in edges:
-        p0 = np.array(raw_p0, dtype=np.float32)
-        p1 = np.array(raw_p1, dtype=np.float32)
-        forward = p1 - p0
-        length = float(np.linalg.norm(forward))
-        if length < 1e-9:
-            continue
-        forward_unit = forward / length
-
-        # Pick a reference axis not parallel to forward, then derive an
-        # orthonormal (right, up) frame perpendicular to forward.
-        if abs(forward_unit[1]) > 0.9:
-            ref = np.array([1.0, 0.0, 0.0], dtype=np.float32)
-        else:
-            ref = np.array([0.0, 1.0, 0.0], dtype=np.float32)
-        right = np.cross(forward_unit, ref)
-        right = right / float(np.linalg.norm(right))
-        up = np.cross(forward_unit, right)
-
-        for i in range(slices):
-            a0 = 2.0 * math.pi * i / slices
-            a1 = 2.0 * math.pi * (i + 1) / slices
-            off0 = right * (math.cos(a0) * radius) + up * (
-                math.sin(a0) * radius
-            )
-            off1 = right * (math.cos(a1) * radius) + up * (
-                math.sin(a1) * radius
-            )
-            b0 = p0 + off0
-            b1 = p0 + off1
-            t0 = p1 + off0
-            t1 = p1 + off1
-
-            # Cylinder side -- two triangles per slice
-            verts += [float(b0[0]), float(b0[1]), float(b0[2])]
-            verts += [float(b1[0]), float(b1[1]), float(b1[2])]
-            verts += [float(t1[0]), float(t1[1]), float(t1[2])]
+    ``glDrawArrays(GL_TRIANGLES, ...)``.  4 triangles per slice per edge
+    (cylinder side = 2, bottom cap = 1, top cap = 1); zero-length edges
+    are skipped.
+
+    The mesh is cached on ``(edges, radius, slices)`` and returned
+    read-only, so rebuilding the same outline costs a lookup.
+
+    >>> mesh = build_cylinders_for_edges([((0, 0, 0), (0, 0, 2))], 0.5, 4)
+    >>> mesh.shape  # 4 slices * 4 triangles * 3 vertices * 3 floats
+    (144,)
+    >>> vertices = mesh.reshape(-1, 3)
+    >>> vertices[6].tolist(), vertices[9].tolist()  # the caps fan from p0, p1
+    ([0.0, 0.0, 0.0], [0.0, 0.0, 2.0])
+    >>> mesh is build_cylinders_for_edges([((0, 0, 0), (0, 0, 2))], 0.5, 4)
+    True
+    """
+    key: tuple[CylinderEdge, ...] = tuple(
+        (
+            (float(p0[0]), float(p0[1]), float(p0[2])),
+            (float(p1[0]), float(p1[1]), float(p1[2])),
+        )
+        for p0, p1 in edges
+    )
+    return _cylinders(key, float(radius), int(slices))
 
-            verts += [float(b0[0]), float(b0[1]), float(b0[2])]
-            verts += [float(t1[0]), float(t1[1]), float(t1[2])]
-            verts += [float(t0[0]), float(t0[1]), float(t0[2])]
 
+@functools.lru_cache(maxsize=32)
+def _cylinders(
+    edges: tuple[CylinderEdge, ...], radius: float, slices: int
+) -> ndarray:
+    """:func:`build_cylinders_for_edges` for hashable arguments, all edges x
+    slices x triangles in one broadcast."""
+    points: ndarray = np.array(edges, dtype=np.float64).reshape(-1, 2, 3)
+    forward: ndarray = points[:, 1] - points[:, 0]
+    length: ndarray = np.linalg.norm(forward, axis=1)
+    keep: ndarray = length >= 1e-9
+    points, forward_unit = points[keep], forward[keep] / length[keep, None]
+
+    # Pick a reference axis not parallel to forward, then derive an
+    # orthonormal (right, up) frame perpendicular to forward.
+    ref: ndarray = np.where(
+        np.abs(forward_unit[:, 1:2]) > 0.9, [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]
+    )
+    right: ndarray = np.cross(forward_unit, ref)
+    right /= np.linalg.norm(right, axis=1, keepdims=True)
+    up: ndarray = np.cross(forward_unit, right)
+
+    # ring[e, i]: the offset from the axis at angle 2*pi*i/slices, so the
+    # slice i runs from ring[:, i] to ring[:, i + 1]  (edges, slices+1, 3)
+    angles: ndarray = 2.0 * math.pi * np.arange(slices + 1) / slices
+    ring: ndarray = radius * (
+        np.cos(angles)[None, :, None] * right[:, None, :]
+        + np.sin(angles)[None, :, None] * up[:, None, :]
+    )
+    p0: ndarray = np.broadcast_to(points[:, None, 0], (len(points), slices, 3))
+    p1: ndarray = np.broadcast_to(points[:, None, 1], (len(points), slices, 3))
+    b0, b1 = p0 + ring[:, :-1], p0 + ring[:, 1:]
+    t0, t1 = p1 + ring[:, :-1], p1 + ring[:, 1:]
+    # fmt: off
+    triangles: ndarray = np.stack(
+        [
+            # Cylinder side -- two triangles per slice
+            b0, b1, t1,
+            b0, t1, t0,
             # Bottom cap (closes the p0 end)
-            verts += [float(p0[0]), float(p0[1]), float(p0[2])]
-            verts += [float(b1[0]), float(b1[1]), float(b1[2])]
-            verts += [float(b0[0]), float(b0[1]), float(b0[2])]
-
+            p0, b1, b0,
             # Top cap (closes the p1 end, opposite winding)
-            verts += [float(p1[0]), float(p1[1]), float(p1[2])]
-            verts += [float(t0[0]), float(t0[1]), float(t0[2])]
-            verts += [float(t1[0]), float(t1[1]), float(t1[2])]
-
-    return np.array(verts, dtype=np.float32)
+            p1, t0, t1,
+        ],
+        axis=2,
+    )
+    # fmt: on
+    mesh: ndarray = triangles.astype(np.float32).reshape(-1)
+    # shared by every caller with the same key
+    mesh.flags.writeable = False
+    return mesh
 
 
 def build_ndc_cube_cylinders(radius: float = 0.05, slices: int = 20) -> ndarray:
@@ -776,43 +1050,262 @@ def build_ndc_cube_vertices() -> ndarray:
 
 
 # ---------------------------------------------------------------------------
-# Per-frame uniform set.
+# Redundant GL state elimination.
 # ---------------------------------------------------------------------------
 
 
-def set_uniforms(u_m: int, u_v: int, u_p: int) -> None:
-    """Set current model/view/projection matrices on the bound program at
-    the given uniform locations.  Caller is responsible for ``glUseProgram``.
+@dataclass
+class GLStateCache:
+    """What this module last bound and set, so a call that would change
+    nothing is skipped.
+
+    A run of draws that share a program -- the three arrows and the sphere of
+    an axis, the ground then the cube -- would otherwise re-issue the same
+    ``glUseProgram``, ``glBindVertexArray`` and ``glUniform*`` for every
+    draw.  Each skipped call is counted in ``saved``.
+
+    Bindings are context state that imgui's renderer changes too, so
+    ``begin_frame`` forgets them: the first bind of a frame always goes to
+    GL.  Uniform values are per-program state that only these helpers
+    write, so they are remembered across frames, keyed by
+    ``(program, location)``.  The model matrix is remembered by identity
+    rather than value: the matrix-stack context and the model stack's
+    ``ms.get_version``.  Code that binds behind the cache's back must call
+    ``invalidate``.
+
+    All of it is state of one GL context, ``gl_context``; ``follow_context``
+    starts over when another is made current.
+    """
 
-    Note: ``glUniform*`` updates the program object's default-uniform-block
-    state -- it does not "upload" bytes to GPU memory the way
-    ``glBufferData`` does.  See
-    tasks/archive/2026/05/27/notes-uniform-terminology.md."""
-    GL.glUniformMatrix4fv(
-        u_m,
-        1,
-        GL.GL_TRUE,
-        np.ascontiguousarray(
-            ms.get_current_matrix(ms.MatrixStack.model), dtype=np.float32
-        ),
+    #: the context the cache describes, as given to ``follow_context``
+    gl_context: object = None
+    #: the bound program / VAO; ``None`` when unknown
+    program: Optional[int] = None
+    vao: Optional[int] = None
+    active_texture: Optional[int] = None
+    #: the texture bound per ``(unit, target)``
+    textures: dict[tuple[int, int], int] = field(default_factory=dict)
+    #: calls skipped so far this frame, and in the whole previous frame
+    saved: int = 0
+    saved_last_frame: int = 0
+    _uniforms: dict[tuple[int, int], tuple[float, ...]] = field(
+        default_factory=dict, repr=False
     )
-    GL.glUniformMatrix4fv(
-        u_v,
-        1,
-        GL.GL_TRUE,
-        np.ascontiguousarray(
-            ms.get_current_matrix(ms.MatrixStack.view), dtype=np.float32
-        ),
+    _matrices: dict[tuple[int, int], tuple[ms.MatrixStackContext, int]] = field(
+        default_factory=dict, repr=False
     )
-    GL.glUniformMatrix4fv(
-        u_p,
-        1,
-        GL.GL_TRUE,
-        np.ascontiguousarray(
-            ms.get_current_matrix(ms.MatrixStack.projection),
-            dtype=np.float32,
-        ),
+
+    def begin_frame(self) -> None:
+        """Close the previous frame's count and forget the bindings."""
+        self.saved_last_frame, self.saved = self.saved, 0
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Forget every binding, after GL was driven around the cache."""
+        self.program = None
+        self.vao = None
+        self.active_texture = None
+        self.textures.clear()
+
+    def reset(self) -> None:
+        """Forget everything, uniform values included (their programs are
+        gone -- see ``cleanup``)."""
+        self.invalidate()
+        self._uniforms.clear()
+        self._matrices.clear()
+        self.saved = self.saved_last_frame = 0
+
+    def use_program(self, program: int) -> None:
+        if program == self.program:
+            self.saved += 1
+            return
+        GL.glUseProgram(program)
+        self.program = program
+
+    def bind_vertex_array(self, vao: int) -> None:
+        if vao == self.vao:
+            self.saved += 1
+            return
+        GL.glBindVertexArray(vao)
+        self.vao = vao
+
+    def bind_texture(self, unit: int, target: GLenum, texture: int) -> None:
+        """Bind ``texture`` to ``target`` on texture unit ``unit`` (0, 1, ...),
+        skipping the ``glActiveTexture`` and the bind when already so."""
+        if self.textures.get((unit, int(target))) == texture:
+            self.saved += 1
+            return
+        if unit != self.active_texture:
+            GL.glActiveTexture(GL.GL_TEXTURE0 + unit)
+            self.active_texture = unit
+        else:
+            self.saved += 1
+        GL.glBindTexture(target, texture)
+        self.textures[(unit, int(target))] = texture
+
+    def _unchanged(self, location: int, value: tuple[float, ...]) -> bool:
+        """Whether the bound program's ``location`` already holds ``value``
+        (a location of -1 -- absent from the program -- always does);
+        records ``value`` otherwise."""
+        if location == -1:
+            self.saved += 1
+            return True
+        if self.program is None:  # unknown program: nothing to key on
+            return False
+        key = (self.program, location)
+        if self._uniforms.get(key) == value:
+            self.saved += 1
+            return True
+        self._uniforms[key] = value
+        return False
+
+    def uniform1f(self, location: int, x: float) -> None:
+        if not self._unchanged(location, (x,)):
+            GL.glUniform1f(location, x)
+
+    def uniform2f(self, location: int, x: float, y: float) -> None:
+        if not self._unchanged(location, (x, y)):
+            GL.glUniform2f(location, x, y)
+
+    def uniform3f(self, location: int, x: float, y: float, z: float) -> None:
+        if not self._unchanged(location, (x, y, z)):
+            GL.glUniform3f(location, x, y, z)
+
+    def uniform_model_matrix(self, location: int) -> None:
+        """Set the current model matrix at ``location`` unless the bound
+        program already holds this very matrix."""
+        if location == -1:
+            self.saved += 1
+            return
+        stamp = (ms.current_context(), ms.get_version(ms.MatrixStack.model))
+        if self.program is not None:
+            key = (self.program, location)
+            held = self._matrices.get(key)
+            if held is not None and held[0] is stamp[0] and held[1] == stamp[1]:
+                self.saved += 1
+                return
+            self._matrices[key] = stamp
+        GL.glUniformMatrix4fv(
+            location, 1, GL.GL_TRUE, ms.get_current_matrix(ms.MatrixStack.model)
+        )
+
+
+#: the cache every helper here, and ``cayley_gl``, binds and sets through
+gl_state = GLStateCache()
+
+
+# ---------------------------------------------------------------------------
+# Per-draw uniform set, and the shared camera uniform block.
+# ---------------------------------------------------------------------------
+
+#: The uniform-buffer binding point of the ``Camera`` block that
+#: ``build_pipeline`` wires every program to.
+CAMERA_BLOCK_BINDING: int = 0
+#: ``layout (std140, row_major) uniform Camera { mat4 vMatrix; mat4 pMatrix; }``
+#: -- two mat4s of 64 bytes each, with no padding between them under std140.
+CAMERA_BLOCK_SIZE: int = 2 * 16 * glfloat_size
+
+
+@dataclass
+class _CameraBlock:
+    """The uniform buffer behind the ``Camera`` block, and which view /
+    projection it holds: the matrix-stack context and the two stacks'
+    versions (``ms.get_version``) at the last upload.  The buffer is a name
+    in ``gl_context`` only."""
+
+    gl_context: object = None
+    ubo: int = 0
+    context: Optional[ms.MatrixStackContext] = None
+    versions: tuple[int, int] = (-1, -1)
+
+    def reset(self) -> None:
+        self.ubo, self.context, self.versions = 0, None, (-1, -1)
+
+
+_camera_block = _CameraBlock()
+
+
+def follow_context(gl_context: object) -> None:
+    """Tell the caches here that ``gl_context`` is now current.
+
+    ``gl_state`` and the camera block hold names and bindings that mean
+    something in one GL context only.  Whatever makes a context current
+    passes its handle here -- ``setup_window`` its GLFW window,
+    ``cayley_export`` its EGL context -- and when it is not the context the
+    caches were filled in, both are forgotten, so nothing left over from
+    the previous context is skipped or drawn into.  The old names are not
+    deleted; ``cleanup`` does that while their context is still current.
+    """
+    if gl_state.gl_context is not gl_context:
+        gl_state.reset()
+        gl_state.gl_context = gl_context
+    if _camera_block.gl_context is not gl_context:
+        _camera_block.reset()
+        _camera_block.gl_context = gl_context
+
+
+def upload_camera() -> None:
+    """Upload the current view and projection matrices to the ``Camera``
+    uniform buffer, unless it already holds them.
+
+    The demos set the camera once per frame and then draw many objects under
+    it, so the upload happens once per frame rather than once per draw.  The
+    block is declared ``row_major``, so the stacks' row-major float32 storage
+    is copied in as-is: no transpose and no temporary array.  The buffer is
+    created, and bound to ``CAMERA_BLOCK_BINDING``, on first use."""
+    context = ms.current_context()
+    versions = (
+        ms.get_version(ms.MatrixStack.view),
+        ms.get_version(ms.MatrixStack.projection),
+    )
+    if _camera_block.context is context and _camera_block.versions == versions:
+        return
+    if not _camera_block.ubo:
+        _camera_block.ubo = GL.glGenBuffers(1)
+        GL.glBindBuffer(GL.GL_UNIFORM_BUFFER, _camera_block.ubo)
+        GL.glBufferData(
+            GL.GL_UNIFORM_BUFFER, CAMERA_BLOCK_SIZE, None, GL.GL_DYNAMIC_DRAW
+        )
+        GL.glBindBufferBase(
+            GL.GL_UNIFORM_BUFFER, CAMERA_BLOCK_BINDING, _camera_block.ubo
+        )
+    GL.glBindBuffer(GL.GL_UNIFORM_BUFFER, _camera_block.ubo)
+    GL.glBufferSubData(
+        GL.GL_UNIFORM_BUFFER,
+        0,
+        CAMERA_BLOCK_SIZE // 2,
+        ms.get_current_matrix(ms.MatrixStack.view),
+    )
+    GL.glBufferSubData(
+        GL.GL_UNIFORM_BUFFER,
+        CAMERA_BLOCK_SIZE // 2,
+        CAMERA_BLOCK_SIZE // 2,
+        ms.get_current_matrix(ms.MatrixStack.projection),
     )
+    GL.glBindBuffer(GL.GL_UNIFORM_BUFFER, 0)
+    _camera_block.context, _camera_block.versions = context, versions
+
+
+def set_uniforms(u_m: int) -> None:
+    """Set the current model matrix on the bound program at ``u_m`` (through
+    ``gl_state``, so not again if it already holds it), and
+    bring the shared ``Camera`` block (view / projection) up to date with
+    ``upload_camera``.  Caller is responsible for ``glUseProgram``.
+
+    The model matrix goes straight from the matrix stack's own float32
+    storage, which ``get_current_matrix`` hands out without copying, so a
+    draw allocates nothing here.  (``-1``, as for the instanced pipelines
+    that carry their models per instance, is ignored by GL.)
+
+    Note: ``glUniform*`` updates the program object's default-uniform-block
+    state -- it does not "upload" bytes to GPU memory the way
+    ``glBufferData`` does.  See
+    tasks/archive/2026/05/27/notes-uniform-terminology.md.  The camera
+    block, by contrast, really is uploaded: it is a buffer object.
+    Timed as the CPU phase ``uniforms`` of ``profiler``."""
+    with profiler.phase("uniforms", gpu=False):
+        upload_camera()
+        gl_state.uniform_model_matrix(u_m)
 
 
 # ---------------------------------------------------------------------------
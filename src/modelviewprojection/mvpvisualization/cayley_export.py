@@ -0,0 +1,388 @@
+# Copyright (c) 2018-2026 William Emerison Six
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+
+"""Export a Cayley scene animation as a frame sequence, headless and parallel.
+
+The demos play a :class:`~cayleyscene.Scene` in real time in a GLFW window.
+:func:`export` renders the same animation offscreen instead: the frame range
+``0 .. Timeline.duration`` (sampled at ``rate``) is cut into one contiguous
+chunk per worker process, and each worker draws its chunk into its own EGL
+pbuffer -- Mesa llvmpipe works, so no display or GPU is needed (the same
+context ``ports/codetheclassics/_smoketest.py`` uses).  Every frame is read
+back and written straight to ``frame_NNNNNN.png`` in the output directory;
+pass ``video=`` to also encode the sequence, in order, with imageio's
+ffmpeg writer.
+
+Nothing GL-side can be pickled, so a worker rebuilds everything it draws
+with: ``scene()`` makes the :class:`~cayleyscene.Scene`, ``standard()``
+builds the :class:`~cayley_gl.StandardObjects` in the worker's context, and
+``draw(standard_objects, animation, time, width, height)`` draws one frame
+-- the demo's choreography, minus the imgui panels.  All three must be
+module-level callables (or ``functools.partial`` of one), so they pickle by
+name.  :func:`draw_placements` is the plain choreography most demos share.
+
+Run it as a module to export a scene factory::
+
+    python -m modelviewprojection.mvpvisualization.cayley_export \\
+        mypackage.scenes:model_scene /tmp/model --video /tmp/model.mp4
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import ctypes
+import dataclasses
+import importlib
+import multiprocessing
+import os
+import pathlib
+import typing
+
+import imageio.v2 as imageio
+import imageio.v3 as iio
+import numpy as np
+
+import modelviewprojection.matrix_stack as ms
+from modelviewprojection.cayley import cayleybake, cayleyscene
+
+if typing.TYPE_CHECKING:
+    from modelviewprojection.mvpvisualization import cayley_gl
+
+#: draws one frame: ``(standard_objects, animation, time, width, height)``
+Draw = typing.Callable[
+    ["cayley_gl.StandardObjects", cayleyscene.Animation, float, int, int],
+    None,
+]
+
+#: the shared shaders live next to ``_pipeline``, in this package
+SHADER_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def use_egl() -> None:
+    """Point PyOpenGL at EGL and Mesa at its surfaceless device.
+
+    PyOpenGL picks its platform once, when ``OpenGL`` is first imported, so
+    this runs before that: as the worker pool's initializer and first thing
+    in :func:`main`.  Importing this module leaves the environment alone, so
+    a GLFW program can import it and keep its GLX context.  Anything the
+    caller already set wins.
+    """
+    os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+    os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+
+
+@dataclasses.dataclass(frozen=True)
+class OffscreenContext:
+    """The EGL handles :func:`make_offscreen_context` made current."""
+
+    display: typing.Any
+    surface: typing.Any
+    context: typing.Any
+
+    def release(self) -> None:
+        """Make nothing current, destroy the surface and context, and let go
+        of the display."""
+        from OpenGL import EGL
+
+        EGL.eglMakeCurrent(
+            self.display,
+            EGL.EGL_NO_SURFACE,
+            EGL.EGL_NO_SURFACE,
+            EGL.EGL_NO_CONTEXT,
+        )
+        EGL.eglDestroySurface(self.display, self.surface)
+        EGL.eglDestroyContext(self.display, self.context)
+        EGL.eglTerminate(self.display)
+
+
+def make_offscreen_context(width: int, height: int) -> OffscreenContext:
+    """Make a 3.3-core EGL pbuffer context of ``width`` x ``height`` current,
+    set up like ``_pipeline.setup_window`` (clear color, depth test, and a
+    default VAO bound).  Call :meth:`OffscreenContext.release` on the result
+    when done with it."""
+    import OpenGL.GL as GL
+    from OpenGL import EGL
+
+    display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+    major, minor = ctypes.c_long(), ctypes.c_long()
+    if not EGL.eglInitialize(display, major, minor):
+        raise RuntimeError("eglInitialize failed (no EGL device?)")
+    EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+    config_attributes = (EGL.EGLint * 15)(
+        EGL.EGL_SURFACE_TYPE,
+        EGL.EGL_PBUFFER_BIT,
+        EGL.EGL_RENDERABLE_TYPE,
+        EGL.EGL_OPENGL_BIT,
+        EGL.EGL_RED_SIZE,
+        8,
+        EGL.EGL_GREEN_SIZE,
+        8,
+        EGL.EGL_BLUE_SIZE,
+        8,
+        EGL.EGL_ALPHA_SIZE,
+        8,
+        EGL.EGL_DEPTH_SIZE,
+        24,
+        EGL.EGL_NONE,
+    )
+    config, count = EGL.EGLConfig(), EGL.EGLint()
+    EGL.eglChooseConfig(
+        display, config_attributes, ctypes.byref(config), 1, ctypes.byref(count)
+    )
+    if count.value == 0:
+        raise RuntimeError("eglChooseConfig: no RGBA8 + depth24 pbuffer config")
+    context_attributes = (EGL.EGLint * 7)(
+        EGL.EGL_CONTEXT_MAJOR_VERSION,
+        3,
+        EGL.EGL_CONTEXT_MINOR_VERSION,
+        3,
+        EGL.EGL_CONTEXT_OPENGL_PROFILE_MASK,
+        EGL.EGL_CONTEXT_OPENGL_CORE_PROFILE_BIT,
+        EGL.EGL_NONE,
+    )
+    context = EGL.eglCreateContext(
+        display, config, EGL.EGL_NO_CONTEXT, context_attributes
+    )
+    surface_attributes = (EGL.EGLint * 5)(
+        EGL.EGL_WIDTH, width, EGL.EGL_HEIGHT, height, EGL.EGL_NONE
+    )
+    surface = EGL.eglCreatePbufferSurface(display, config, surface_attributes)
+    offscreen = OffscreenContext(display, surface, context)
+    if not EGL.eglMakeCurrent(display, surface, surface, context):
+        offscreen.release()
+        raise RuntimeError("eglMakeCurrent failed")
+    GL.glBindVertexArray(GL.glGenVertexArrays(1))
+    GL.glClearColor(13.0 / 255.0, 64.0 / 255.0, 5.0 / 255.0, 1.0)
+    GL.glClearDepth(1.0)
+    GL.glDepthFunc(GL.GL_LESS)
+    GL.glEnable(GL.GL_DEPTH_TEST)
+    return offscreen
+
+
+def read_pixels(width: int, height: int) -> np.ndarray:
+    """The current framebuffer as a top-down ``(height, width, 3)`` uint8
+    image (GL rows run bottom-up)."""
+    import OpenGL.GL as GL
+
+    GL.glPixelStorei(GL.GL_PACK_ALIGNMENT, 1)
+    pixels: np.ndarray = np.frombuffer(
+        GL.glReadPixels(0, 0, width, height, GL.GL_RGB, GL.GL_UNSIGNED_BYTE),
+        np.uint8,
+    ).reshape(height, width, 3)
+    return np.flipud(pixels)
+
+
+def draw_placements(
+    standard_objects: cayley_gl.StandardObjects,
+    animation: cayleyscene.Animation,
+    time: float,
+    width: int,
+    height: int,
+) -> None:
+    """The choreography the object-placement demos share, from the default
+    orbit camera: NDC cube, ground, the world axis (grayed once the first
+    placement arrives), then every coordinate frame's axis while it is being
+    built and its geometry once built, the axes batched into instanced draws.
+    A placement's ``geometry`` names one of ``standard_objects.meshes``."""
+    from modelviewprojection.mvpvisualization import cayley_gl
+
+    cayley_gl.setup_orbit_view(cayley_gl.make_camera(), width, height)
+    with standard_objects.batched_axes():
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
+        standard_objects.draw_cube()
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
+        standard_objects.draw_ground()
+        placements = animation.scene.coordinate_frames
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
+        standard_objects.draw_axis(
+            grayed=bool(placements)
+            and time >= animation.timeline.arrival_time(placements[0].space)
+        )
+        for placement in placements:
+            space = placement.space
+            m = animation.transform_matrix(space, time)
+            ms.set_current_matrix(ms.MatrixStack.model, m)
+            if animation.axis_visible(space, time):
+                standard_objects.draw_axis()
+            elif (
+                placement.grayed_axis_after_built
+                and animation.geometry_visible(space, time)
+            ):
+                standard_objects.draw_axis(grayed=True)
+            if placement.geometry in standard_objects.meshes and (
+                animation.geometry_visible(space, time)
+            ):
+                ms.set_current_matrix(ms.MatrixStack.model, m)
+                standard_objects.draw_mesh(placement.geometry)
+
+
+def build_standard() -> cayley_gl.StandardObjects:
+    """The default ``standard`` for :func:`export`: the standard objects with
+    the shaders in :data:`SHADER_DIR`."""
+    from modelviewprojection.mvpvisualization import cayley_gl
+
+    return cayley_gl.build_standard(shader_dir=SHADER_DIR)
+
+
+def frame_path(directory: str | os.PathLike[str], frame: int) -> pathlib.Path:
+    """Where :func:`export` writes ``frame``."""
+    return pathlib.Path(directory) / f"frame_{frame:06d}.png"
+
+
+def _chunks(frames: int, workers: int) -> typing.List[range]:
+    """``range(frames)`` cut into at most ``workers`` contiguous, near-equal
+    chunks, so each worker walks its slice of the timeline in order.
+
+    >>> _chunks(10, 3)
+    [range(0, 3), range(3, 6), range(6, 10)]
+    >>> _chunks(2, 4)
+    [range(0, 1), range(1, 2)]
+    """
+    count: int = max(1, min(workers, frames))
+    bounds = [frames * index // count for index in range(count + 1)]
+    return [
+        range(start, stop)
+        for start, stop in zip(bounds, bounds[1:])
+        if stop > start
+    ]
+
+
+def _render_chunk(
+    scene: typing.Callable[[], cayleyscene.Scene],
+    standard: typing.Callable[[], cayley_gl.StandardObjects],
+    draw: Draw,
+    frames: range,
+    rate: float,
+    width: int,
+    height: int,
+    directory: str,
+) -> int:
+    """Worker task: one chunk of frames, in a fresh offscreen context.
+    Returns how many frames it wrote."""
+    import OpenGL.GL as GL
+
+    from modelviewprojection.mvpvisualization import _pipeline as _p
+
+    offscreen = make_offscreen_context(width, height)
+    _p.follow_context(offscreen.context)
+    try:
+        animation = cayleyscene.Animation(scene())
+        standard_objects = standard()
+        for frame in frames:
+            GL.glViewport(0, 0, width, height)
+            GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)  # ty: ignore[unsupported-operator]
+            draw(standard_objects, animation, frame / rate, width, height)
+            iio.imwrite(
+                frame_path(directory, frame), read_pixels(width, height)
+            )
+    finally:
+        # the chunk's names go with its context, not into the next chunk's
+        _p.cleanup()
+        offscreen.release()
+    return len(frames)
+
+
+def export(
+    scene: typing.Callable[[], cayleyscene.Scene],
+    directory: str | os.PathLike[str],
+    draw: Draw = draw_placements,
+    standard: typing.Callable[[], cayley_gl.StandardObjects] = build_standard,
+    rate: float = cayleybake.DEFAULT_BAKE_RATE,
+    width: int = 1280,
+    height: int = 720,
+    workers: typing.Optional[int] = None,
+    video: str | os.PathLike[str] | None = None,
+) -> int:
+    """Render the animation of ``scene()`` at ``rate`` frames per second
+    into ``directory`` as PNGs, across ``workers`` processes (``None``: one
+    per CPU), and encode ``video`` from them if given.  Returns the frame
+    count.
+
+    Frame ``i`` shows time ``i / rate``, from 0 up to the timeline's
+    ``duration``; as in :func:`cayleybake.bake`, the last frame lands on
+    ``duration`` only when ``duration * rate`` is whole, so the frames stay
+    evenly spaced for the video.
+
+    The workers switch PyOpenGL to EGL before they import ``OpenGL``; a
+    script whose own top level imports it (spawn re-imports ``__main__`` in
+    every worker) calls :func:`use_egl` before that import."""
+    if rate <= 0.0:
+        raise ValueError(f"export: rate must be positive, got {rate}")
+    duration: float = cayleyscene.Animation(scene()).timeline.duration
+    frames: int = int(duration * rate) + 1
+    os.makedirs(directory, exist_ok=True)
+    chunks = _chunks(frames, workers or os.cpu_count() or 1)
+    # spawn, not fork: every worker needs its own fresh GL/EGL state
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=len(chunks),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=use_egl,
+    ) as pool:
+        futures = [
+            pool.submit(
+                _render_chunk,
+                scene,
+                standard,
+                draw,
+                chunk,
+                rate,
+                width,
+                height,
+                os.fspath(directory),
+            )
+            for chunk in chunks
+        ]
+        # result() re-raises a worker's error here, in the parent
+        written: int = sum(future.result() for future in futures)
+    if video is not None:
+        # one frame in memory at a time, however long the animation
+        with imageio.get_writer(video, fps=rate) as writer:
+            for frame in range(written):
+                writer.append_data(iio.imread(frame_path(directory, frame)))
+    return written
+
+
+def _resolve(spec: str) -> typing.Any:
+    """``"package.module:name"`` -> that module-level object."""
+    module, _, name = spec.partition(":")
+    if not name:
+        raise ValueError(f"_resolve: expected module:name, got {spec!r}")
+    return getattr(importlib.import_module(module), name)
+
+
+def main() -> None:
+    use_egl()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scene", help="module:callable returning a Scene")
+    parser.add_argument("directory", help="where the PNG frames go")
+    parser.add_argument(
+        "--draw",
+        help="module:callable drawing one frame (default: draw_placements)",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=cayleybake.DEFAULT_BAKE_RATE
+    )
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--video", help="also encode the frames to this file")
+    args = parser.parse_args()
+    export(
+        _resolve(args.scene),
+        args.directory,
+        draw=draw_placements if args.draw is None else _resolve(args.draw),
+        rate=args.rate,
+        width=args.width,
+        height=args.height,
+        workers=args.workers,
+        video=args.video,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,7 @@ policy; this is the dissolution.
 
 from __future__ import annotations
 
+import contextlib
 import dataclasses
 import math
 import typing
@@ -38,6 +39,8 @@ from imgui_bundle import imgui, imgui_ctx  # noqa: F401  (re-exported for demos)
 import modelviewprojection.matrix_stack as ms
 from modelviewprojection.cayley import cayleyscene
 from modelviewprojection.mvpvisualization import _pipeline as _p
+from modelviewprojection.mvpvisualization.profiling import Profiler, profiler
+from modelviewprojection.util.framepacer import PHASES, FramePacer
 
 if typing.TYPE_CHECKING:
     # glfw's stubs type every window parameter as `_GLFWwindowPointerT`.  The
@@ -191,16 +194,59 @@ VertexCount = int
 #: out as `typing.Tuple[int, int]` at every use.
 Mesh = tuple[GLHandle, VertexCount]
 #: A mesh whose vertex data is re-uploaded at runtime, so its VBO is kept too.
+#: The VBO is allocated once, at the mesh's full size, and rewritten in place.
 #: Was `typing.Optional[typing.Tuple[int, int, int]]` with a `# vao,n,vbo`
 #: comment doing the work this name now does.
 MutableMesh = tuple[GLHandle, VertexCount, GLHandle]
+#: A mesh drawn instanced: its VAO, vertex count, and the VBO its per-instance
+#: model matrices + colours are re-uploaded into each frame.
+InstancedMesh = tuple[GLHandle, VertexCount, GLHandle]
+
+# The three arrows of an axis are the one +Y arrow mesh turned by the model
+# rotations draw_axis applies -- rotate_z(-90) for X, rotate_y(90) then
+# rotate_z(90) for Z, none for Y -- in draw_axis's order, with their colours.
+# fmt: off
+_ARROW_TURNS: np.ndarray = np.array(
+    [
+        [[0.0, 1.0, 0.0, 0.0],
+         [-1.0, 0.0, 0.0, 0.0],
+         [0.0, 0.0, 1.0, 0.0],
+         [0.0, 0.0, 0.0, 1.0]],
+        [[0.0, 0.0, 1.0, 0.0],
+         [1.0, 0.0, 0.0, 0.0],
+         [0.0, 1.0, 0.0, 0.0],
+         [0.0, 0.0, 0.0, 1.0]],
+        np.identity(4),
+    ]
+)
+# fmt: on
+_ARROW_COLORS: np.ndarray = np.array(
+    [[1.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, 1.0, 0.0]]
+)
+_SPHERE_COLOR: np.ndarray = np.array([1.0, 1.0, 1.0])
+_GRAYED_COLOR: np.ndarray = np.array([0.5, 0.5, 0.5])
+
+
+def _instances(
+    models: np.ndarray, colors: np.ndarray, out: np.ndarray
+) -> np.ndarray:
+    """Pack ``(N, 4, 4)`` row-major model matrices and ``(N, 3)`` colours
+    into ``out``'s first ``N`` rows, as ``make_instanced_lines_vao`` lays an
+    instance out: each matrix transposed (a ``mat4`` attribute is read
+    column by column and has no transpose flag), then its colour."""
+    count: int = len(models)
+    out[:count, :16] = models.transpose(0, 2, 1).reshape(count, 16)
+    out[:count, 16:] = colors
+    return out[:count]
 
 
 @dataclasses.dataclass
 class StandardObjects:
     """The standard pipelines + meshes for a Cayley demo, plus draw helpers.
     Each ``draw_*`` reads the current model matrix (set by the caller via
-    ``ms.set_current_matrix(ms.MatrixStack.model, ...)``)."""
+    ``ms.set_current_matrix(ms.MatrixStack.model, ...)``).  They bind and set
+    uniforms through ``_p.gl_state``, so consecutive draws sharing a program
+    or mesh skip the calls that would change nothing."""
 
     triangle_pipeline: _p.Pipeline
     ground_pipeline: _p.Pipeline
@@ -217,64 +263,74 @@ class StandardObjects:
     rect_prism: typing.Optional[RectangularPrism] = None
     volume_pipeline: _p.Pipeline | None = None
     volume_geo: MutableMesh | None = None
+    #: the instanced axis path (see :meth:`batched_axes`)
+    instanced_axis_pipeline: _p.Pipeline | None = None
+    instanced_axis: InstancedMesh | None = None
+    instanced_sphere: InstancedMesh | None = None
+    #: the axes ``draw_axis`` queued inside :meth:`batched_axes`, as (model
+    #: matrix, grayed); ``None`` outside it, where ``draw_axis`` draws at once
+    _queued_axes: list[tuple[np.ndarray, bool]] | None = None
+    #: staging for the view volume's re-uploads (:meth:`rebuild_frustum`)
+    _volume_staging: np.ndarray = dataclasses.field(
+        default_factory=lambda: np.empty(VOLUME_FLOATS, np.float32)
+    )
+    #: staging for the instance uploads, grown as needed and reused
+    _instance_staging: np.ndarray = dataclasses.field(
+        default_factory=lambda: np.empty(
+            (0, _p.floats_per_instance), np.float32
+        )
+    )
 
     def _anim(self, p: _p.Pipeline, time: float | None = None) -> None:
         if p.u_fov != -1:  # perspective squash reads fov/aspect/near/far
-            GL.glUniform1f(p.u_fov, PIPELINE_FOV)
-            GL.glUniform1f(p.u_aspect, PIPELINE_ASPECT)
+            _p.gl_state.uniform1f(p.u_fov, PIPELINE_FOV)
+            _p.gl_state.uniform1f(p.u_aspect, PIPELINE_ASPECT)
             volume = (
                 self.frustum if self.frustum is not None else self.rect_prism
             )
             if volume is not None:
-                GL.glUniform1f(p.u_near, volume.near_z)
-                GL.glUniform1f(p.u_far, volume.far_z)
+                _p.gl_state.uniform1f(p.u_near, volume.near_z)
+                _p.gl_state.uniform1f(p.u_far, volume.far_z)
         # u_time is INDEPENDENT of u_fov: the ortho / modelview2d squash shaders
         # use only `time` (their fov/near/far are optimized out, so u_fov ==
         # -1). Gating time on u_fov used to silently disable those squashes.
         # Axes pass time=None so they hold at 0 and never squash.
         if time is not None and p.u_time != -1:
-            GL.glUniform1f(p.u_time, time)
+            _p.gl_state.uniform1f(p.u_time, time)
 
     def draw_mesh(self, name: str, time: float = 0.0) -> None:
         vao, n = self.meshes[name]
-        GL.glUseProgram(self.triangle_pipeline.program)
-        GL.glBindVertexArray(vao)
-        _p.set_uniforms(
-            self.triangle_pipeline.u_m,
-            self.triangle_pipeline.u_v,
-            self.triangle_pipeline.u_p,
-        )
+        _p.gl_state.use_program(self.triangle_pipeline.program)
+        _p.gl_state.bind_vertex_array(vao)
+        _p.set_uniforms(self.triangle_pipeline.u_m)
         self._anim(self.triangle_pipeline, time)
         GL.glDrawArrays(GL.GL_TRIANGLES, 0, n)
 
     def draw_ground(self) -> None:
         vao, n = self.ground
-        GL.glUseProgram(self.ground_pipeline.program)
-        GL.glBindVertexArray(vao)
-        GL.glUniform3f(self.ground_pipeline.u_color, 0.1, 0.1, 0.1)
-        _p.set_uniforms(
-            self.ground_pipeline.u_m,
-            self.ground_pipeline.u_v,
-            self.ground_pipeline.u_p,
-        )
+        _p.gl_state.use_program(self.ground_pipeline.program)
+        _p.gl_state.bind_vertex_array(vao)
+        _p.gl_state.uniform3f(self.ground_pipeline.u_color, 0.1, 0.1, 0.1)
+        _p.set_uniforms(self.ground_pipeline.u_m)
         GL.glDrawArrays(GL.GL_TRIANGLES, 0, n)
 
     def _emit_axis(self, r: float, g: float, b: float, grayed: bool) -> None:
-        GL.glUniform3f(
+        _p.gl_state.uniform3f(
             self.axis_pipeline.u_color,
             *((0.5, 0.5, 0.5) if grayed else (r, g, b)),
         )
-        _p.set_uniforms(
-            self.axis_pipeline.u_m,
-            self.axis_pipeline.u_v,
-            self.axis_pipeline.u_p,
-        )
+        _p.set_uniforms(self.axis_pipeline.u_m)
         self._anim(self.axis_pipeline)  # no time -> axes never squash
         GL.glDrawArrays(GL.GL_TRIANGLES, 0, self.axis[1])
 
     def draw_axis(self, grayed: bool = False) -> None:
-        GL.glUseProgram(self.axis_pipeline.program)
-        GL.glBindVertexArray(self.axis[0])
+        if self._queued_axes is not None:  # inside batched_axes(): defer
+            self._queued_axes.append(
+                (ms.get_current_matrix(ms.MatrixStack.model).copy(), grayed)
+            )
+            return
+        _p.gl_state.use_program(self.axis_pipeline.program)
+        _p.gl_state.bind_vertex_array(self.axis[0])
         with ms.push_matrix(ms.MatrixStack.model):
             with ms.push_matrix(ms.MatrixStack.model):
                 ms.rotate_z(ms.MatrixStack.model, math.radians(-90.0))
@@ -284,29 +340,90 @@ class StandardObjects:
                 ms.rotate_z(ms.MatrixStack.model, math.radians(90.0))
                 self._emit_axis(0.0, 0.0, 1.0, grayed)
             self._emit_axis(0.0, 1.0, 0.0, grayed)
-            GL.glBindVertexArray(self.sphere[0])
-            GL.glUniform3f(
+            _p.gl_state.bind_vertex_array(self.sphere[0])
+            _p.gl_state.uniform3f(
                 self.axis_pipeline.u_color,
                 *((0.5, 0.5, 0.5) if grayed else (1.0, 1.0, 1.0)),
             )
-            _p.set_uniforms(
-                self.axis_pipeline.u_m,
-                self.axis_pipeline.u_v,
-                self.axis_pipeline.u_p,
-            )
+            _p.set_uniforms(self.axis_pipeline.u_m)
             self._anim(self.axis_pipeline)
             GL.glDrawArrays(GL.GL_TRIANGLES, 0, self.sphere[1])
 
+    @contextlib.contextmanager
+    def batched_axes(self) -> typing.Iterator[None]:
+        """Within the block, ``draw_axis`` only records the current model
+        matrix and ``grayed``; on leaving it, every recorded axis is drawn by
+        :meth:`draw_axes` -- two instanced draws in all, however many frames
+        the scene has.  The view and projection must stay put inside the
+        block: the axes are drawn with those current on exit.
+
+        Blocks nest: an inner block draws its own axes when it exits, and
+        ``draw_axis`` queues for the outer block again after it."""
+        outer, self._queued_axes = self._queued_axes, []
+        try:
+            yield
+        finally:
+            queued, self._queued_axes = self._queued_axes, outer
+        if queued:
+            self.draw_axes(
+                np.array([model for model, _grayed in queued]),
+                np.array([grayed for _model, grayed in queued]),
+            )
+
+    def draw_axes(self, models: np.ndarray, grayed: np.ndarray) -> None:
+        """Draw one axis per ``(N, 4, 4)`` model matrix, grayed where the
+        ``(N,)`` ``grayed`` is true: the 3N arrows in one
+        ``glDrawArraysInstanced`` and the N origin spheres in another."""
+        assert self.instanced_axis_pipeline is not None
+        assert self.instanced_axis is not None
+        assert self.instanced_sphere is not None
+        count: int = len(models)
+        if count == 0:
+            return
+        if len(self._instance_staging) < 3 * count:
+            self._instance_staging = np.empty(
+                (3 * count, _p.floats_per_instance), np.float32
+            )
+        grayed = np.asarray(grayed, dtype=bool)
+        p = self.instanced_axis_pipeline
+        _p.gl_state.use_program(p.program)
+        _p.set_uniforms(p.u_m)
+        self._anim(p)  # no time -> axes never squash
+        self._draw_instances(
+            self.instanced_axis,
+            (models[:, np.newaxis] @ _ARROW_TURNS).reshape(-1, 4, 4),
+            np.where(
+                grayed[:, np.newaxis, np.newaxis], _GRAYED_COLOR, _ARROW_COLORS
+            ).reshape(-1, 3),
+        )
+        self._draw_instances(
+            self.instanced_sphere,
+            models,
+            np.where(grayed[:, np.newaxis], _GRAYED_COLOR, _SPHERE_COLOR),
+        )
+
+    def _draw_instances(
+        self, mesh: InstancedMesh, models: np.ndarray, colors: np.ndarray
+    ) -> None:
+        vao, n, instance_vbo = mesh
+        instances = _instances(models, colors, self._instance_staging)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, instance_vbo)
+        # a fresh store each frame: the driver orphans the old one instead of
+        # stalling on the previous frame's draw (and glBufferData copies, so
+        # the staging rows are free again when it returns)
+        GL.glBufferData(
+            GL.GL_ARRAY_BUFFER, instances.nbytes, instances, GL.GL_STREAM_DRAW
+        )
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+        _p.gl_state.bind_vertex_array(vao)
+        GL.glDrawArraysInstanced(GL.GL_TRIANGLES, 0, n, len(instances))
+
     def draw_cube(self) -> None:
         vao, n = self.cube
-        GL.glUseProgram(self.cube_pipeline.program)
-        GL.glBindVertexArray(vao)
-        GL.glUniform3f(self.cube_pipeline.u_color, 1.0, 1.0, 1.0)
-        _p.set_uniforms(
-            self.cube_pipeline.u_m,
-            self.cube_pipeline.u_v,
-            self.cube_pipeline.u_p,
-        )
+        _p.gl_state.use_program(self.cube_pipeline.program)
+        _p.gl_state.bind_vertex_array(vao)
+        _p.gl_state.uniform3f(self.cube_pipeline.u_color, 1.0, 1.0, 1.0)
+        _p.set_uniforms(self.cube_pipeline.u_m)
         GL.glDrawArrays(GL.GL_TRIANGLES, 0, n)
 
     def _draw_volume(
@@ -314,13 +431,13 @@ class StandardObjects:
     ) -> None:
         assert self.volume_geo is not None
         vao, n, _vbo = self.volume_geo
-        GL.glUseProgram(p.program)
-        GL.glBindVertexArray(vao)
-        GL.glUniform3f(p.u_color, 1.0, 1.0, 1.0)
-        _p.set_uniforms(p.u_m, p.u_v, p.u_p)
-        GL.glUniform1f(p.u_time, time)
-        GL.glUniform1f(p.u_thickness, thickness)
-        GL.glUniform2f(p.u_viewport, w, h)
+        _p.gl_state.use_program(p.program)
+        _p.gl_state.bind_vertex_array(vao)
+        _p.gl_state.uniform3f(p.u_color, 1.0, 1.0, 1.0)
+        _p.set_uniforms(p.u_m)
+        _p.gl_state.uniform1f(p.u_time, time)
+        _p.gl_state.uniform1f(p.u_thickness, thickness)
+        _p.gl_state.uniform2f(p.u_viewport, w, h)
         GL.glDrawArrays(GL.GL_LINES, 0, n)
 
     def draw_frustum(
@@ -331,11 +448,11 @@ class StandardObjects:
         assert self.volume_pipeline is not None
         assert self.frustum is not None
         p = self.volume_pipeline
-        GL.glUseProgram(p.program)
-        GL.glUniform1f(p.u_fov, self.frustum.field_of_view)
-        GL.glUniform1f(p.u_aspect, self.frustum.aspect_ratio)
-        GL.glUniform1f(p.u_near, self.frustum.near_z)
-        GL.glUniform1f(p.u_far, self.frustum.far_z)
+        _p.gl_state.use_program(p.program)
+        _p.gl_state.uniform1f(p.u_fov, self.frustum.field_of_view)
+        _p.gl_state.uniform1f(p.u_aspect, self.frustum.aspect_ratio)
+        _p.gl_state.uniform1f(p.u_near, self.frustum.near_z)
+        _p.gl_state.uniform1f(p.u_far, self.frustum.far_z)
         self._draw_volume(p, time, thickness, w, h)
 
     def draw_rect_prism(
@@ -348,28 +465,28 @@ class StandardObjects:
         assert self.volume_pipeline is not None
         assert self.rect_prism is not None
         p = self.volume_pipeline
-        GL.glUseProgram(p.program)
-        GL.glUniform1f(p.u_fov, PIPELINE_FOV)
-        GL.glUniform1f(p.u_aspect, PIPELINE_ASPECT)
-        GL.glUniform1f(p.u_near, self.rect_prism.near_z)
-        GL.glUniform1f(p.u_far, self.rect_prism.far_z)
+        _p.gl_state.use_program(p.program)
+        _p.gl_state.uniform1f(p.u_fov, PIPELINE_FOV)
+        _p.gl_state.uniform1f(p.u_aspect, PIPELINE_ASPECT)
+        _p.gl_state.uniform1f(p.u_near, self.rect_prism.near_z)
+        _p.gl_state.uniform1f(p.u_far, self.rect_prism.far_z)
         self._draw_volume(p, time, thickness, w, h)
 
     def rebuild_frustum(self) -> None:
         """Re-upload the perspective frustum edges after its FOV/aspect/near/far
         changed (the ortho prism has no sliders, so it never needs a
-        rebuild)."""
+        rebuild).
+
+        A volume always has the same 24 vertices, so this rewrites the VBO
+        ``build_standard`` allocated in place -- one 288-byte
+        ``glBufferSubData`` from a reused staging array -- rather than asking
+        for new storage on every slider step."""
         assert self.frustum is not None
         assert self.volume_geo is not None
-        verts = frustum_lines(self.frustum)
+        verts = frustum_lines(self.frustum, out=self._volume_staging)
         _vao, _n, vbo = self.volume_geo
         GL.glBindBuffer(GL.GL_ARRAY_BUFFER, vbo)
-        GL.glBufferData(
-            GL.GL_ARRAY_BUFFER,
-            _p.glfloat_size * verts.size,
-            verts,
-            GL.GL_STATIC_DRAW,
-        )
+        GL.glBufferSubData(GL.GL_ARRAY_BUFFER, 0, verts.nbytes, verts)
         GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
 
 
@@ -409,12 +526,22 @@ def build_standard(
         anim=animated,
         project=proj,
     )
+    instanced_axis_p = _p.build_pipeline(
+        "instanced_color.vert",
+        "passthrough.frag",
+        shader_dir=shader_dir,
+        anim=animated,
+        instanced=True,
+        project=proj,
+    )
     cube_p = _p.build_pipeline(
         "uniform_color.vert",
         "passthrough.frag",
         shader_dir=shader_dir,
         color=True,
     )
+    axis_vertices = _p.build_axis_arrow_solid()
+    sphere_vertices = _p.build_origin_sphere_solid()
     meshes = {
         "paddle1": _p.make_triangle_vao(
             _p.paddle_vertices,
@@ -450,17 +577,26 @@ def build_standard(
         ground=_p.make_lines_vao(
             _p.build_ground_cylinders(), ground_p.attr_position
         ),
-        axis=_p.make_lines_vao(
-            _p.build_axis_arrow_solid(), axis_p.attr_position
-        ),
-        sphere=_p.make_lines_vao(
-            _p.build_origin_sphere_solid(), axis_p.attr_position
-        ),
+        axis=_p.make_lines_vao(axis_vertices, axis_p.attr_position),
+        sphere=_p.make_lines_vao(sphere_vertices, axis_p.attr_position),
         cube=_p.make_lines_vao(
             _p.build_ndc_cube_cylinders(), cube_p.attr_position
         ),
         frustum=frustum,
         rect_prism=rect_prism,
+        instanced_axis_pipeline=instanced_axis_p,
+        instanced_axis=_p.make_instanced_lines_vao(
+            axis_vertices,
+            instanced_axis_p.attr_position,
+            instanced_axis_p.attr_instance_model,
+            instanced_axis_p.attr_instance_color,
+        ),
+        instanced_sphere=_p.make_instanced_lines_vao(
+            sphere_vertices,
+            instanced_axis_p.attr_position,
+            instanced_axis_p.attr_instance_model,
+            instanced_axis_p.attr_instance_color,
+        ),
     )
     volume = frustum if frustum is not None else rect_prism
     if volume is not None:
@@ -627,6 +763,51 @@ def common_key(
         toggle_fullscreen(window, state)
 
 
+def frame_times_menu(pacer: FramePacer) -> None:
+    """A "Frame Times" menu listing the pacer's p50 / p95 / p99 per phase, in
+    milliseconds, and how many redundant GL calls ``_p.gl_state`` skipped in
+    the last frame.  Call inside a ``begin_main_menu_bar`` block."""
+    if imgui.begin_menu("Frame Times"):
+        stats = pacer.percentiles()
+        imgui.text(f"target {pacer.target_framerate:g} fps, ms:")
+        for phase in (*PHASES, "frame"):
+            p = stats[phase]
+            imgui.text(
+                f"{phase:>6}  p50 {p['p50']:6.2f}  p95 {p['p95']:6.2f}  "
+                f"p99 {p['p99']:6.2f}"
+            )
+        imgui.separator()
+        imgui.text(
+            f"GL calls skipped last frame: {_p.gl_state.saved_last_frame}"
+        )
+        imgui.end_menu()
+
+
+def profiler_menu(profiler: Profiler) -> None:
+    """A "Profiler" menu: show / hide the per-phase breakdown window (which
+    profiles only while shown), and export the recorded frames as a Chrome
+    trace.  Call inside a ``begin_main_menu_bar`` block."""
+    if imgui.begin_menu("Profiler"):
+        _clicked, profiler.enabled = imgui.menu_item(
+            "Show phase breakdown", "", profiler.enabled
+        )
+        if imgui.menu_item(
+            "Export Chrome trace", "", False, bool(profiler.frames)
+        )[0]:
+            profiler.write_chrome_trace()
+        imgui.text_disabled(profiler.trace_path)
+        imgui.end_menu()
+
+
+def instrument_animation(animation: cayleyscene.Animation) -> None:
+    """Time ``animation``'s ``transform_matrix`` and
+    ``inverse_transform_matrix`` with ``profiler``, so the animation math
+    shows as its own phases under ``scene`` in the Profiler window."""
+    profiler.instrument(
+        animation, "transform_matrix", "inverse_transform_matrix"
+    )
+
+
 # ---------------------------------------------------------------------------
 # Loop runner (generic timing/poll/menubar/swap; the body is the demo's).
 # ---------------------------------------------------------------------------
@@ -644,30 +825,70 @@ def run_loop(
     menu bar each frame; ``frame(w, h)`` draws the scene + any floating panels.
     ``on_key`` (if given) is installed as the GLFW key callback AFTER the
     GlfwRenderer, so it wins -- imgui then gets no key events, which is fine for
-    these mouse-driven menus."""
+    these mouse-driven menus.
+
+    A :class:`FramePacer` holds the loop to ``target_framerate`` by sleeping,
+    and times each frame: ``cpu`` is input + the imgui frame, ``render`` the
+    scene and imgui draws, ``swap`` the buffer swap.  Their percentiles are
+    appended to the demo's menu bar as "Frame Times", and written as JSON
+    on exit when ``$MVP_FRAME_STATS`` names a file.
+
+    The loop's own phases -- ``input``, ``scene`` (``frame``), ``imgui`` and
+    ``swap`` -- are timed by ``profiler``, along with any the demo marks
+    inside ``frame``; its "Profiler" menu follows "Frame Times"."""
     if on_key is not None:
         glfw.set_key_callback(window, on_key)
-    t_prev = glfw.get_time()
+    pacer = FramePacer(target_framerate=target_framerate)
     while not glfw.window_should_close(window):
-        while glfw.get_time() < t_prev + 1.0 / target_framerate:
-            pass
-        t_prev = glfw.get_time()
-        glfw.poll_events()
-        impl.process_inputs()
-        imgui.new_frame()
-        if menubar is not None:
-            menubar()
-        w, h = glfw.get_framebuffer_size(window)
-        GL.glViewport(0, 0, w, h)
-        GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)  # ty: ignore[unsupported-operator]
-        frame(w, h)
-        imgui.render()
-        impl.render(imgui.get_draw_data())
-        glfw.swap_buffers(window)
+        pacer.begin_frame()
+        profiler.begin_frame()
+        # imgui's renderer rebinds programs / VAOs / textures behind the cache
+        _p.gl_state.begin_frame()
+        with profiler.phase("input", gpu=False):
+            glfw.poll_events()
+            impl.process_inputs()
+            imgui.new_frame()
+            if menubar is not None:
+                menubar()
+                # a second begin_main_menu_bar appends to the demo's bar
+                if imgui.begin_main_menu_bar():
+                    frame_times_menu(pacer)
+                    profiler_menu(profiler)
+                    imgui.end_main_menu_bar()
+        pacer.end_cpu()
+        with profiler.phase("scene"):
+            w, h = glfw.get_framebuffer_size(window)
+            GL.glViewport(0, 0, w, h)
+            GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)  # ty: ignore[unsupported-operator]
+            frame(w, h)
+        profiler.draw_window()
+        with profiler.phase("imgui"):
+            imgui.render()
+            impl.render(imgui.get_draw_data())
+        pacer.end_render()
+        with profiler.phase("swap", gpu=False):
+            glfw.swap_buffers(window)
+        profiler.end_frame()
+        pacer.end_frame()
+    pacer.write_stats()
     _p.cleanup()
     glfw.terminate()
 
 
+# The 12 edges of a view volume as pairs of corner indices.  Corners 0-3 are
+# the front face's left-top, right-top, right-bottom, left-bottom; 4-7 the
+# back face's, in the same order.
+# fmt: off
+_VOLUME_EDGE_CORNERS: np.ndarray = np.array(
+    [0, 1, 1, 2, 2, 3, 3, 0,   # front face
+     4, 5, 5, 6, 6, 7, 7, 4,   # back face
+     0, 4, 1, 5, 3, 7, 2, 6]   # front-to-back
+)
+# fmt: on
+#: floats in a view volume's GL_LINES vertex array (24 vertices)
+VOLUME_FLOATS: int = len(_VOLUME_EDGE_CORNERS) * _p.floats_per_vertex
+
+
 def _volume_edges(
     n: float,
     fa: float,
@@ -679,40 +900,47 @@ def _volume_edges(
     brr: float,
     btt: float,
     bb: float,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """The 12 edges of a view volume (front face at z=n, back at z=fa) as a flat
     GL_LINES vertex array.  Shared by the frustum and the rectangular prism --
-    they differ only in whether the front/back cross sections match."""
-    edges = [
-        ((fl, ftt, n), (frr, ftt, n)),
-        ((frr, ftt, n), (frr, fb, n)),
-        ((frr, fb, n), (fl, fb, n)),
-        ((fl, fb, n), (fl, ftt, n)),
-        ((bl, btt, fa), (brr, btt, fa)),
-        ((brr, btt, fa), (brr, bb, fa)),
-        ((brr, bb, fa), (bl, bb, fa)),
-        ((bl, bb, fa), (bl, btt, fa)),
-        ((fl, ftt, n), (bl, btt, fa)),
-        ((frr, ftt, n), (brr, btt, fa)),
-        ((fl, fb, n), (bl, bb, fa)),
-        ((frr, fb, n), (brr, bb, fa)),
-    ]
-    verts: list = []
-    for p0, p1 in edges:
-        verts += [float(p0[0]), float(p0[1]), float(p0[2])]
-        verts += [float(p1[0]), float(p1[1]), float(p1[2])]
-    return np.array(verts, dtype=np.float32)
+    they differ only in whether the front/back cross sections match.  Written
+    into ``out`` (``VOLUME_FLOATS`` float32) when given, so a volume being
+    dragged around re-fills one array instead of allocating."""
+    if out is None:
+        out = np.empty(VOLUME_FLOATS, np.float32)
+    corners = np.array(
+        [
+            [fl, ftt, n],
+            [frr, ftt, n],
+            [frr, fb, n],
+            [fl, fb, n],
+            [bl, btt, fa],
+            [brr, btt, fa],
+            [brr, bb, fa],
+            [bl, bb, fa],
+        ],
+        dtype=np.float32,
+    )
+    np.take(corners, _VOLUME_EDGE_CORNERS, axis=0, out=out.reshape(-1, 3))
+    return out
 
 
-def frustum_lines(f: Frustum) -> np.ndarray:
+def frustum_lines(f: Frustum, out: np.ndarray | None = None) -> np.ndarray:
     """The perspective frustum outline: corners scale with -z by tan(fov/2), so
-    the back face is larger than the front."""
+    the back face is larger than the front.  See :func:`_volume_edges` for
+    ``out``.
+
+    >>> lines = frustum_lines(Frustum(90.0, 2.0, -1.0, -3.0))
+    >>> lines.reshape(-1, 3)[:2].round(6).tolist()  # front top edge
+    [[-2.0, 1.0, -1.0], [2.0, 1.0, -1.0]]
+    """
     ft = -f.near_z * math.tan(math.radians(f.field_of_view) / 2.0)
     fr_ = ft * f.aspect_ratio
     bt = -f.far_z * math.tan(math.radians(f.field_of_view) / 2.0)
     br = bt * f.aspect_ratio
     return _volume_edges(
-        f.near_z, f.far_z, -fr_, fr_, ft, -ft, -br, br, bt, -bt
+        f.near_z, f.far_z, -fr_, fr_, ft, -ft, -br, br, bt, -bt, out=out
     )
 
 
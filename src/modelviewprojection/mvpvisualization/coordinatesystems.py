@@ -238,18 +238,19 @@ def frame(w: int, h: int) -> None:
         )
 
     # world reference: NDC cube + ground + world axis
-    ms.set_to_identity_matrix(ms.MatrixStack.model)
-    standard_objects.draw_cube()
-    ms.set_to_identity_matrix(ms.MatrixStack.model)
-    standard_objects.draw_ground()
-    ms.set_to_identity_matrix(ms.MatrixStack.model)
-    standard_objects.draw_axis()
-
-    for space, mesh in DRAW:
-        ms.set_current_matrix(ms.MatrixStack.model, frame_of(space))
-        standard_objects.draw_mesh(mesh)
-        ms.set_current_matrix(ms.MatrixStack.model, frame_of(space))
+    with standard_objects.batched_axes():
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
+        standard_objects.draw_cube()
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
+        standard_objects.draw_ground()
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
         standard_objects.draw_axis()
 
+        for space, mesh in DRAW:
+            ms.set_current_matrix(ms.MatrixStack.model, frame_of(space))
+            standard_objects.draw_mesh(mesh)
+            ms.set_current_matrix(ms.MatrixStack.model, frame_of(space))
+            standard_objects.draw_axis()
+
 
 cayley_gl.run_loop(window, impl, frame, imgui_menubar, on_key)
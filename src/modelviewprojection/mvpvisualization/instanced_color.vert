@@ -0,0 +1,55 @@
+// Copyright (c) 2018-2026 William Emerison Six
+//
+// This program is free software; you can redistribute it and/or
+// modify it under the terms of the GNU General Public License
+// as published by the Free Software Foundation; either version 2
+// of the License, or (at your option) any later version.
+//
+// This program is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License
+// along with this program; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place - Suite 330,
+// Boston, MA 02111-1307, USA.
+
+#version 330 core
+
+// Instanced twin of uniform_color.vert, for the coordinate-axis arrows and
+// origin spheres: one glDrawArraysInstanced draws every axis in the frame.
+// The model matrix and the colour that uniform_color.vert reads from the
+// `mMatrix` / `color` uniforms arrive here per instance, as vertex attributes
+// (a mat4 attribute takes four consecutive locations, one per column).
+//
+// project() is appended at compile time, exactly as for uniform_color.vert.
+
+layout (location = 0) in vec3 position;
+layout (location = 1) in mat4 instance_model;
+layout (location = 5) in vec3 instance_color;
+
+// view + projection: one uniform buffer shared by every program, uploaded
+// once per frame (_pipeline.upload_camera).  row_major, so the matrix stack's
+// row-major storage goes in without a transpose.
+layout (std140, row_major) uniform Camera {
+  mat4 vMatrix;
+  mat4 pMatrix;
+};
+uniform float field_of_view;
+uniform float aspect_ratio;
+uniform float near_z;
+uniform float far_z;
+uniform float time;
+
+out VS_OUT {
+  vec4 color;
+} vs_out;
+
+vec4 project(vec4 cameraSpace);
+
+void main()
+{
+  gl_Position = pMatrix * vMatrix * project(instance_model * vec4(position, 1.0));
+  vs_out.color = vec4(instance_color, 1.0);
+}
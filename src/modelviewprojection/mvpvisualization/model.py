@@ -100,6 +100,7 @@ scene = cayleyscene.Scene(
     ],
 )
 animation = cayleyscene.Animation(scene)
+cayley_gl.instrument_animation(animation)
 # node -> mesh name
 DRAW = {
     Space.paddle1: "paddle1",
@@ -230,23 +231,24 @@ def frame(w: int, h: int) -> None:
     cayley_gl.setup_orbit_view(camera, w, h)
 
     # --- draw choreography (this demo's policy, incl. graying) ---
-    ms.set_to_identity_matrix(ms.MatrixStack.model)
-    standard_objects.draw_cube()
-    ms.set_to_identity_matrix(ms.MatrixStack.model)
-    standard_objects.draw_ground()
-    ms.set_to_identity_matrix(ms.MatrixStack.model)
-    standard_objects.draw_axis(
-        grayed=t >= animation.timeline.arrival_time(Space.paddle1)
-    )
+    with standard_objects.batched_axes():
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
+        standard_objects.draw_cube()
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
+        standard_objects.draw_ground()
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
+        standard_objects.draw_axis(
+            grayed=t >= animation.timeline.arrival_time(Space.paddle1)
+        )
 
-    for space, mesh in DRAW.items():
-        m = cayleyscene.to_matrix(animation.transform(space, t))
-        ms.set_current_matrix(ms.MatrixStack.model, m)
-        if animation.axis_visible(space, t):
-            standard_objects.draw_axis()
-        if animation.geometry_visible(space, t):
+        for space, mesh in DRAW.items():
+            m = animation.transform_matrix(space, t)
             ms.set_current_matrix(ms.MatrixStack.model, m)
-            standard_objects.draw_mesh(mesh)
+            if animation.axis_visible(space, t):
+                standard_objects.draw_axis()
+            if animation.geometry_visible(space, t):
+                ms.set_current_matrix(ms.MatrixStack.model, m)
+                standard_objects.draw_mesh(mesh)
 
 
 cayley_gl.run_loop(window, impl, frame, imgui_menubar, on_key)
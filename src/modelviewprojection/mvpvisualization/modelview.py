@@ -128,6 +128,7 @@ scene = cayleyscene.Scene(
     ],
 )
 animation = cayleyscene.Animation(scene)
+cayley_gl.instrument_animation(animation)
 DRAW = {
     Space.paddle1: "paddle1",
     Space.square: "square",
@@ -260,36 +261,37 @@ def frame(w: int, h: int) -> None:
     cayley_gl.setup_orbit_view(camera, w, h)
 
     # world reference: NDC cube + ground (un-morphed)
-    ms.set_to_identity_matrix(ms.MatrixStack.model)
-    standard_objects.draw_cube()
-    ms.set_to_identity_matrix(ms.MatrixStack.model)
-    standard_objects.draw_ground()
-
-    morph = cayleyscene.to_matrix(animation.inverse_transform(t))
-
-    # the camera, drawn as an object (axis + its NDC cube; no frustum here)
-    if t >= animation.timeline.arrival_time(Space.camera):
-        ms.set_current_matrix(
-            ms.MatrixStack.model,
-            morph @ cayleyscene.to_matrix(animation.transform(Space.camera, t)),
-        )
-        standard_objects.draw_axis()
+    with standard_objects.batched_axes():
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
         standard_objects.draw_cube()
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
+        standard_objects.draw_ground()
 
-    # world axis: bright at the start and during the two pauses, else grayed
-    # (matches the original modelview reveal).
-    bright = t < 5.0 or (35.0 < t < 40.0) or (50.0 < t < 55.0)
-    ms.set_current_matrix(ms.MatrixStack.model, morph)
-    standard_objects.draw_axis(grayed=not bright)
+        morph = animation.inverse_transform_matrix(t)
 
-    for space, mesh in DRAW.items():
-        m = morph @ cayleyscene.to_matrix(animation.transform(space, t))
-        ms.set_current_matrix(ms.MatrixStack.model, m)
-        if animation.axis_visible(space, t):
+        # the camera, drawn as an object (axis + its NDC cube; no frustum here)
+        if t >= animation.timeline.arrival_time(Space.camera):
+            ms.set_current_matrix(
+                ms.MatrixStack.model,
+                morph @ animation.transform_matrix(Space.camera, t),
+            )
             standard_objects.draw_axis()
-        if animation.geometry_visible(space, t):
+            standard_objects.draw_cube()
+
+        # world axis: bright at the start and during the two pauses, else grayed
+        # (matches the original modelview reveal).
+        bright = t < 5.0 or (35.0 < t < 40.0) or (50.0 < t < 55.0)
+        ms.set_current_matrix(ms.MatrixStack.model, morph)
+        standard_objects.draw_axis(grayed=not bright)
+
+        for space, mesh in DRAW.items():
+            m = morph @ animation.transform_matrix(space, t)
             ms.set_current_matrix(ms.MatrixStack.model, m)
-            standard_objects.draw_mesh(mesh)
+            if animation.axis_visible(space, t):
+                standard_objects.draw_axis()
+            if animation.geometry_visible(space, t):
+                ms.set_current_matrix(ms.MatrixStack.model, m)
+                standard_objects.draw_mesh(mesh)
 
 
 cayley_gl.run_loop(window, impl, frame, imgui_menubar, on_key)
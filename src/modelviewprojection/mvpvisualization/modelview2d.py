@@ -138,6 +138,7 @@ scene = cayleyscene.Scene(
     ],
 )
 animation = cayleyscene.Animation(scene)
+cayley_gl.instrument_animation(animation)
 DRAW = {
     Space.paddle1: "paddle1",
     Space.square: "square",
@@ -332,7 +333,7 @@ def frame(w: int, h: int) -> None:
     )
     GL.glDisable(GL.GL_DEPTH_TEST)  # flat 2D -> painter order
     lw = state["line_width"]
-    morph = cayleyscene.to_matrix(animation.inverse_transform(t))
+    morph = animation.inverse_transform_matrix(t)
 
     # persistent reference: the ±1 NDC square + the world graph paper
     # (un-morphed)
@@ -344,9 +345,7 @@ def frame(w: int, h: int) -> None:
     # the virtual camera, drawn as an object: its graph paper + axis + the view
     # volume (±10 prism), which the squash scales by 1/10 onto the NDC square.
     if t >= animation.timeline.arrival_time(Space.camera):
-        base = morph @ cayleyscene.to_matrix(
-            animation.transform(Space.camera, t)
-        )
+        base = morph @ animation.transform_matrix(Space.camera, t)
         ms.set_current_matrix(ms.MatrixStack.model, base @ GROUND_ROT)
         standard_objects.draw_ground()
         ms.set_current_matrix(ms.MatrixStack.model, base)
@@ -363,7 +362,7 @@ def frame(w: int, h: int) -> None:
     # each frame: while building -> its local graph paper + axis; once built ->
     # its geometry (the mesh squashes with the animation).
     for space, mesh in DRAW.items():
-        m = morph @ cayleyscene.to_matrix(animation.transform(space, t))
+        m = morph @ animation.transform_matrix(space, t)
         if animation.axis_visible(space, t):
             ms.set_current_matrix(ms.MatrixStack.model, m @ GROUND_ROT)
             standard_objects.draw_ground()
@@ -131,6 +131,7 @@ scene = cayleyscene.Scene(
     ],
 )
 animation = cayleyscene.Animation(scene)
+cayley_gl.instrument_animation(animation)
 controls = cayleyscene.CameraControls(
     translate_step=camera_edge.steps[0],
     rot_y_step=camera_edge.steps[1],
@@ -368,46 +369,48 @@ def frame(w: int, h: int) -> None:
         window, imguiio, camera, state["mouse"]
     )
     cayley_gl.setup_orbit_view(camera, w, h)
-    morph = cayleyscene.to_matrix(animation.inverse_transform(t))
+    morph = animation.inverse_transform_matrix(t)
     if state["center_on"]:
-        frm = morph @ cayleyscene.to_matrix(
-            animation.transform(state["center_on"], t)
-        )
+        frm = morph @ animation.transform_matrix(state["center_on"], t)
         ms.multiply(ms.MatrixStack.view, np.linalg.inv(frm))
 
     # world reference: NDC cube + ground (un-morphed)
-    ms.set_to_identity_matrix(ms.MatrixStack.model)
-    standard_objects.draw_cube()
-    ms.set_to_identity_matrix(ms.MatrixStack.model)
-    standard_objects.draw_ground()
-
-    # the camera, drawn as an object: its rectangular-prism view volume + axes
-    # + NDC cube
-    if t >= animation.timeline.arrival_time(Space.camera):
-        ms.set_current_matrix(
-            ms.MatrixStack.model,
-            morph @ cayleyscene.to_matrix(animation.transform(Space.camera, t)),
-        )
-        ry = animation.timeline.arrival_time(Space.camera) + scene.step_duration
-        if t >= ry:
-            standard_objects.draw_rect_prism(t, state["line_width"], w, h)
-        standard_objects.draw_axis()
+    with standard_objects.batched_axes():
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
         standard_objects.draw_cube()
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
+        standard_objects.draw_ground()
+
+        # the camera, drawn as an object: its rectangular-prism view volume +
+        # axes + NDC cube
+        if t >= animation.timeline.arrival_time(Space.camera):
+            ms.set_current_matrix(
+                ms.MatrixStack.model,
+                morph @ animation.transform_matrix(Space.camera, t),
+            )
+            ry = (
+                animation.timeline.arrival_time(Space.camera)
+                + scene.step_duration
+            )
+            if t >= ry:
+                standard_objects.draw_rect_prism(t, state["line_width"], w, h)
+            standard_objects.draw_axis()
+            standard_objects.draw_cube()
 
-    # world axis: bright before paddle1 builds, grayed after
-    ms.set_current_matrix(ms.MatrixStack.model, morph)
-    standard_objects.draw_axis(
-        grayed=t >= animation.timeline.arrival_time(Space.paddle1)
-    )
+        # world axis: bright before paddle1 builds, grayed after
+        ms.set_current_matrix(ms.MatrixStack.model, morph)
+        standard_objects.draw_axis(
+            grayed=t >= animation.timeline.arrival_time(Space.paddle1)
+        )
 
-    for space, mesh in DRAW.items():
-        m = morph @ cayleyscene.to_matrix(animation.transform(space, t))
-        ms.set_current_matrix(ms.MatrixStack.model, m)
-        if animation.axis_visible(space, t):
-            standard_objects.draw_axis()
-        if animation.geometry_visible(space, t):
+        for space, mesh in DRAW.items():
+            m = morph @ animation.transform_matrix(space, t)
             ms.set_current_matrix(ms.MatrixStack.model, m)
-            standard_objects.draw_mesh(mesh, t)
+            if animation.axis_visible(space, t):
+                standard_objects.draw_axis()
+            if animation.geometry_visible(space, t):
+                ms.set_current_matrix(ms.MatrixStack.model, m)
+                standard_objects.draw_mesh(mesh, t)
 
 
 cayley_gl.run_loop(window, impl, frame, imgui_menubar, on_key)
@@ -143,6 +143,7 @@ scene = cayleyscene.Scene(
     end_dwell=5.0,
 )
 animation = cayleyscene.Animation(scene)
+cayley_gl.instrument_animation(animation)
 controls = cayleyscene.CameraControls(
     translate_step=camera_edge.steps[0],
     rot_y_step=camera_edge.steps[1],
@@ -405,16 +406,14 @@ def frame(w: int, h: int) -> None:
     )
     cayley_gl.setup_orbit_view(camera, w, h)
 
-    inv = cayleyscene.to_matrix(animation.inverse_transform(t))
+    inv = animation.inverse_transform_matrix(t)
 
     # Center AND ORIENT the view on the entity's drawn frame (inv @ placement):
     # view = orbit @ inverse(frame), so the entity sits at the orbit center
     # axis-aligned (for the camera, you see from its orientation) and you orbit
     # around its own frame -- not just translate to its position.
     if state["center_on"]:
-        frame = inv @ cayleyscene.to_matrix(
-            animation.transform(state["center_on"], t)
-        )
+        frame = inv @ animation.transform_matrix(state["center_on"], t)
         ms.multiply(ms.MatrixStack.view, np.linalg.inv(frame))
 
     # world reference (un-morphed), with layered depth clears
@@ -426,34 +425,38 @@ def frame(w: int, h: int) -> None:
     GL.glClear(GL.GL_DEPTH_BUFFER_BIT)
 
     # the camera, drawn as an object (with its own ground/frustum/axis/cube)
-    if t >= animation.timeline.arrival_time(Space.camera):
-        ms.set_current_matrix(
-            ms.MatrixStack.model,
-            inv @ cayleyscene.to_matrix(animation.transform(Space.camera, t)),
+    with standard_objects.batched_axes():
+        if t >= animation.timeline.arrival_time(Space.camera):
+            ms.set_current_matrix(
+                ms.MatrixStack.model,
+                inv @ animation.transform_matrix(Space.camera, t),
+            )
+            standard_objects.draw_ground()
+            GL.glClear(GL.GL_DEPTH_BUFFER_BIT)
+            ry = (
+                animation.timeline.arrival_time(Space.camera)
+                + scene.step_duration
+            )
+            if t >= ry:
+                standard_objects.draw_frustum(t, state["line_width"], w, h)
+            standard_objects.draw_axis()
+            standard_objects.draw_cube()
+
+        # world axis: bright before paddle1 builds, grayed after
+        ms.set_current_matrix(ms.MatrixStack.model, inv)
+        standard_objects.draw_axis(
+            grayed=t >= animation.timeline.arrival_time(Space.paddle1)
         )
-        standard_objects.draw_ground()
-        GL.glClear(GL.GL_DEPTH_BUFFER_BIT)
-        ry = animation.timeline.arrival_time(Space.camera) + scene.step_duration
-        if t >= ry:
-            standard_objects.draw_frustum(t, state["line_width"], w, h)
-        standard_objects.draw_axis()
-        standard_objects.draw_cube()
-
-    # world axis: bright before paddle1 builds, grayed after
-    ms.set_current_matrix(ms.MatrixStack.model, inv)
-    standard_objects.draw_axis(
-        grayed=t >= animation.timeline.arrival_time(Space.paddle1)
-    )
 
-    # the object-placement tree (camera skipped -- drawn above)
-    for space, mesh in DRAW.items():
-        m = inv @ cayleyscene.to_matrix(animation.transform(space, t))
-        ms.set_current_matrix(ms.MatrixStack.model, m)
-        if animation.axis_visible(space, t):
-            standard_objects.draw_axis()
-        if animation.geometry_visible(space, t):
+        # the object-placement tree (camera skipped -- drawn above)
+        for space, mesh in DRAW.items():
+            m = inv @ animation.transform_matrix(space, t)
             ms.set_current_matrix(ms.MatrixStack.model, m)
-            standard_objects.draw_mesh(mesh, t)
+            if animation.axis_visible(space, t):
+                standard_objects.draw_axis()
+            if animation.geometry_visible(space, t):
+                ms.set_current_matrix(ms.MatrixStack.model, m)
+                standard_objects.draw_mesh(mesh, t)
 
 
 cayley_gl.run_loop(window, impl, frame, imgui_menubar, on_key)
@@ -31,8 +31,13 @@ layout (location = 0) in vec3 position;
 layout (location = 1) in vec3 color_in;
 
 uniform mat4 mMatrix;
-uniform mat4 vMatrix;
-uniform mat4 pMatrix;
+// view + projection: one uniform buffer shared by every program, uploaded
+// once per frame (_pipeline.upload_camera).  row_major, so the matrix stack's
+// row-major storage goes in without a transpose.
+layout (std140, row_major) uniform Camera {
+  mat4 vMatrix;
+  mat4 pMatrix;
+};
 uniform float field_of_view;
 uniform float aspect_ratio;
 uniform float near_z;
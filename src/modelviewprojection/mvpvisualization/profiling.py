@@ -0,0 +1,421 @@
+# Copyright (c) 2018-2026 William Emerison Six
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+
+"""Per-phase CPU and GPU timing for the Cayley demos.
+
+The :class:`~modelviewprojection.util.framepacer.FramePacer` says how long a
+frame took; this says where the time went -- animation math, uniform
+setting, the GL draws, imgui -- down to nested phases::
+
+    with profiler.phase("scene"):
+        with profiler.phase("uniforms", gpu=False):
+            ...
+
+Each phase is timed on the CPU with ``time.perf_counter_ns``, and, unless
+``gpu=False``, on the GPU with a pair of ``GL_TIMESTAMP`` queries around it.
+(Timestamps rather than ``GL_TIME_ELAPSED``: only one elapsed-time query may
+be active at once, so those cannot nest.)  Reading a query's result before
+the GPU has got there blocks, so the queries are double-buffered: frame N
+issues into one set while frame N-1's set is still in flight, and a set is
+read back only when it is reused two frames later -- by then the GPU is
+done with it, and if it somehow is not, that frame's GPU times are dropped
+rather than waited for.
+
+The last ``history`` frames are kept; :meth:`Profiler.breakdown` averages
+them per phase, :meth:`Profiler.draw_window` shows that as a flame-style
+imgui window (each phase a bar as wide as its share of the frame, under its
+parent), and :meth:`Profiler.write_chrome_trace` writes them in the Chrome
+trace event format, for ``chrome://tracing`` or https://ui.perfetto.dev.
+
+A disabled profiler (the default) costs one attribute test per phase; it is
+switched on and off from the "Profiler" menu ``cayley_gl.run_loop`` adds to
+the menu bar, and a change takes effect at the next frame.
+
+>>> ticks = iter(range(0, 10_000_000, 1_000_000))
+>>> p = Profiler(enabled=True, gpu=False, clock=lambda: next(ticks))
+>>> p.begin_frame()
+>>> with p.phase("scene"):
+...     with p.phase("animation"):
+...         pass
+>>> p.end_frame()
+>>> [(s.path, s.cpu_ms) for s in p.breakdown()]
+[(('scene',), 3.0), (('scene', 'animation'), 1.0)]
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import dataclasses
+import functools
+import json
+import os
+import time
+import typing
+
+import numpy as np
+import OpenGL.GL as GL
+from imgui_bundle import imgui
+
+#: queries added to a double-buffer set each time it runs out
+QUERY_BATCH: int = 32
+
+# what ``Profiler.phase`` hands back while profiling is off
+_NO_PHASE: contextlib.nullcontext[None] = contextlib.nullcontext()
+
+
+@dataclasses.dataclass
+class Span:
+    """One timed run of a phase.  Times are nanoseconds; ``depth`` counts
+    the phases it ran inside of."""
+
+    name: str
+    depth: int
+    start_ns: int
+    end_ns: int = 0
+    #: GPU timestamp at the start, and GPU duration, once the queries are
+    #: read back; ``None`` for CPU-only phases, or until then
+    gpu_start_ns: typing.Optional[int] = None
+    gpu_ns: typing.Optional[int] = None
+    # indices into the frame's query set, until they are read back
+    _queries: typing.Optional[typing.Tuple[int, int]] = dataclasses.field(
+        default=None, repr=False
+    )
+
+    @property
+    def cpu_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+
+@dataclasses.dataclass
+class PhaseStats:
+    """A phase's mean cost per frame over the profiler's history."""
+
+    #: the names of the phases it ran inside of, then its own
+    path: typing.Tuple[str, ...]
+    cpu_ms: float
+    #: ``None`` when no GPU time has been read back for it
+    gpu_ms: typing.Optional[float]
+    #: runs per frame
+    calls: float
+
+    @property
+    def depth(self) -> int:
+        return len(self.path) - 1
+
+
+@dataclasses.dataclass
+class Profiler:
+    """Times named phases of each frame; see the module docstring.
+
+    Call :meth:`begin_frame` and :meth:`end_frame` around each frame and
+    :meth:`phase` around the work inside it.  Phases outside a frame are
+    not recorded.
+    """
+
+    enabled: bool = False
+    #: issue GPU timestamp queries (needs a current GL context)
+    gpu: bool = True
+    #: how many of the most recent frames are kept
+    history: int = 120
+    #: where :meth:`write_chrome_trace` writes by default
+    trace_path: str = dataclasses.field(
+        default_factory=lambda: os.environ.get("MVP_TRACE") or "mvp_trace.json"
+    )
+    clock: typing.Callable[[], int] = time.perf_counter_ns
+    frames: typing.Deque[typing.List[Span]] = dataclasses.field(init=False)
+    # ``enabled`` as it was at ``begin_frame``, so a toggle mid-frame
+    # cannot leave a phase half recorded
+    _active: bool = dataclasses.field(init=False, default=False, repr=False)
+    _frame: typing.List[Span] = dataclasses.field(
+        init=False, default_factory=list, repr=False
+    )
+    _depth: int = dataclasses.field(init=False, default=0, repr=False)
+    _frame_index: int = dataclasses.field(init=False, default=0, repr=False)
+    # the two query sets, frame N using set N % 2, and the frame that last
+    # issued into each, still to be read back
+    _query_sets: typing.List[typing.List[int]] = dataclasses.field(
+        init=False, default_factory=lambda: [[], []], repr=False
+    )
+    _queries_used: int = dataclasses.field(init=False, default=0, repr=False)
+    _in_flight: typing.List[typing.Optional[typing.List[Span]]] = (
+        dataclasses.field(
+            init=False, default_factory=lambda: [None, None], repr=False
+        )
+    )
+
+    def __post_init__(self) -> None:
+        self.frames = collections.deque(maxlen=self.history)
+
+    # --- recording ----------------------------------------------------------
+
+    def begin_frame(self) -> None:
+        """Start recording a frame (if ``enabled``), first reading back the
+        GPU times of the frame two before it."""
+        self._active = self.enabled
+        if not self._active:
+            return
+        self._frame = []
+        self._depth = 0
+        current: int = self._frame_index % 2
+        in_flight = self._in_flight[current]
+        if in_flight is not None:
+            self._read_back(self._query_sets[current], in_flight)
+            self._in_flight[current] = None
+        self._queries_used = 0
+
+    def end_frame(self) -> None:
+        """Finish the frame and add it to ``frames``."""
+        if not self._active:
+            return
+        self._active = False
+        self.frames.append(self._frame)
+        if any(span._queries is not None for span in self._frame):
+            self._in_flight[self._frame_index % 2] = self._frame
+        self._frame_index += 1
+
+    def phase(self, name: str, gpu: bool = True) -> typing.ContextManager[None]:
+        """Time the ``with`` block as the phase ``name``, on the GPU too
+        unless ``gpu`` is false -- pass ``gpu=False`` for pure-Python work,
+        where the queries would only measure nothing."""
+        if not self._active:
+            return _NO_PHASE
+        return self._span(name, gpu and self.gpu)
+
+    @contextlib.contextmanager
+    def _span(self, name: str, gpu: bool) -> typing.Iterator[None]:
+        span = Span(name, self._depth, self.clock())
+        self._frame.append(span)
+        first: int = self._timestamp() if gpu else -1
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if gpu:
+                span._queries = (first, self._timestamp())
+            span.end_ns = self.clock()
+
+    def instrument(self, obj: typing.Any, *methods: str) -> None:
+        """Time each of ``obj``'s ``methods`` as a CPU phase of the same
+        name, by shadowing it with a timed wrapper on the instance -- for
+        code the demos call but do not own, e.g. ``Animation``'s
+        ``transform_matrix``."""
+        for name in methods:
+            method = getattr(obj, name)
+
+            @functools.wraps(method)
+            def timed(
+                *args: typing.Any,
+                _method: typing.Callable[..., typing.Any] = method,
+                _name: str = name,
+                **kwargs: typing.Any,
+            ) -> typing.Any:
+                with self.phase(_name, gpu=False):
+                    return _method(*args, **kwargs)
+
+            setattr(obj, name, timed)
+
+    # --- GPU queries --------------------------------------------------------
+
+    def _timestamp(self) -> int:
+        """Record a GPU timestamp into the next query of this frame's set,
+        growing the set if needed; returns the query's index in it."""
+        queries: typing.List[int] = self._query_sets[self._frame_index % 2]
+        if self._queries_used == len(queries):
+            queries.extend(int(q) for q in GL.glGenQueries(QUERY_BATCH))
+        index: int = self._queries_used
+        self._queries_used += 1
+        GL.glQueryCounter(queries[index], GL.GL_TIMESTAMP)
+        return index
+
+    def _read_back(
+        self, queries: typing.List[int], spans: typing.List[Span]
+    ) -> None:
+        """Fill in the GPU times of ``spans`` from ``queries`` -- unless the
+        last of them is not available yet (queries complete in order), in
+        which case they are dropped rather than waited for."""
+        issued = [span for span in spans if span._queries is not None]
+        value: np.ndarray = np.zeros(1, dtype=np.uint64)
+        last: int = max(
+            span._queries[1] for span in issued if span._queries is not None
+        )
+        GL.glGetQueryObjectui64v(
+            queries[last], GL.GL_QUERY_RESULT_AVAILABLE, value
+        )
+        ready: bool = bool(value[0])
+        for span in issued:
+            if ready and span._queries is not None:
+                stamps: typing.List[int] = []
+                for index in span._queries:
+                    GL.glGetQueryObjectui64v(
+                        queries[index], GL.GL_QUERY_RESULT, value
+                    )
+                    stamps.append(int(value[0]))
+                span.gpu_start_ns = stamps[0]
+                span.gpu_ns = stamps[1] - stamps[0]
+            span._queries = None
+
+    def release(self) -> None:
+        """Delete the GL query objects; call before the context goes."""
+        for queries in self._query_sets:
+            if queries:
+                GL.glDeleteQueries(len(queries), queries)
+            queries.clear()
+        self._in_flight = [None, None]
+
+    # --- reporting ----------------------------------------------------------
+
+    def breakdown(self) -> typing.List[PhaseStats]:
+        """Each phase's mean CPU (and GPU) milliseconds and runs per frame
+        over ``frames``, in tree order: every phase right after its parent,
+        siblings in the order they first ran."""
+        first_seen: typing.Dict[typing.Tuple[str, ...], int] = {}
+        cpu: typing.Dict[typing.Tuple[str, ...], int] = {}
+        gpu: typing.Dict[typing.Tuple[str, ...], int] = {}
+        calls: typing.Dict[typing.Tuple[str, ...], int] = {}
+        gpu_frames: int = 0
+        for spans in self.frames:
+            gpu_frames += any(s.gpu_ns is not None for s in spans)
+            names: typing.List[str] = []
+            for span in spans:
+                del names[span.depth :]
+                names.append(span.name)
+                path = tuple(names)
+                first_seen.setdefault(path, len(first_seen))
+                cpu[path] = cpu.get(path, 0) + span.cpu_ns
+                calls[path] = calls.get(path, 0) + 1
+                if span.gpu_ns is not None:
+                    gpu[path] = gpu.get(path, 0) + span.gpu_ns
+        n: int = max(len(self.frames), 1)
+
+        def tree_order(path: typing.Tuple[str, ...]) -> typing.Tuple[int, ...]:
+            return tuple(first_seen[path[: i + 1]] for i in range(len(path)))
+
+        return [
+            PhaseStats(
+                path=path,
+                cpu_ms=cpu[path] / n / 1e6,
+                gpu_ms=gpu[path] / gpu_frames / 1e6 if path in gpu else None,
+                calls=calls[path] / n,
+            )
+            for path in sorted(first_seen, key=tree_order)
+        ]
+
+    def chrome_trace(self) -> typing.Dict[str, typing.Any]:
+        """``frames`` as Chrome trace events: complete (``"X"``) events in
+        microseconds, CPU phases on one track and GPU phases on another.
+        The GPU clock is not the CPU's, so each frame's GPU track is lined
+        up to start when its first GPU phase started on the CPU."""
+        if not self.frames:
+            return {"traceEvents": []}
+        origin: int = self.frames[0][0].start_ns
+        events: typing.List[typing.Dict[str, typing.Any]] = [
+            {
+                "ph": "M",
+                "name": "thread_name",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in ((1, "CPU"), (2, "GPU"))
+        ]
+        for spans in self.frames:
+            gpu_offset: int = 0
+            for span in spans:
+                events.append(
+                    _trace_event(
+                        span.name, 1, span.start_ns - origin, span.cpu_ns
+                    )
+                )
+            for span in spans:
+                if span.gpu_start_ns is None or span.gpu_ns is None:
+                    continue
+                if not gpu_offset:
+                    gpu_offset = span.start_ns - span.gpu_start_ns
+                events.append(
+                    _trace_event(
+                        span.name,
+                        2,
+                        span.gpu_start_ns + gpu_offset - origin,
+                        span.gpu_ns,
+                    )
+                )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: typing.Optional[str] = None) -> str:
+        """Write :meth:`chrome_trace` as JSON to ``path`` (``trace_path`` by
+        default); returns the path written."""
+        path = path or self.trace_path
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+        return path
+
+    def draw_window(self) -> None:
+        """The flame-style breakdown as an imgui window, while ``enabled``;
+        closing the window disables the profiler.  Call between
+        ``imgui.new_frame`` and ``imgui.render``."""
+        if not self.enabled:
+            return
+        imgui.set_next_window_size((460, 0), imgui.Cond_.first_use_ever)
+        expanded, opened = imgui.begin("Profiler", True)
+        if expanded:
+            rows: typing.List[PhaseStats] = self.breakdown()
+            frame_ms: float = sum(r.cpu_ms for r in rows if r.depth == 0)
+            imgui.text(
+                f"mean of the last {len(self.frames)} frames: "
+                f"{frame_ms:.2f} ms CPU"
+            )
+            if imgui.button("Export Chrome trace"):
+                self.write_chrome_trace()
+            imgui.same_line()
+            imgui.text_disabled(self.trace_path)
+            imgui.separator()
+            for row in rows:
+                gpu: str = (
+                    f", gpu {row.gpu_ms:.2f}" if row.gpu_ms is not None else ""
+                )
+                imgui.set_cursor_pos_x(
+                    imgui.get_cursor_pos_x() + 12.0 * row.depth
+                )
+                imgui.progress_bar(
+                    row.cpu_ms / frame_ms if frame_ms > 0.0 else 0.0,
+                    (-1.0, 0.0),
+                    f"{row.path[-1]}  cpu {row.cpu_ms:.2f}{gpu} ms"
+                    f"  x{row.calls:g}",
+                )
+        imgui.end()
+        if not opened:
+            self.enabled = False
+
+
+def _trace_event(
+    name: str, tid: int, start_ns: int, duration_ns: int
+) -> typing.Dict[str, typing.Any]:
+    """A Chrome trace complete event; the format counts in microseconds."""
+    return {
+        "name": name,
+        "ph": "X",
+        "pid": 1,
+        "tid": tid,
+        "ts": start_ns / 1e3,
+        "dur": duration_ns / 1e3,
+    }
+
+
+#: the profiler ``cayley_gl.run_loop`` drives and draws
+profiler: Profiler = Profiler()
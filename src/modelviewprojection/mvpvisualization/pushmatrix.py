@@ -120,6 +120,7 @@ scene = cayleyscene.Scene(
     graph=graph, root=Space.world, coordinate_frames=coordinate_frames
 )
 animation = cayleyscene.Animation(scene)
+cayley_gl.instrument_animation(animation)
 GEOMETRY = {Space.paddle1: "paddle1"}
 GEOMETRY.update({_square(i): "square" for i in range(NUM_SQUARES)})
 
@@ -242,29 +243,31 @@ def frame(w: int, h: int) -> None:
     )
     cayley_gl.setup_orbit_view(camera, w, h)
 
-    ms.set_to_identity_matrix(ms.MatrixStack.model)
-    standard_objects.draw_cube()
-    ms.set_to_identity_matrix(ms.MatrixStack.model)
-    standard_objects.draw_ground()
-    ms.set_to_identity_matrix(ms.MatrixStack.model)
-    standard_objects.draw_axis(
-        grayed=t >= animation.timeline.arrival_time(Space.paddle1)
-    )
+    with standard_objects.batched_axes():
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
+        standard_objects.draw_cube()
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
+        standard_objects.draw_ground()
+        ms.set_to_identity_matrix(ms.MatrixStack.model)
+        standard_objects.draw_axis(
+            grayed=t >= animation.timeline.arrival_time(Space.paddle1)
+        )
 
-    for placement in scene.coordinate_frames:
-        space = placement.space
-        m = cayleyscene.to_matrix(animation.transform(space, t))
-        ms.set_current_matrix(ms.MatrixStack.model, m)
-        if animation.axis_visible(space, t):
-            standard_objects.draw_axis()  # bright while building
-        elif placement.grayed_axis_after_built and animation.geometry_visible(
-            space, t
-        ):
-            standard_objects.draw_axis(grayed=True)  # persistent marker
-        mesh = GEOMETRY.get(space)
-        if mesh is not None and animation.geometry_visible(space, t):
+        for placement in scene.coordinate_frames:
+            space = placement.space
+            m = animation.transform_matrix(space, t)
             ms.set_current_matrix(ms.MatrixStack.model, m)
-            standard_objects.draw_mesh(mesh)
+            if animation.axis_visible(space, t):
+                standard_objects.draw_axis()  # bright while building
+            elif (
+                placement.grayed_axis_after_built
+                and animation.geometry_visible(space, t)
+            ):
+                standard_objects.draw_axis(grayed=True)  # persistent marker
+            mesh = GEOMETRY.get(space)
+            if mesh is not None and animation.geometry_visible(space, t):
+                ms.set_current_matrix(ms.MatrixStack.model, m)
+                standard_objects.draw_mesh(mesh)
 
 
 cayley_gl.run_loop(window, impl, frame, imgui_menubar, on_key)
@@ -50,6 +50,7 @@
 
 import warnings
 
+import numpy as np
 from gacalc.g2 import e_1, e_2
 
 # %% [markdown]
@@ -189,4 +190,22 @@ fake_fb400.show_framebuffer()
 # screenspace starts with 0,0 in the bottom left; the upper
 # right is (width, height)
 
+# %% [markdown]
+# Drawing a real mesh one ``draw_filled_triangle`` call at a time pays
+# Python's overhead per triangle.  ``draw_triangles`` takes them all at
+# once -- an (N, 3, 2) array of corners and an (N, 3) array of colors --
+# and gives the same picture: later triangles still cover earlier ones.
+# Under the hood it cuts the screen into 32x32 tiles and tests each
+# tile's triangles together.
+
+# %%
+rng: np.random.Generator = np.random.default_rng(0)
+centers: np.ndarray = rng.uniform(0.0, 400.0, (1000, 1, 2))
+mesh: np.ndarray = centers + rng.uniform(-20.0, 20.0, (1000, 3, 2))
+mesh_colors: np.ndarray = rng.integers(0, 256, (1000, 3))
+
+fake_fb400.clear_framebuffer()
+fake_fb400.draw_triangles(mesh, mesh_colors)
+fake_fb400.show_framebuffer()
+
 # %%
@@ -0,0 +1,187 @@
+# Copyright (c) 2018-2026 William Emerison Six
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+
+"""Frame pacing and frame-time statistics for the demo loops.
+
+The demos used to hold their frame rate by spinning on ``glfw.get_time()``
+until the frame's time slot came round -- a full core per open window.
+:class:`FramePacer` sleeps through most of the wait instead and spins only
+for the last ``spin`` seconds, where ``time.sleep`` is too coarse to trust.
+
+It also times each frame in three phases, marked by the loop:
+
+* ``cpu``: from the start of the frame to :meth:`FramePacer.end_cpu` --
+  input, animation, building the imgui frame;
+* ``render``: from there to :meth:`FramePacer.end_render` -- issuing the GL
+  draws;
+* ``swap``: from there to :meth:`FramePacer.end_frame` -- ``swap_buffers``.
+
+The last ``capacity`` frames are kept in a ring buffer, summarized as
+p50 / p95 / p99 in milliseconds by :meth:`FramePacer.percentiles`, and
+written as JSON by :meth:`FramePacer.write_stats` when ``stats_path`` is set
+(from ``$MVP_FRAME_STATS`` by default).
+
+No GL or GLFW here: the clock and the sleep are injectable, so the pacing
+can be checked with a fake clock.
+
+>>> class FakeClock:
+...     now = 0.0
+...     def __call__(self):
+...         return self.now
+...     def sleep(self, seconds):
+...         self.now += seconds
+>>> clock = FakeClock()
+>>> pacer = FramePacer(
+...     target_framerate=64.0, spin=0.0, clock=clock, sleep=clock.sleep
+... )
+>>> for _ in range(3):
+...     pacer.begin_frame()
+...     clock.now += 1 / 256  # input + animation
+...     pacer.end_cpu()
+...     clock.now += 1 / 512  # draws
+...     pacer.end_render()
+...     clock.now += 1 / 1024  # swap
+...     pacer.end_frame()
+>>> clock.now * 64  # the third frame began two 1/64 s slots after the first
+2.4375
+>>> pacer.percentiles()["cpu"]["p50"]
+3.906
+"""
+
+import dataclasses
+import json
+import os
+import time
+import typing
+
+import numpy as np
+
+#: the phases a frame is timed in, in order, and the ring buffer's columns
+PHASES: typing.Tuple[str, ...] = ("cpu", "render", "swap")
+#: the percentiles :meth:`FramePacer.percentiles` reports
+PERCENTILES: typing.Tuple[int, ...] = (50, 95, 99)
+
+
+@dataclasses.dataclass
+class FramePacer:
+    """Hold a loop to ``target_framerate`` and time its frames.
+
+    Call :meth:`begin_frame` at the top of every frame; it returns once the
+    frame's slot has come, ``1 / target_framerate`` after the previous
+    frame began.  A late frame is not made up for: the next slot counts
+    from when the late frame actually began, as the busy-wait loops did.
+    """
+
+    target_framerate: float = 60.0
+    #: how many of the most recent frames the statistics cover
+    capacity: int = 600
+    #: the tail of each wait spent spinning rather than sleeping, seconds
+    spin: float = 0.0005
+    #: where :meth:`write_stats` writes; ``None`` (the default unless
+    #: ``$MVP_FRAME_STATS`` is set) writes nothing
+    stats_path: typing.Optional[str] = dataclasses.field(
+        default_factory=lambda: os.environ.get("MVP_FRAME_STATS") or None
+    )
+    clock: typing.Callable[[], float] = time.perf_counter
+    sleep: typing.Callable[[float], None] = time.sleep
+    #: ``(capacity, len(PHASES))`` phase durations in seconds; row
+    #: ``frames % capacity`` is the next one written
+    _times: np.ndarray = dataclasses.field(init=False, repr=False)
+    #: frames recorded so far (not capped at ``capacity``)
+    frames: int = dataclasses.field(init=False, default=0)
+    _start: typing.Optional[float] = dataclasses.field(
+        init=False, default=None, repr=False
+    )
+    # the clock at each phase boundary of the current frame
+    _marks: typing.List[float] = dataclasses.field(
+        init=False, default_factory=list, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.target_framerate <= 0.0:
+            raise ValueError(
+                f"FramePacer: target_framerate must be positive, got "
+                f"{self.target_framerate}"
+            )
+        self._times = np.zeros((self.capacity, len(PHASES)))
+
+    def begin_frame(self) -> None:
+        """Wait for this frame's slot -- sleeping, then spinning for the
+        last ``spin`` seconds -- and start timing it."""
+        if self._start is not None:
+            deadline: float = self._start + 1.0 / self.target_framerate
+            remaining: float = deadline - self.clock()
+            if remaining > self.spin:
+                self.sleep(remaining - self.spin)
+            while self.clock() < deadline:
+                pass
+        self._start = self.clock()
+        self._marks = [self._start]
+
+    def end_cpu(self) -> None:
+        """The frame's CPU work is done; its GL draws start."""
+        self._marks.append(self.clock())
+
+    def end_render(self) -> None:
+        """The frame's GL draws are issued; the buffer swap starts."""
+        self._marks.append(self.clock())
+
+    def end_frame(self) -> None:
+        """The buffers are swapped: record the frame's phase times."""
+        self._marks.append(self.clock())
+        if len(self._marks) != len(PHASES) + 1:
+            raise ValueError(
+                f"end_frame: expected begin_frame, end_cpu and end_render "
+                f"before it, got {len(self._marks) - 1} marks"
+            )
+        self._times[self.frames % self.capacity] = np.diff(self._marks)
+        self.frames += 1
+
+    def percentiles(self) -> typing.Dict[str, typing.Dict[str, float]]:
+        """p50 / p95 / p99 of each phase, and of ``frame`` (their sum), over
+        the recorded frames, in milliseconds; all zero before any frame."""
+        recorded: np.ndarray = self._times[: min(self.frames, self.capacity)]
+        if len(recorded) == 0:
+            recorded = np.zeros((1, len(PHASES)))
+        columns = dict(zip(PHASES, recorded.T, strict=True))
+        columns["frame"] = recorded.sum(axis=1)
+        return {
+            name: {
+                f"p{q}": round(float(v) * 1000.0, 3)
+                for q, v in zip(
+                    PERCENTILES, np.percentile(column, PERCENTILES), strict=True
+                )
+            }
+            for name, column in columns.items()
+        }
+
+    def write_stats(self) -> None:
+        """Write the target rate, frame count and :meth:`percentiles` to
+        ``stats_path`` as JSON; does nothing when ``stats_path`` is
+        ``None``.  Call once, after the loop exits."""
+        if self.stats_path is None:
+            return
+        with open(self.stats_path, "w") as f:
+            json.dump(
+                {
+                    "target_framerate": self.target_framerate,
+                    "frames": self.frames,
+                    "milliseconds": self.percentiles(),
+                },
+                f,
+                indent=2,
+            )
@@ -294,3 +294,49 @@ def test_same_space_is_empty_identity_path() -> None:
     p: Vector3
     for p in SAMPLES:
         assert f(p).isclose(p, rel_tol=1e-5, abs_tol=1e-5)
+
+
+# --- the rooted-tree index and the route memo -------------------------------
+
+
+def _route_names(path: cayleygraph.Path) -> list[tuple[str, str, bool]]:
+    return [(edge.src, edge.dst, forward) for edge, forward in path.route]
+
+
+def test_tree_routes_match_breadth_first_search() -> None:
+    g: cayleygraph.CayleyGraph = build_graph()
+    searched: cayleygraph.CayleyGraph = build_graph()
+    searched._tree = None  # force the BFS fallback
+    for a in g.spaces:
+        for b in g.spaces:
+            assert _route_names(g.path(a, b)) == _route_names(
+                searched.path(a, b)
+            )
+
+
+def test_routes_are_memoized_but_paths_are_not_shared() -> None:
+    g: cayleygraph.CayleyGraph = build_graph()
+    first: cayleygraph.Path = g.path("square", "camera")
+    first.route.clear()  # a caller mutating its own Path ...
+    second: cayleygraph.Path = g.path("square", "camera")
+    assert second is not first
+    assert len(second.route) == 3  # ... cannot corrupt the cache
+    assert ("square", "camera") in g._routes
+
+
+def test_undirected_cycle_falls_back_to_search() -> None:
+    # a diamond: acyclic as directed edges, but two routes a -> d
+    def edge(src: str, dst: str) -> cayleygraph.Edge:
+        return cayleygraph.Edge(
+            src=src, dst=dst, steps=[("T", translate(Vector3(1, 0, 0)))]
+        )
+
+    g: cayleygraph.CayleyGraph = cayleygraph.CayleyGraph(
+        [edge("a", "b"), edge("a", "c"), edge("b", "d"), edge("c", "d")]
+    )
+    assert g._tree is None
+    assert len(g.path("a", "d").route) == 2
+    assert _route_names(g.path("d", "a")) == [
+        ("b", "d", False),
+        ("a", "b", False),
+    ]
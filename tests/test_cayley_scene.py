@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import math
+import pathlib
 from collections.abc import Callable
 
 import numpy as np
@@ -21,7 +22,7 @@ from gacalc.transforms import (
     uniform_scale,
 )
 
-from modelviewprojection.cayley import cayleygraph, cayleyscene
+from modelviewprojection.cayley import cayleybake, cayleygraph, cayleyscene
 from modelviewprojection.mathutils import rotate_x, rotate_y, rotate_z
 
 # demo constants (verbatim from modelviewperspectiveprojection.py)
@@ -226,6 +227,98 @@ def test_active_label_tracks_animating_substep() -> None:
     assert animation.active_label(8.0) == "R_z"  # paddle1 rotate
 
 
+def test_indexed_lookups_match_a_linear_scan() -> None:
+    tl: cayleyscene.Timeline = cayleyscene.Timeline(build_full_scene())
+    k: int
+    for k in range(-10, 1200):  # every boundary, the dwells and past the end
+        t: float = k * 0.1
+        scanned = next(
+            (ts for ts in tl.steps if ts.start <= t < ts.start + ts.dur), None
+        )
+        assert tl.active_step(t) is scanned
+    for space in ("paddle1", "square", "paddle2", "camera", "world"):
+        assert tl.steps_for(space) == [
+            ts for ts in tl.steps if ts.space == space
+        ]
+    assert tl.track_for("World->Camera") is tl.inverse_tracks[0]
+    assert tl.track_for("no such group") is None
+    assert [
+        g.label for g in tl.gpu_steps_for("Ortho, Rectangular Prism->NDC")
+    ] == [
+        "T - Center",
+        "Scale",
+    ]
+
+
+def _layout(tl: cayleyscene.Timeline) -> tuple:
+    """Everything a Timeline answers from, in comparable form."""
+    return (
+        [(ts.label, ts.start, ts.dur, ts.space) for ts in tl.steps],
+        [
+            (tr.group_title, [(start, dur) for _s, start, dur in tr.timed])
+            for tr in tl.inverse_tracks
+        ],
+        [(g.group_title, g.label, g.start, g.dur) for g in tl.gpu_steps],
+        tl._slot,
+        tl._window,
+        tl._starts,
+        {space: len(steps) for space, steps in tl._steps_by_space.items()},
+        tl.duration,
+    )
+
+
+def test_incremental_rebuild_matches_a_fresh_timeline() -> None:
+    scene: cayleyscene.Scene = build_full_scene()
+    tl: cayleyscene.Timeline = cayleyscene.Timeline(scene)
+
+    scene.coordinate_frames[2].dwell_before = 3.0
+    assert tl.rebuild(2) == 32.0  # paddle2 was laid out from t=32
+    assert _layout(tl) == _layout(cayleyscene.Timeline(scene))
+
+    removed = scene.coordinate_frames.pop(1)  # the square
+    tl.rebuild(1)
+    assert _layout(tl) == _layout(cayleyscene.Timeline(scene))
+    assert tl.steps_for("square") == []
+
+    scene.coordinate_frames.insert(1, removed)
+    tl.rebuild(1)
+    assert _layout(tl) == _layout(cayleyscene.Timeline(scene))
+
+    scene.end_dwell = 0.0
+    tl.rebuild(len(scene.coordinate_frames))
+    assert _layout(tl) == _layout(cayleyscene.Timeline(scene))
+
+    scene.step_duration = 2.0
+    tl.rebuild()
+    assert _layout(tl) == _layout(cayleyscene.Timeline(scene))
+
+
+def test_animation_rebuild_keeps_the_runs_before_the_edit() -> None:
+    scene: cayleyscene.Scene = build_full_scene()
+    animation: cayleyscene.Animation = cayleyscene.Animation(scene)
+    animation.transform_matrix("paddle1", 100.0)
+    animation.transform_matrix("camera", 100.0)
+    paddle1_runs: dict = {
+        key: run for key, run in animation._runs.items() if key[1][0][0] < 12.0
+    }
+    assert paddle1_runs and len(paddle1_runs) < len(animation._runs)
+
+    scene.coordinate_frames[3].dwell_before = 1.0  # the camera's
+    animation.rebuild(3)
+    assert animation._runs == paddle1_runs
+    fresh: cayleyscene.Animation = cayleyscene.Animation(scene)
+    t: float
+    for t in (0.0, 13.0, 42.0, 46.0, 60.0, 100.0):
+        assert np.allclose(
+            animation.transform_matrix("camera", t),
+            fresh.transform_matrix("camera", t),
+        )
+        assert np.allclose(
+            animation.inverse_transform_matrix(t),
+            fresh.inverse_transform_matrix(t),
+        )
+
+
 # --- to_matrix realization for GL ------------------------------------------
 
 
@@ -295,6 +388,109 @@ def test_to_matrix_realizes_affine_function() -> None:
         )
 
 
+def _probed(f: InvertibleFunction) -> np.ndarray:
+    """The reference realization: the probe, with no decomposition."""
+    return cayleyscene._probe(f)
+
+
+def test_to_matrix_of_a_composition_matches_the_probe() -> None:
+    f: InvertibleFunction = compose(
+        [
+            translate(Vector3(3.0, 4.0, 5.0)),
+            rotate_z(math.radians(30.0)),
+            inverse(rotate_y(math.radians(140.0))),
+            uniform_scale(2.0),
+            rotate_x(math.radians(250.0)),
+        ]
+    )
+    assert np.allclose(cayleyscene.to_matrix(f), _probed(f))
+    # a cached primitive must not leak out as a shared, writable array
+    m: np.ndarray = cayleyscene.to_matrix(translate(Vector3(1.0, 0.0, 0.0)))
+    m[0, 3] = 99.0
+    assert cayleyscene.to_matrix(translate(Vector3(1.0, 0.0, 0.0)))[0, 3] == 1.0
+
+
+def test_to_matrix_over_times_matches_one_probe_per_time() -> None:
+    times: np.ndarray = np.linspace(0.0, 1.0, 11)
+    f: InvertibleFunction
+    for f in (
+        translate(Vector3(3.0, -4.0, 5.0)),
+        rotate_z(math.radians(30.0)),
+        compose([translate(P1_POS), rotate_z(P1_ROT)]),
+        compose(
+            [
+                translate(CAM_POS),
+                rotate_y(CAM_ROT_Y),
+                rotate_x(CAM_ROT_X),
+                uniform_scale(0.5),
+            ]
+        ),
+        # over half a turn: no closed form fits, so it is probed instead
+        rotate_x(math.radians(250.0)),
+    ):
+        matrices: np.ndarray = cayleyscene.to_matrix(f, times)
+        assert matrices.shape == (11, 4, 4)
+        assert np.allclose(
+            matrices, [_probed(f.at(float(t))) for t in times], atol=1e-9
+        )
+
+
+def test_primitives_are_read_by_their_parameters() -> None:
+    f: InvertibleFunction = compose(
+        [
+            translate(Vector3(3.0, -4.0, 5.0)),
+            rotate_z(math.radians(30.0)),
+            uniform_scale(2.0),
+            # over half a turn: read the short way round
+            rotate_x(math.radians(250.0)),
+        ]
+    )
+    realization = cayleyscene._realize(f)
+    leaves = realization.leaves
+    kind = cayleyscene._LeafKind
+    assert [leaf.kind for leaf in leaves] == [
+        kind.translation,
+        kind.rotation,
+        kind.scale,
+        kind.rotation,
+    ]
+    assert leaves[0].offset.tolist() == [3.0, -4.0, 5.0]
+    assert math.isclose(leaves[1].angle, math.radians(30.0))
+    assert np.allclose(leaves[1].axis, [0.0, 0.0, 1.0])
+    assert leaves[2].factors.tolist() == [2.0, 2.0, 2.0]
+    # the at(t) laws are checked only once an at(t) is asked for
+    assert realization.leafwise_at is None
+    assert all(leaf._closed_form_at is None for leaf in leaves)
+    realization.matrices_at(np.array([0.5]))
+    assert [leaf._closed_form_at for leaf in leaves] == [
+        True,
+        True,
+        True,
+        False,  # the short way round is not how f.at turns
+    ]
+    assert realization.leafwise_at
+
+
+def test_animating_frames_add_no_realizations() -> None:
+    animation: cayleyscene.Animation = cayleyscene.Animation(build_scene())
+    animation.transform_matrix("square", 14.0)  # square's R_Z is mid-ramp
+    realized: int = len(cayleyscene._realizations)
+    for k in range(1, 50):
+        animation.transform_matrix("square", 14.0 + k * 0.01)
+    assert len(cayleyscene._realizations) == realized
+
+
+def test_one_off_functions_are_probed_and_not_kept() -> None:
+    realized: int = len(cayleyscene._realizations)
+    for k in range(10):
+        # a path's function, rebuilt every frame
+        f: InvertibleFunction = compose(
+            [translate(Vector3(float(k), 0.0, 0.0)), rotate_z(0.1 * k)]
+        )
+        assert np.allclose(cayleyscene.to_matrix(f), _probed(f))
+    assert len(cayleyscene._realizations) == realized
+
+
 def test_to_matrix_of_engine_transform_matches_point_application() -> None:
     animation: cayleyscene.Animation = cayleyscene.Animation(build_scene())
     f: InvertibleFunction = animation.transform("square", 20.0)
@@ -319,6 +515,33 @@ def test_to_matrix_of_engine_transform_matches_point_application() -> None:
         )
 
 
+def test_cached_matrices_match_the_composed_functions() -> None:
+    animation: cayleyscene.Animation = cayleyscene.Animation(build_full_scene())
+    k: int
+    for k in range(0, 1200, 7):  # saturated and mid-ramp times alike
+        t: float = k * 0.1
+        for space in ("paddle1", "square", "paddle2", "camera"):
+            assert np.allclose(
+                animation.transform_matrix(space, t),
+                cayleyscene.to_matrix(animation.transform(space, t)),
+            )
+        assert np.allclose(
+            animation.inverse_transform_matrix(t),
+            cayleyscene.to_matrix(animation.inverse_transform(t)),
+        )
+
+
+def test_saturated_runs_are_composed_once() -> None:
+    animation: cayleyscene.Animation = cayleyscene.Animation(build_scene())
+    animation.transform("square", 14.0)  # square's R_Z is mid-ramp
+    animation.transform("square", 100.0)  # everything fully applied
+    runs: dict = dict(animation._runs)
+    animation.transform("square", 101.0)
+    animation.transform_matrix("square", 102.0)
+    assert animation._runs.keys() == runs.keys()
+    assert all(animation._runs[key] is run for key, run in runs.items())
+
+
 # --- projection tail: timeline, world->camera morph, GPU steps -------------
 
 
@@ -415,3 +638,40 @@ def test_ndc_tree_structure_and_reverse_order() -> None:
     # GPU groups also reverse-time order
     assert [b.label for b in groups[1].buttons] == ["Squash Y", "Squash X"]
     assert [b.label for b in groups[2].buttons] == ["Scale", "T - Center"]
+
+
+# --- offline baking --------------------------------------------------------
+
+
+def test_baked_playback_matches_the_live_animation(
+    tmp_path: pathlib.Path,
+) -> None:
+    animation: cayleyscene.Animation = cayleyscene.Animation(build_full_scene())
+    path: pathlib.Path = tmp_path / "scene.npz"
+    cayleybake.bake(animation, path, rate=4.0)
+
+    baked: cayleybake.BakedAnimation = cayleybake.BakedAnimation.load(path)
+    assert len(baked) == int(animation.timeline.duration * 4.0) + 1
+    assert isinstance(baked.transforms["square"], np.memmap)
+    assert baked.transforms["square"].shape == (len(baked), 4, 4)
+    for frame in range(0, len(baked), 9):
+        t: float = frame / 4.0
+        assert baked.frame(t + 0.1) == frame  # nearest frame
+        for space in ("paddle1", "square", "paddle2", "camera"):
+            assert np.allclose(
+                baked.transform_matrix(space, t),
+                animation.transform_matrix(space, t),
+                atol=1e-5,
+            )
+        assert np.allclose(
+            baked.inverse_transform_matrix(t),
+            animation.inverse_transform_matrix(t),
+            atol=1e-5,
+        )
+        for (label, got), (want_label, want) in zip(
+            baked.gpu_progress(t), animation.gpu_progress(t), strict=True
+        ):
+            assert label == want_label and math.isclose(got, want, abs_tol=1e-6)
+    # scrubbing past either end clamps to the first / last frame
+    assert baked.frame(-3.0) == 0
+    assert baked.frame(1e6) == len(baked) - 1
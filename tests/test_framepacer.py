@@ -0,0 +1,124 @@
+# Copyright (c) 2018-2026 William Emerison Six
+#
+# Tests for util.framepacer: the pacer must sleep (not spin) through the bulk
+# of each frame's wait, keep only the last `capacity` frames, and report /
+# dump their percentiles.  Driven by a fake clock, so nothing really sleeps.
+
+from __future__ import annotations
+
+import json
+import pathlib
+
+import pytest
+
+from modelviewprojection.util.framepacer import FramePacer
+
+
+class FakeClock:
+    """A clock that only moves when slept on, or ticks ``tick`` per read --
+    so a spin loop still terminates, and its reads can be counted."""
+
+    def __init__(self, tick: float = 0.0) -> None:
+        self.now: float = 0.0
+        self.tick: float = tick
+        self.reads: int = 0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        self.reads += 1
+        self.now += self.tick
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def run_frames(
+    pacer: FramePacer, clock: FakeClock, durations: list[float]
+) -> None:
+    """One frame per duration, split evenly over cpu / render / swap."""
+    for duration in durations:
+        pacer.begin_frame()
+        for mark in (pacer.end_cpu, pacer.end_render, pacer.end_frame):
+            clock.now += duration / 3.0
+            mark()
+
+
+def test_sleeps_all_but_the_spin_tail() -> None:
+    clock = FakeClock(tick=1e-6)
+    pacer = FramePacer(
+        target_framerate=60.0, spin=0.001, clock=clock, sleep=clock.sleep
+    )
+    run_frames(pacer, clock, [0.003] * 4)
+    # the first frame never waits; each later one sleeps most of its slot
+    assert len(clock.slept) == 3
+    for seconds in clock.slept:
+        assert seconds == pytest.approx(1.0 / 60.0 - 0.003 - 0.001, abs=1e-4)
+    # and the whole run took three slots plus the last frame's work
+    assert clock.now == pytest.approx(3.0 / 60.0 + 0.003, abs=1e-4)
+
+
+def test_late_frames_do_not_wait() -> None:
+    clock = FakeClock(tick=1e-6)
+    pacer = FramePacer(target_framerate=60.0, clock=clock, sleep=clock.sleep)
+    run_frames(pacer, clock, [0.05, 0.05])
+    assert clock.slept == []
+
+
+def test_ring_buffer_keeps_the_last_capacity_frames() -> None:
+    clock = FakeClock()
+    pacer = FramePacer(
+        target_framerate=1.0,
+        capacity=4,
+        spin=0.0,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    run_frames(pacer, clock, [0.9, 0.9, 0.9, 0.03, 0.03, 0.03, 0.03])
+    assert pacer.frames == 7
+    stats = pacer.percentiles()
+    # the three slow frames have been overwritten
+    assert stats["frame"] == {"p50": 30.0, "p95": 30.0, "p99": 30.0}
+    assert stats["cpu"]["p99"] == pytest.approx(10.0)
+
+
+def test_percentiles_before_any_frame_are_zero() -> None:
+    stats = FramePacer(stats_path=None).percentiles()
+    assert set(stats) == {"cpu", "render", "swap", "frame"}
+    assert stats["swap"] == {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+
+def test_end_frame_needs_every_mark() -> None:
+    pacer = FramePacer()
+    pacer.begin_frame()
+    pacer.end_cpu()
+    with pytest.raises(ValueError, match="end_frame"):
+        pacer.end_frame()
+
+
+def test_write_stats(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "frames.json"
+    clock = FakeClock()
+    pacer = FramePacer(
+        target_framerate=30.0,
+        spin=0.0,
+        stats_path=str(path),
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    run_frames(pacer, clock, [0.006, 0.006])
+    pacer.write_stats()
+    written = json.loads(path.read_text())
+    assert written["target_framerate"] == 30.0
+    assert written["frames"] == 2
+    assert written["milliseconds"]["frame"]["p50"] == pytest.approx(6.0)
+
+
+def test_write_stats_without_a_path_writes_nothing(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("MVP_FRAME_STATS", raising=False)
+    monkeypatch.chdir(tmp_path)
+    FramePacer().write_stats()
+    assert list(tmp_path.iterdir()) == []
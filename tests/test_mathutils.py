@@ -36,6 +36,7 @@ from gacalc.g3 import Vector3
 from gacalc.transforms import (
     InvertibleFunction,
     Linearity,
+    compose,
     inverse,
     to_matrix,
     translate,
@@ -48,7 +49,10 @@ from modelviewprojection.framebuffer.softwarerendering import (
     is_parallel_and_same_orientation,
 )
 from modelviewprojection.mathutils import (
+    FunctionStack,
     abs_sin,
+    apply_batch,
+    compile_affine,
     cosine,
     distance_to_plane,
     find_normal,
@@ -56,6 +60,7 @@ from modelviewprojection.mathutils import (
     ortho,
     perspective,
     plane_equation,
+    push_transformation,
     rotate,
     rotate_around,
     rotate_x,
@@ -338,6 +343,44 @@ def test_function_stack_push_pop() -> None:
     # doc-region-end function stack examples definitions
 
 
+def test_function_stack_cached_prefixes_match_full_composition() -> None:
+    p: Vector3 = v3(0.5, -1.5, 4.0)
+    pushed = [
+        translate(v3(1.0, 2.0, 3.0)),
+        rotate_z(math.radians(30.0)),
+        uniform_scale(2.0),
+        rotate_x(math.radians(-45.0)),
+    ]
+    stack: FunctionStack = FunctionStack()
+    for fn in pushed:
+        stack.push(fn)
+        assert stack.modelspace_to_ndc_fn()(p).isclose(
+            compose(stack.stack)(p), rel_tol=1e-9, abs_tol=1e-9
+        )
+    while stack.stack:
+        stack.pop()
+        assert stack.modelspace_to_ndc_fn()(p).isclose(
+            compose(stack.stack)(p), rel_tol=1e-9, abs_tol=1e-9
+        )
+    # built with a list up front, the prefixes are composed at construction
+    prebuilt: FunctionStack = FunctionStack(stack=list(pushed))
+    assert prebuilt.modelspace_to_ndc_fn()(p).isclose(
+        compose(pushed)(p), rel_tol=1e-9, abs_tol=1e-9
+    )
+
+
+def test_push_transformation_unwinds_the_cached_prefixes() -> None:
+    fn_stack.clear()
+    fn_stack.push(uniform_scale(3.0))
+    with pytest.raises(RuntimeError):
+        with push_transformation(translate(v3(5.0, 0.0, 0.0))):
+            raise RuntimeError("a draw call failed")
+    assert fn_stack.modelspace_to_ndc_fn()(v3(1.0, 1.0, 1.0)).isclose(
+        v3(3.0, 3.0, 3.0), rel_tol=1e-9, abs_tol=1e-9
+    )
+    fn_stack.clear()
+
+
 # --------------------------------------------------------------------------- #
 # mvp rotations <-> gacalc to_matrix                                          #
 # --------------------------------------------------------------------------- #
@@ -367,3 +410,42 @@ def test_to_matrix_of_rotate_z_is_homogeneous_rotation() -> None:
 def test_to_matrix_perspective_raises() -> None:
     with pytest.raises(ValueError):
         to_matrix(perspective(45.0, 1.0, -0.1, -1000.0), Vector3)
+
+
+# --------------------------------------------------------------------------- #
+# compile_affine / apply_batch                                                #
+# --------------------------------------------------------------------------- #
+
+
+def test_compile_affine_matches_the_function_and_its_inverse() -> None:
+    fn: InvertibleFunction[Vector3] = compose(
+        [
+            translate(v3(1.0, -2.0, 3.0)),
+            rotate_x(math.radians(30.0)),
+            rotate_z(math.radians(75.0)),
+            uniform_scale(2.5),
+        ]
+    )
+    compiled = compile_affine(fn)
+    assert compiled.matrix.dtype == np.float64
+    p: Vector3 = v3(0.5, -1.5, 4.0)
+    expected = [float(c) for c in fn(p)]
+    assert np.allclose(compiled.matrix @ [0.5, -1.5, 4.0, 1.0], expected + [1])
+    assert np.allclose(compiled.inverse @ (expected + [1]), [0.5, -1.5, 4.0, 1])
+    assert compile_affine(fn) is compiled  # cached per function object
+
+
+def test_apply_batch_matches_per_point_evaluation() -> None:
+    points = np.random.default_rng(3).uniform(-5.0, 5.0, (20, 3))
+    points[:, 2] -= 10.0  # in front of the camera, for the perspective case
+    for fn in [
+        compose([translate(v3(0.0, 1.0, -2.0)), rotate_y(math.radians(40.0))]),
+        perspective(45.0, 1.0, -0.1, -1000.0),  # non-affine: per point
+    ]:
+        expected = [[float(c) for c in fn(v3(*p))] for p in points.tolist()]
+        assert np.allclose(apply_batch(fn, points), expected)
+
+
+def test_apply_batch_rejects_non_3d_points() -> None:
+    with pytest.raises(ValueError, match="apply_batch"):
+        apply_batch(translate(v3(1.0, 0.0, 0.0)), np.zeros((4, 2)))
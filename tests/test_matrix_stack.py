@@ -26,16 +26,41 @@ The reference implementation is the fixed-function
 ``m3dMakePlanarShadowMatrix``). Block.py stores the matrix column-major for
 ``glMultMatrixf``; ``matrix_stack`` stores row-major (``M @ column_vector``),
 so the faithfulness test transposes the reference before comparing.
+
+The rest covers the stack machinery itself: the preallocated blocks behind
+push / pop, and the cached ``modelview`` / ``modelviewprojection`` products
+that every mutator must invalidate, and the per-thread contexts that keep
+independent renders apart.
 """
 
+import contextlib
+import math
+import threading
+import typing
+
 import numpy as np
+import pytest
 
 from modelviewprojection.matrix_stack import (
+    MAX_STACK_DEPTH,
     MatrixStack,
+    MatrixStackContext,
+    _pop_matrix,
+    current_context,
     get_current_matrix,
+    instance_matrices,
+    multiply,
+    perspective,
     planar_shadow,
+    push_matrix,
+    rotate_x,
+    rotate_y,
+    rotate_z,
+    scale,
+    set_current_matrix,
     set_to_identity_matrix,
     translate,
+    use_context,
 )
 
 
@@ -136,3 +161,247 @@ def test_post_multiplies_current_matrix() -> None:
     planar_shadow(MatrixStack.model, plane_eq, light_pos)
     got = get_current_matrix(MatrixStack.model).astype(np.float64)
     assert np.allclose(got, current @ shadow_only, atol=1e-5)
+
+
+def _reset() -> None:
+    for stack in (MatrixStack.model, MatrixStack.view, MatrixStack.projection):
+        set_to_identity_matrix(stack)
+
+
+def _uncached_mvp() -> np.ndarray:
+    return (
+        get_current_matrix(MatrixStack.projection).astype(np.float64)
+        @ get_current_matrix(MatrixStack.view).astype(np.float64)
+        @ get_current_matrix(MatrixStack.model).astype(np.float64)
+    )
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda: translate(MatrixStack.model, 1.0, -2.0, 3.0),
+        lambda: rotate_x(MatrixStack.model, 0.3),
+        lambda: rotate_y(MatrixStack.view, -0.7),
+        lambda: rotate_z(MatrixStack.model, 1.1),
+        lambda: scale(MatrixStack.view, 2.0, 3.0, 4.0),
+        lambda: multiply(MatrixStack.model, np.diag([1.0, 2.0, 3.0, 1.0])),
+        lambda: perspective(45.0, 1.5, 0.1, 100.0),
+        lambda: set_current_matrix(MatrixStack.view, np.eye(4) * 2.0),
+        lambda: planar_shadow(
+            MatrixStack.model, (0.0, 1.0, 0.0, 0.0), (0.0, 10.0, 0.0)
+        ),
+    ],
+)
+def test_every_mutator_invalidates_the_cached_products(
+    mutate: typing.Callable[[], None],
+) -> None:
+    _reset()
+    translate(MatrixStack.view, 0.0, 0.0, -5.0)
+    get_current_matrix(MatrixStack.modelviewprojection)  # fill the cache
+    mutate()
+    assert np.allclose(
+        get_current_matrix(MatrixStack.modelviewprojection),
+        _uncached_mvp(),
+        atol=1e-5,
+    )
+    assert np.allclose(
+        get_current_matrix(MatrixStack.modelview),
+        get_current_matrix(MatrixStack.view).astype(np.float64)
+        @ get_current_matrix(MatrixStack.model).astype(np.float64),
+        atol=1e-5,
+    )
+
+
+def _rotation(axis: str, rads: float) -> np.ndarray:
+    c, s = math.cos(rads), math.sin(rads)
+    match axis:
+        case "x":
+            return np.array(
+                [[1, 0, 0, 0], [0, c, -s, 0], [0, s, c, 0], [0, 0, 0, 1]]
+            )
+        case "y":
+            return np.array(
+                [[c, 0, s, 0], [0, 1, 0, 0], [-s, 0, c, 0], [0, 0, 0, 1]]
+            )
+        case "z":
+            return np.array(
+                [[c, -s, 0, 0], [s, c, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+            )
+        case _:
+            raise ValueError(f"_rotation: unknown axis {axis!r}")
+
+
+@pytest.mark.parametrize(
+    "apply, rhs",
+    [
+        (lambda: rotate_x(MatrixStack.model, 0.3), _rotation("x", 0.3)),
+        (lambda: rotate_y(MatrixStack.model, -0.7), _rotation("y", -0.7)),
+        (lambda: rotate_z(MatrixStack.model, 1.1), _rotation("z", 1.1)),
+        (
+            lambda: translate(MatrixStack.model, 1.0, -2.0, 3.0),
+            np.array([[1, 0, 0, 1], [0, 1, 0, -2], [0, 0, 1, 3], [0, 0, 0, 1]]),
+        ),
+        (
+            lambda: scale(MatrixStack.model, 2.0, 3.0, 4.0),
+            np.diag([2.0, 3.0, 4.0, 1.0]),
+        ),
+    ],
+)
+def test_in_place_kernels_match_the_full_matrix_product(
+    apply: typing.Callable[[], None], rhs: np.ndarray
+) -> None:
+    """The kernels rewrite only the columns a transform touches; the result
+    must still be ``M @ T`` for a general (non-affine) ``M``."""
+    _reset()
+    m = np.random.default_rng(0).uniform(-2.0, 2.0, (4, 4))
+    set_current_matrix(MatrixStack.model, m)
+    apply()
+    assert np.allclose(
+        get_current_matrix(MatrixStack.model),
+        m.astype(np.float32).astype(np.float64) @ rhs,
+        atol=1e-5,
+    )
+
+
+def test_push_and_pop_restore_the_matrix_and_the_products() -> None:
+    _reset()
+    rotate_y(MatrixStack.model, math.radians(30.0))
+    before = get_current_matrix(MatrixStack.modelviewprojection).copy()
+    with push_matrix(MatrixStack.model):
+        translate(MatrixStack.model, 4.0, 5.0, 6.0)
+        assert not np.allclose(
+            get_current_matrix(MatrixStack.modelviewprojection), before
+        )
+    assert np.array_equal(
+        get_current_matrix(MatrixStack.modelviewprojection), before
+    )
+
+
+def test_products_are_reused_until_a_factor_changes() -> None:
+    _reset()
+    first = get_current_matrix(MatrixStack.modelviewprojection)
+    assert get_current_matrix(MatrixStack.modelviewprojection) is first
+    translate(MatrixStack.model, 1.0, 0.0, 0.0)
+    # recomputed in place into the same buffer, not a fresh array
+    again = get_current_matrix(MatrixStack.modelviewprojection)
+    assert again is first
+    assert again[0, 3] == 1.0
+
+
+def test_current_matrices_are_read_only() -> None:
+    _reset()
+    for stack in MatrixStack:
+        with pytest.raises(ValueError):
+            get_current_matrix(stack)[0, 0] = 5.0
+
+
+def test_stack_overflow_and_underflow_raise() -> None:
+    _reset()
+    with pytest.raises(ValueError, match="pop_matrix: model stack underflow"):
+        _pop_matrix(MatrixStack.model)
+
+    depth = 1
+    with pytest.raises(ValueError, match="push_matrix: view stack overflow"):
+        with contextlib.ExitStack() as pushes:
+            while True:
+                pushes.enter_context(push_matrix(MatrixStack.view))
+                depth += 1
+    assert depth == MAX_STACK_DEPTH
+    # the failed push popped nothing it had not pushed: back to the bottom
+    with pytest.raises(ValueError, match="underflow"):
+        _pop_matrix(MatrixStack.view)
+
+
+def test_derived_products_cannot_be_written() -> None:
+    with pytest.raises(ValueError, match="rotate_x: modelview is a product"):
+        rotate_x(MatrixStack.modelview, 0.5)
+
+
+def test_contexts_hold_independent_stacks() -> None:
+    _reset()
+    translate(MatrixStack.model, 9.0, 9.0, 9.0)  # the default context
+    panel = MatrixStackContext()
+    with use_context(panel) as active:
+        assert active is panel is current_context()
+        # a fresh context starts at identity, untouched by the default one
+        assert np.array_equal(
+            get_current_matrix(MatrixStack.modelviewprojection), np.eye(4)
+        )
+        perspective(45.0, 1.0, 0.1, 100.0)
+        rotate_y(MatrixStack.view, 0.5)
+    assert get_current_matrix(MatrixStack.model)[0, 3] == 9.0
+    assert np.array_equal(get_current_matrix(MatrixStack.projection), np.eye(4))
+
+
+def test_use_context_restores_the_previous_context_on_error() -> None:
+    default = current_context()
+    with pytest.raises(RuntimeError):
+        with use_context(MatrixStackContext()):
+            raise RuntimeError("a draw call failed")
+    assert current_context() is default
+
+
+def test_threads_render_concurrently_without_sharing_state() -> None:
+    start = threading.Barrier(4)
+    results: dict[int, np.ndarray] = {}
+
+    def render(index: int) -> None:
+        with use_context(MatrixStackContext()):
+            start.wait()  # all four threads mutate their stacks at once
+            for _ in range(200):
+                with push_matrix(MatrixStack.model):
+                    translate(MatrixStack.model, float(index), 0.0, 0.0)
+                    rotate_z(MatrixStack.model, 0.01)
+            translate(MatrixStack.model, float(index), 0.0, 0.0)
+            results[index] = get_current_matrix(
+                MatrixStack.modelviewprojection
+            ).copy()
+
+    threads = [
+        threading.Thread(target=render, args=(index,)) for index in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for index, mvp in results.items():
+        assert mvp[0, 3] == float(index)
+        assert np.array_equal(mvp[:3, :3], np.eye(3))
+
+
+def test_instance_matrices_match_one_push_per_instance() -> None:
+    _reset()
+    translate(MatrixStack.view, 0.0, 0.0, -5.0)
+    rotate_y(MatrixStack.view, 0.4)
+    scale(MatrixStack.model, 1.0, 2.0, 1.0)
+    rng = np.random.default_rng(1)
+    translations = rng.uniform(-3.0, 3.0, (6, 3))
+    angles = rng.uniform(-math.pi, math.pi, (6, 3))
+    scales = rng.uniform(0.5, 2.0, (6, 3))
+
+    matrices = instance_matrices(translations, angles, scales)
+
+    assert matrices.shape == (6, 4, 4) and matrices.dtype == np.float32
+    for index in range(6):
+        with push_matrix(MatrixStack.model):
+            translate(MatrixStack.model, *translations[index])
+            rotate_x(MatrixStack.model, angles[index, 0])
+            rotate_y(MatrixStack.model, angles[index, 1])
+            rotate_z(MatrixStack.model, angles[index, 2])
+            scale(MatrixStack.model, *scales[index])
+            expected = get_current_matrix(MatrixStack.modelview)
+            assert np.allclose(matrices[index], expected, atol=1e-5)
+
+
+def test_instance_matrices_reuse_out_and_validate_shapes() -> None:
+    _reset()
+    out = np.empty((2, 4, 4), np.float32)
+    translations = np.zeros((2, 3))
+    assert instance_matrices(translations, out=out) is out
+    assert np.array_equal(out, np.broadcast_to(np.eye(4), (2, 4, 4)))
+    with pytest.raises(ValueError, match="angles must have shape"):
+        instance_matrices(translations, angles=np.zeros((3, 3)))
+    with pytest.raises(ValueError, match="out must have shape"):
+        instance_matrices(translations, out=np.empty((4, 4), np.float32))
+    # the stacks themselves are left alone
+    assert np.array_equal(get_current_matrix(MatrixStack.model), np.eye(4))
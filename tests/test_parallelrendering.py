@@ -0,0 +1,120 @@
+# Copyright (c) 2018-2026 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the shared-memory, multi-process ``ParallelFrameBuffer``.
+
+The single-process ``FrameBuffer`` is the reference: splitting the screen
+into tiles across workers must not change a single pixel or depth value.
+"""
+
+import numpy as np
+import pytest
+
+from modelviewprojection.framebuffer.parallelrendering import (
+    ParallelFrameBuffer,
+)
+from modelviewprojection.framebuffer.softwarerendering import FrameBuffer
+
+
+@pytest.mark.parametrize("tile_size", [8, 32])
+def test_parallel_draw_triangles_matches_single_process(tile_size: int) -> None:
+    rng = np.random.default_rng(7)
+    vertices = rng.uniform(-20.0, 120.0, (300, 3, 2))
+    colors = rng.integers(1, 256, (300, 3))
+
+    expected = FrameBuffer(width=100, height=70)
+    expected.clear_framebuffer()
+    expected.draw_triangles(vertices, colors, tile_size=tile_size)
+
+    with ParallelFrameBuffer(width=100, height=70, workers=3) as fb:
+        fb.clear_framebuffer()
+        fb.draw_triangles(vertices, colors, tile_size=tile_size)
+        assert np.array_equal(fb._framebuffer, expected._framebuffer)
+
+
+def test_parallel_draw_triangles_3d_matches_single_process() -> None:
+    rng = np.random.default_rng(8)
+    positions = np.concatenate(
+        [
+            rng.uniform(-1.5, 1.5, (200, 3, 3)),
+            rng.uniform(0.5, 2.0, (200, 3, 1)),
+        ],
+        axis=2,
+    )
+    colors = rng.uniform(0.0, 255.0, (200, 3, 3))
+
+    expected = FrameBuffer(width=90, height=60, depth_buffer=True)
+    expected.clear_framebuffer()
+    expected.draw_triangles_3d(positions, colors)
+
+    with ParallelFrameBuffer(
+        width=90, height=60, depth_buffer=True, workers=3, tile_size=16
+    ) as fb:
+        fb.clear_framebuffer()
+        fb.draw_triangles_3d(positions, colors)
+        assert np.array_equal(fb._framebuffer, expected._framebuffer)
+        assert np.array_equal(fb._depthbuffer, expected._depthbuffer)
+
+
+def test_parallel_textured_draws_match_single_process() -> None:
+    rng = np.random.default_rng(9)
+    positions = np.concatenate(
+        [
+            rng.uniform(-1.5, 1.5, (60, 3, 3)),
+            rng.uniform(0.5, 2.0, (60, 3, 1)),
+        ],
+        axis=2,
+    )
+    colors = rng.uniform(0.0, 255.0, (60, 3, 3))
+    uvs = rng.uniform(-1.0, 2.0, (60, 3, 2))
+    textures = [
+        rng.integers(0, 256, (8, 16, 3), dtype=np.uint8),
+        rng.integers(0, 256, (5, 3, 3), dtype=np.uint8),
+    ]
+
+    expected = FrameBuffer(width=48, height=40, depth_buffer=True)
+    expected.clear_framebuffer()
+    with ParallelFrameBuffer(
+        width=48, height=40, depth_buffer=True, workers=2, tile_size=8
+    ) as fb:
+        fb.clear_framebuffer()
+        # a second draw with another texture must not reuse the first's
+        for half, texture in zip((slice(0, 30), slice(30, 60)), textures):
+            expected.draw_triangles_3d(
+                positions[half], colors[half], uvs[half], texture
+            )
+            fb.draw_triangles_3d(
+                positions[half], colors[half], uvs[half], texture
+            )
+        assert np.array_equal(fb._framebuffer, expected._framebuffer)
+        assert np.array_equal(fb._depthbuffer, expected._depthbuffer)
+
+
+def test_close_keeps_the_picture_and_stops_drawing() -> None:
+    fb = ParallelFrameBuffer(width=16, height=16, workers=1)
+    fb.clear_framebuffer()
+    triangle = np.array([[[0.0, 0.0], [15.0, 0.0], [0.0, 15.0]]])
+    fb.draw_triangles(triangle, np.array([[9, 9, 9]]))
+    before = fb._framebuffer.copy()
+    fb.close()
+    fb.close()  # idempotent
+    assert np.array_equal(fb._framebuffer, before)
+    with pytest.raises(ValueError, match="after close"):
+        fb.draw_triangles(triangle, np.array([[9, 9, 9]]))
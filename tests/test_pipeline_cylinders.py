@@ -0,0 +1,66 @@
+# Copyright (c) 2018-2026 William Emerison Six
+#
+# Tests for the broadcast cylinder-mesh builder in mvpvisualization._pipeline:
+# it must emit exactly the triangles the per-edge, per-slice loop it replaced
+# did (same order, same winding), and hand back one shared read-only mesh per
+# (edges, radius, slices).  Pure data -- no display / no real GL needed.
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from modelviewprojection.mvpvisualization import _pipeline as _p
+
+
+def looped_cylinders(edges: list, radius: float, slices: int) -> np.ndarray:
+    """The original one-slice-at-a-time construction, as the reference."""
+    verts: list[float] = []
+    for raw_p0, raw_p1 in edges:
+        p0 = np.array(raw_p0, dtype=np.float64)
+        p1 = np.array(raw_p1, dtype=np.float64)
+        length = float(np.linalg.norm(p1 - p0))
+        if length < 1e-9:
+            continue
+        forward = (p1 - p0) / length
+        ref = np.array([1.0, 0.0, 0.0] if abs(forward[1]) > 0.9 else [0, 1, 0])
+        right = np.cross(forward, ref)
+        right = right / float(np.linalg.norm(right))
+        up = np.cross(forward, right)
+        for i in range(slices):
+            a0 = 2.0 * math.pi * i / slices
+            a1 = 2.0 * math.pi * (i + 1) / slices
+            off0 = radius * (math.cos(a0) * right + math.sin(a0) * up)
+            off1 = radius * (math.cos(a1) * right + math.sin(a1) * up)
+            b0, b1, t0, t1 = p0 + off0, p0 + off1, p1 + off0, p1 + off1
+            for v in (b0, b1, t1, b0, t1, t0, p0, b1, b0, p1, t0, t1):
+                verts += list(v)
+    return np.array(verts, dtype=np.float32)
+
+
+EDGES: list = [
+    ((-20.0, -5.0, 3.0), (20.0, -5.0, 3.0)),  # a ground line
+    ((0.0, -1.0, 0.0), (0.0, 3.0, 0.0)),  # along y: the other reference axis
+    ((1.0, 2.0, 3.0), (-2.0, 0.5, 7.0)),  # oblique
+    ((4.0, 4.0, 4.0), (4.0, 4.0, 4.0)),  # zero length: skipped
+]
+
+
+@pytest.mark.parametrize("slices", [3, 20])
+def test_broadcast_mesh_matches_the_per_slice_loop(slices: int) -> None:
+    mesh: np.ndarray = _p.build_cylinders_for_edges(EDGES, 0.25, slices)
+    assert mesh.dtype == np.float32
+    assert mesh.shape == (3 * slices * 4 * 3 * 3,)
+    assert np.allclose(mesh, looped_cylinders(EDGES, 0.25, slices), atol=1e-6)
+
+
+def test_meshes_are_cached_and_read_only() -> None:
+    mesh: np.ndarray = _p.build_cylinders_for_edges(EDGES, 0.25, 8)
+    # equal edges in another container type hit the same entry
+    assert _p.build_cylinders_for_edges(tuple(EDGES), 0.25, 8) is mesh
+    assert _p.build_cylinders_for_edges(EDGES, 0.5, 8) is not mesh
+    with pytest.raises(ValueError):
+        mesh[0] = 1.0
+    assert _p.build_ndc_cube_cylinders() is _p.build_ndc_cube_cylinders()
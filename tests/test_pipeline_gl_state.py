@@ -0,0 +1,138 @@
+# Copyright (c) 2018-2026 William Emerison Six
+#
+# Tests for mvpvisualization._pipeline.GLStateCache: a bind or uniform set that
+# would change nothing must not reach GL (and must be counted), while every
+# real change still must.  GL is swapped for a recorder, so no context needed.
+
+from __future__ import annotations
+
+import typing
+
+import pytest
+
+import modelviewprojection.matrix_stack as ms
+from modelviewprojection.mvpvisualization import _pipeline as _p
+
+
+class RecordingGL:
+    """Stands in for ``OpenGL.GL`` inside ``_pipeline``: records each call."""
+
+    GL_TRUE = 1
+    GL_TEXTURE0 = 0x84C0
+    GL_TEXTURE_2D = 0x0DE1
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[typing.Any, ...]]] = []
+
+    def __getattr__(self, name: str) -> typing.Callable[..., None]:
+        def record(*args: typing.Any) -> None:
+            self.calls.append((name, args))
+
+        return record
+
+    def names(self) -> list[str]:
+        return [name for name, _args in self.calls]
+
+
+@pytest.fixture
+def gl(monkeypatch: pytest.MonkeyPatch) -> RecordingGL:
+    recorder = RecordingGL()
+    monkeypatch.setattr(_p, "GL", recorder)
+    return recorder
+
+
+def test_repeated_binds_are_skipped(gl: RecordingGL) -> None:
+    state = _p.GLStateCache()
+    for _ in range(3):
+        state.use_program(7)
+        state.bind_vertex_array(2)
+    state.bind_vertex_array(3)
+    assert gl.names() == [
+        "glUseProgram",
+        "glBindVertexArray",
+        "glBindVertexArray",
+    ]
+    assert state.saved == 4
+    # a new frame forgets the bindings (imgui rebinds behind the cache)
+    state.begin_frame()
+    assert state.saved_last_frame == 4 and state.saved == 0
+    state.use_program(7)
+    assert gl.names()[-1] == "glUseProgram"
+
+
+def test_uniforms_are_per_program_and_survive_frames(gl: RecordingGL) -> None:
+    state = _p.GLStateCache()
+    state.use_program(1)
+    state.uniform3f(4, 0.1, 0.1, 0.1)
+    state.uniform3f(4, 0.1, 0.1, 0.1)
+    state.uniform3f(-1, 1.0, 0.0, 0.0)  # absent from the program
+    state.use_program(2)
+    state.uniform3f(4, 0.1, 0.1, 0.1)  # same location, another program
+    state.begin_frame()
+    state.use_program(1)
+    state.uniform3f(4, 0.1, 0.1, 0.1)  # program state outlives the frame
+    state.uniform3f(4, 0.5, 0.5, 0.5)
+    assert [n for n in gl.names() if n.startswith("glUniform")] == [
+        "glUniform3f",
+        "glUniform3f",
+        "glUniform3f",
+    ]
+
+
+def test_model_matrix_is_resent_only_after_it_changes(gl: RecordingGL) -> None:
+    state = _p.GLStateCache()
+    state.use_program(1)
+    ms.set_to_identity_matrix(ms.MatrixStack.model)
+    state.uniform_model_matrix(0)
+    state.uniform_model_matrix(0)
+    ms.translate(ms.MatrixStack.model, 1.0, 2.0, 3.0)
+    state.uniform_model_matrix(0)
+    sent = [args for name, args in gl.calls if name == "glUniformMatrix4fv"]
+    assert len(sent) == 2
+    assert sent[-1][3][:3, 3].tolist() == [1.0, 2.0, 3.0]
+    # another matrix-stack context is another matrix, whatever its version
+    with ms.use_context(ms.MatrixStackContext()):
+        state.uniform_model_matrix(0)
+    assert gl.names().count("glUniformMatrix4fv") == 3
+
+
+def test_textures_are_tracked_per_unit(gl: RecordingGL) -> None:
+    state = _p.GLStateCache()
+    state.bind_texture(0, gl.GL_TEXTURE_2D, 5)
+    state.bind_texture(0, gl.GL_TEXTURE_2D, 5)
+    state.bind_texture(1, gl.GL_TEXTURE_2D, 5)
+    state.bind_texture(1, gl.GL_TEXTURE_2D, 6)
+    assert gl.names() == [
+        "glActiveTexture",
+        "glBindTexture",
+        "glActiveTexture",
+        "glBindTexture",
+        "glBindTexture",
+    ]
+    assert state.saved == 2
+
+
+def test_another_context_starts_the_caches_over(
+    gl: RecordingGL, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_p, "gl_state", _p.GLStateCache())
+    monkeypatch.setattr(_p, "_camera_block", _p._CameraBlock())
+    first, second = object(), object()
+    _p.follow_context(first)
+    _p.gl_state.use_program(1)
+    _p.gl_state.uniform1f(0, 1.0)
+    _p._camera_block.ubo = 9
+    _p.follow_context(first)  # the same context again: nothing forgotten
+    _p.gl_state.use_program(1)
+    assert _p._camera_block.ubo == 9
+    # the names of the first context mean nothing in the second
+    _p.follow_context(second)
+    assert _p._camera_block.ubo == 0
+    _p.gl_state.use_program(1)
+    _p.gl_state.uniform1f(0, 1.0)
+    assert gl.names() == [
+        "glUseProgram",
+        "glUniform1f",
+        "glUseProgram",
+        "glUniform1f",
+    ]
@@ -0,0 +1,112 @@
+# Copyright (c) 2018-2026 William Emerison Six
+#
+# Tests for the on-disk program-binary cache in mvpvisualization._pipeline:
+# the key must separate drivers and stage sources, and an entry must read back
+# exactly as written (or not at all).  The GL calls that produce and consume
+# the binaries need a context, so beyond the pure file/key layer only the
+# linking is tested, against a fake GL that records its calls.
+
+from __future__ import annotations
+
+import itertools
+import pathlib
+import types
+import typing
+
+import pytest
+
+from modelviewprojection.mvpvisualization import _pipeline as _p
+
+
+class LinkingGL:
+    """Stands in for ``OpenGL.GL`` inside ``_pipeline``: records each call,
+    and links a program only when ``links``."""
+
+    GL_TRUE = 1
+    GL_FALSE = 0
+    GL_LINK_STATUS = 0x8B82
+    GL_PROGRAM_BINARY_RETRIEVABLE_HINT = 0x8257
+
+    def __init__(self) -> None:
+        self.links: bool = True
+        self.calls: list[str] = []
+
+    def __getattr__(self, name: str) -> typing.Callable[..., typing.Any]:
+        def record(*args: typing.Any) -> typing.Any:
+            self.calls.append(name)
+            match name:
+                case "glCreateProgram":
+                    return 7
+                case "glGetProgramiv":
+                    return self.GL_TRUE if self.links else self.GL_FALSE
+                case "glGetProgramInfoLog":
+                    return b"project: undefined"
+                case _:
+                    return None
+
+        return record
+
+
+@pytest.fixture
+def gl(monkeypatch: pytest.MonkeyPatch) -> LinkingGL:
+    fake = LinkingGL()
+    names = itertools.count(1)
+
+    def compile_shader(source: str, kind: int) -> int:
+        if source == "broken":
+            raise RuntimeError("shader compile failure")
+        return next(names)
+
+    monkeypatch.setattr(_p, "GL", fake)
+    monkeypatch.setattr(
+        _p, "shaders", types.SimpleNamespace(compileShader=compile_shader)
+    )
+    return fake
+
+
+def test_key_depends_on_driver_and_every_stage() -> None:
+    key: str = _p.program_key("llvmpipe", ["vert", "frag"])
+    assert key == _p.program_key("llvmpipe", ["vert", "frag"])
+    assert key != _p.program_key("radeonsi", ["vert", "frag"])
+    assert key != _p.program_key("llvmpipe", ["vert", "geom", "frag"])
+    # the same text split differently between stages is another program
+    assert key != _p.program_key("llvmpipe", ["ver", "tfrag"])
+
+
+def test_binary_round_trip(tmp_path: pathlib.Path) -> None:
+    path: str = str(tmp_path / "nested" / "program.bin")
+    assert _p.read_program_binary(path) is None
+    _p.write_program_binary(path, 0x8741, b"\x00\x01binary")
+    assert _p.read_program_binary(path) == (0x8741, b"\x00\x01binary")
+    # no temporary file is left next to the entry
+    assert [p.name for p in (tmp_path / "nested").iterdir()] == ["program.bin"]
+
+
+def test_truncated_entry_is_a_miss(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "program.bin"
+    path.write_bytes(b"\x41\x87\x00\x00")
+    assert _p.read_program_binary(str(path)) is None
+
+
+def test_retrievable_hint_only_with_a_cache(gl: LinkingGL) -> None:
+    stages = [(1, "vert"), (2, "frag")]
+    assert _p._link_program(stages, retrievable=False) == 7
+    # GL 3.3 without ARB_get_program_binary has no glProgramParameteri
+    assert "glProgramParameteri" not in gl.calls
+    _p._link_program(stages, retrievable=True)
+    assert "glProgramParameteri" in gl.calls
+    assert gl.calls.count("glDeleteShader") == 4
+
+
+def test_failed_link_leaves_nothing_behind(gl: LinkingGL) -> None:
+    gl.links = False
+    with pytest.raises(RuntimeError, match="project: undefined"):
+        _p._link_program([(1, "vert"), (2, "frag")], retrievable=True)
+    assert gl.calls.count("glDeleteProgram") == 1
+    assert gl.calls.count("glDeleteShader") == 2
+
+
+def test_failed_compile_deletes_the_stages_before_it(gl: LinkingGL) -> None:
+    with pytest.raises(RuntimeError, match="shader compile failure"):
+        _p._link_program([(1, "vert"), (2, "broken")], retrievable=False)
+    assert gl.calls == ["glDeleteShader"]
@@ -0,0 +1,168 @@
+# Copyright (c) 2018-2026 William Emerison Six
+#
+# Tests for mvpvisualization.profiling: phases nest into a per-frame tree,
+# GPU timestamps are read back two frames late and never waited for, and the
+# history exports as a Chrome trace.  GL is swapped for a fake that answers
+# timestamp queries, and the CPU clock is a counter, so no context is needed.
+
+from __future__ import annotations
+
+import json
+import pathlib
+import typing
+
+import numpy as np
+import pytest
+
+from modelviewprojection.mvpvisualization import profiling
+
+
+class FakeGL:
+    """Stands in for ``OpenGL.GL`` inside ``profiling``: each timestamp
+    query reads 1000 ns after the previous one, once ``available``."""
+
+    GL_TIMESTAMP = 0x8E28
+    GL_QUERY_RESULT = 0x8866
+    GL_QUERY_RESULT_AVAILABLE = 0x8867
+
+    def __init__(self) -> None:
+        self.available: bool = True
+        self.generated: int = 0
+        self.stamps: typing.Dict[int, int] = {}
+        self.results_read: int = 0
+
+    def glGenQueries(self, n: int) -> typing.List[int]:  # noqa: N802
+        ids = list(range(self.generated + 1, self.generated + n + 1))
+        self.generated += n
+        return ids
+
+    def glQueryCounter(self, query: int, target: int) -> None:  # noqa: N802
+        assert target == self.GL_TIMESTAMP
+        self.stamps[query] = 1000 * (len(self.stamps) + 1)
+
+    def glGetQueryObjectui64v(  # noqa: N802
+        self, query: int, pname: int, out: np.ndarray
+    ) -> None:
+        if pname == self.GL_QUERY_RESULT_AVAILABLE:
+            out[0] = self.available
+        else:
+            assert self.available, "read a result that was not available"
+            self.results_read += 1
+            out[0] = self.stamps[query]
+
+
+@pytest.fixture
+def gl(monkeypatch: pytest.MonkeyPatch) -> FakeGL:
+    fake = FakeGL()
+    monkeypatch.setattr(profiling, "GL", fake)
+    return fake
+
+
+def counter(step: int = 1_000_000) -> typing.Callable[[], int]:
+    """A clock that moves ``step`` ns per read."""
+    ticks = iter(range(0, 1 << 62, step))
+    return lambda: next(ticks)
+
+
+def run_frame(p: profiling.Profiler) -> None:
+    p.begin_frame()
+    with p.phase("scene"):
+        for _ in range(2):
+            with p.phase("uniforms", gpu=False):
+                pass
+    with p.phase("swap", gpu=False):
+        pass
+    p.end_frame()
+
+
+def test_disabled_profiler_records_nothing(gl: FakeGL) -> None:
+    p = profiling.Profiler(clock=counter())
+    run_frame(p)
+    assert not p.frames and gl.generated == 0
+    assert p.breakdown() == []
+
+
+def test_breakdown_is_a_tree_of_means(gl: FakeGL) -> None:
+    p = profiling.Profiler(enabled=True, clock=counter())
+    for _ in range(3):
+        run_frame(p)
+    rows = p.breakdown()
+    assert [r.path for r in rows] == [
+        ("scene",),
+        ("scene", "uniforms"),
+        ("swap",),
+    ]
+    scene, uniforms, swap = rows
+    assert (scene.cpu_ms, scene.calls) == (5.0, 1.0)
+    assert (uniforms.cpu_ms, uniforms.calls) == (2.0, 2.0)
+    assert uniforms.gpu_ms is None and swap.gpu_ms is None
+    # only the first frame's queries have come back yet: 1000 ns apart
+    assert scene.gpu_ms == pytest.approx(0.001)
+
+
+def test_gpu_times_are_read_two_frames_late(gl: FakeGL) -> None:
+    p = profiling.Profiler(enabled=True, clock=counter())
+    run_frame(p)
+    run_frame(p)
+    assert gl.results_read == 0
+    assert p.frames[0][0].gpu_ns is None
+    run_frame(p)  # reuses, so first reads back, the first frame's set
+    assert p.frames[0][0].gpu_ns == 1000
+    assert p.frames[1][0].gpu_ns is None
+    # the two sets alternate rather than growing every frame
+    assert gl.generated == 2 * profiling.QUERY_BATCH
+
+
+def test_unfinished_queries_are_dropped_not_waited_for(gl: FakeGL) -> None:
+    p = profiling.Profiler(enabled=True, clock=counter())
+    run_frame(p)
+    run_frame(p)
+    gl.available = False
+    run_frame(p)
+    assert gl.results_read == 0
+    assert p.frames[0][0].gpu_ns is None
+    assert p.frames[0][0]._queries is None
+
+
+def test_instrument_times_an_objects_methods(gl: FakeGL) -> None:
+    class Animation:
+        def transform_matrix(self, space: str, time: float) -> str:
+            return f"{space}@{time}"
+
+    animation = Animation()
+    p = profiling.Profiler(enabled=True, clock=counter())
+    p.instrument(animation, "transform_matrix")
+    p.begin_frame()
+    with p.phase("scene", gpu=False):
+        assert animation.transform_matrix("paddle", 0.5) == "paddle@0.5"
+    p.end_frame()
+    assert [r.path for r in p.breakdown()] == [
+        ("scene",),
+        ("scene", "transform_matrix"),
+    ]
+    # other instances are left alone
+    assert "transform_matrix" not in vars(Animation())
+
+
+def test_chrome_trace(gl: FakeGL, tmp_path: pathlib.Path) -> None:
+    p = profiling.Profiler(
+        enabled=True, clock=counter(), trace_path=str(tmp_path / "t.json")
+    )
+    assert p.chrome_trace() == {"traceEvents": []}
+    for _ in range(3):
+        run_frame(p)
+    written = json.loads(pathlib.Path(p.write_chrome_trace()).read_text())
+    complete = [e for e in written["traceEvents"] if e["ph"] == "X"]
+    cpu = [e for e in complete if e["tid"] == 1]
+    gpu = [e for e in complete if e["tid"] == 2]
+    assert len(cpu) == 3 * 4 and len(gpu) == 1
+    assert cpu[0] == {
+        "name": "scene",
+        "ph": "X",
+        "pid": 1,
+        "tid": 1,
+        "ts": 0.0,
+        "dur": 5000.0,
+    }
+    # the GPU track is lined up with the phase on the CPU track
+    assert gpu[0]["ts"] == cpu[0]["ts"] and gpu[0]["dur"] == 1.0
@@ -0,0 +1,252 @@
+# Copyright (c) 2018-2026 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the software rasterizer (``framebuffer/softwarerendering.py``).
+
+The per-pixel loop is the reference: it is the algorithm the notebook
+explains, one gacalc orientation predicate at a time.  The vectorized mode
+must light exactly the same pixels -- the notebook output may not change
+when it switches -- so those tests compare the two.  Likewise the
+batched ``draw_triangles`` is checked against a plain loop of
+``draw_filled_triangle`` calls, and the 3D path against hand-computed
+depths and perspective-correct colors.
+"""
+
+import numpy as np
+import pytest
+from gacalc.g2 import Vector2, e_1, e_2
+
+from modelviewprojection.framebuffer.softwarerendering import (
+    DepthFunction,
+    FrameBuffer,
+    Rasterizer,
+    depth_test,
+)
+
+
+def _v(x: float, y: float) -> Vector2:
+    return x * e_1 + y * e_2
+
+
+def _render(
+    rasterizer: Rasterizer,
+    width: int,
+    height: int,
+    triangles: list[tuple[Vector2, Vector2, Vector2]],
+) -> np.ndarray:
+    fb = FrameBuffer(width=width, height=height, rasterizer=rasterizer)
+    fb.clear_framebuffer()
+    for index, (p1, p2, p3) in enumerate(triangles):
+        fb.draw_filled_triangle(p1, p2, p3, color=(255, (40 * index) % 256, 7))
+    return fb._framebuffer
+
+
+@pytest.mark.parametrize(
+    "triangle",
+    [
+        # the notebook's two triangles, one of each winding
+        (_v(50, 50), _v(50, 70), _v(70, 70)),
+        (_v(50, 50), _v(30, 50), _v(30, 30)),
+        # hanging off every side of the framebuffer
+        (_v(-10, -10), _v(40, 5), _v(5, 40)),
+        (_v(90, 90), _v(130, 95), _v(95, 130)),
+        # non-integer vertices, so edges pass between pixel centers
+        (_v(10.5, 3.25), _v(80.75, 20.5), _v(33.3, 77.7)),
+        # entirely off screen
+        (_v(-30, -30), _v(-10, -30), _v(-20, -5)),
+    ],
+)
+def test_vectorized_matches_per_pixel(
+    triangle: tuple[Vector2, Vector2, Vector2],
+) -> None:
+    slow = _render(Rasterizer.per_pixel, 100, 100, [triangle])
+    fast = _render(Rasterizer.vectorized, 100, 100, [triangle])
+    assert np.array_equal(slow, fast)
+
+
+def test_vectorized_matches_per_pixel_on_random_overlapping_triangles() -> None:
+    rng = np.random.default_rng(1234)
+    triangles = [
+        (_v(*corners[0]), _v(*corners[1]), _v(*corners[2]))
+        for corners in rng.uniform(-10.0, 50.0, (12, 3, 2)).tolist()
+    ]
+    slow = _render(Rasterizer.per_pixel, 40, 40, triangles)
+    fast = _render(Rasterizer.vectorized, 40, 40, triangles)
+    assert np.array_equal(slow, fast)
+
+
+def test_degenerate_triangle_draws_nothing_in_either_mode() -> None:
+    collinear = (_v(10, 10), _v(20, 20), _v(30, 30))
+    for rasterizer in Rasterizer:
+        pixels = _render(rasterizer, 40, 40, [collinear])
+        assert not pixels.any()
+
+
+def _draw_one_by_one(
+    width: int, height: int, vertices: np.ndarray, colors: np.ndarray
+) -> np.ndarray:
+    fb = FrameBuffer(width=width, height=height)
+    fb.clear_framebuffer()
+    for corners, color in zip(vertices.tolist(), colors.tolist()):
+        fb.draw_filled_triangle(
+            _v(*corners[0]), _v(*corners[1]), _v(*corners[2]), color=color
+        )
+    return fb._framebuffer
+
+
+@pytest.mark.parametrize("tile_size", [1, 7, 32, 1000])
+def test_draw_triangles_matches_sequential_draws(tile_size: int) -> None:
+    rng = np.random.default_rng(99)
+    vertices = rng.uniform(-15.0, 75.0, (40, 3, 2))
+    # a few integer-cornered triangles, so edges land exactly on pixels
+    vertices[:10] = np.round(vertices[:10])
+    colors = rng.integers(1, 256, (40, 3))
+    expected = _draw_one_by_one(60, 45, vertices, colors)
+
+    fb = FrameBuffer(width=60, height=45)
+    fb.clear_framebuffer()
+    fb.draw_triangles(vertices, colors, tile_size=tile_size)
+    assert np.array_equal(fb._framebuffer, expected)
+
+
+def test_draw_triangles_culls_degenerate_and_offscreen() -> None:
+    vertices = np.array(
+        [
+            [[10.0, 10.0], [20.0, 20.0], [30.0, 30.0]],  # collinear
+            [[5.0, 5.0], [5.0, 5.0], [9.0, 2.0]],  # repeated vertex
+            [[-30.0, -30.0], [-10.0, -30.0], [-20.0, -5.0]],  # off screen
+        ]
+    )
+    fb = FrameBuffer(width=40, height=40)
+    fb.clear_framebuffer()
+    fb.draw_triangles(vertices, np.full((3, 3), 255))
+    assert not fb._framebuffer.any()
+
+
+def test_draw_triangles_rejects_bad_shapes() -> None:
+    fb = FrameBuffer(width=4, height=4)
+    with pytest.raises(ValueError, match="draw_triangles: vertices"):
+        fb.draw_triangles(np.zeros((2, 3, 3)), np.zeros((2, 3)))
+    with pytest.raises(ValueError, match="draw_triangles: colors"):
+        fb.draw_triangles(np.zeros((2, 3, 2)), np.zeros((3, 3)))
+
+
+def _square_at(z: float) -> np.ndarray:
+    """Two clip-space triangles covering the whole viewport at NDC depth z."""
+    corners = np.array(
+        [[[-1, -1], [1, -1], [1, 1]], [[-1, -1], [1, 1], [-1, 1]]], dtype=float
+    )
+    return np.concatenate(
+        [corners, np.full((2, 3, 1), z), np.ones((2, 3, 1))], axis=2
+    )
+
+
+@pytest.mark.parametrize("near_first", [True, False])
+def test_lequal_depth_test_keeps_the_nearest_surface(near_first: bool) -> None:
+    fb = FrameBuffer(width=6, height=5, depth_buffer=True)
+    fb.clear_framebuffer()
+    near, far = (_square_at(-0.5), (255, 0, 0)), (_square_at(0.5), (0, 0, 255))
+    for positions, color in [near, far] if near_first else [far, near]:
+        fb.draw_triangles_3d(positions, np.full((2, 3, 3), color))
+    assert (fb._framebuffer == (255, 0, 0)).all()
+    assert np.allclose(fb._depthbuffer, 0.25)
+
+    fb.clear_depthbuffer()
+    assert (fb._depthbuffer == 1.0).all()
+
+
+def test_without_a_depth_buffer_the_last_triangle_wins() -> None:
+    fb = FrameBuffer(width=6, height=5)
+    fb.clear_framebuffer()
+    fb.draw_triangles_3d(_square_at(-0.5), np.full((2, 3, 3), 255.0))
+    fb.draw_triangles_3d(_square_at(0.5), np.full((2, 3, 3), 9.0))
+    assert (fb._framebuffer == 9).all()
+    assert fb._depthbuffer is None
+
+
+@pytest.mark.parametrize(
+    ("depth_function", "expected"),
+    [
+        (DepthFunction.never, []),
+        (DepthFunction.less, [0.25]),
+        (DepthFunction.equal, [0.5]),
+        (DepthFunction.lequal, [0.25, 0.5]),
+        (DepthFunction.greater, [0.75]),
+        (DepthFunction.notequal, [0.25, 0.75]),
+        (DepthFunction.gequal, [0.5, 0.75]),
+        (DepthFunction.always, [0.25, 0.5, 0.75]),
+    ],
+)
+def test_depth_test_mirrors_gl_depth_func(
+    depth_function: DepthFunction, expected: list[float]
+) -> None:
+    incoming = np.array([0.25, 0.5, 0.75], dtype=np.float32)
+    passed = depth_test(depth_function, incoming, np.float32(0.5))
+    assert incoming[passed].tolist() == expected
+
+
+def test_colors_interpolate_perspective_correctly() -> None:
+    # a plane receding from x=-2, z=-2 to x=6, z=-6 in camera space fills the
+    # whole 90-degree frustum; red runs 0 -> 255 along it.
+    projection = np.array(
+        [
+            [1.0, 0.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0, 0.0],
+            [0.0, 0.0, -11.0 / 9.0, -20.0 / 9.0],
+            [0.0, 0.0, -1.0, 0.0],
+        ]
+    )
+    left_bottom, left_top = (-2.0, -2.0, -2.0, 1.0), (-2.0, 2.0, -2.0, 1.0)
+    right_bottom, right_top = (6.0, -6.0, -6.0, 1.0), (6.0, 6.0, -6.0, 1.0)
+    camera = np.array(
+        [
+            [left_bottom, right_bottom, right_top],
+            [left_bottom, right_top, left_top],
+        ]
+    )
+    black, red = (0.0, 0.0, 0.0), (255.0, 0.0, 0.0)
+    colors = np.array([[black, red, red], [black, red, black]])
+    fb = FrameBuffer(width=16, height=4, depth_buffer=True)
+    fb.clear_framebuffer()
+    fb.draw_triangles_3d(camera @ projection.T, colors)
+
+    # the fraction s of the way along the plane seen through each pixel
+    # column's center: solve x_ndc = (-2 + 8 s) / (2 + 4 s) for s.
+    x_ndc = (np.arange(16) + 0.5) * 2.0 / 16 - 1.0
+    s = (2.0 + 2.0 * x_ndc) / (8.0 - 4.0 * x_ndc)
+    for row in fb._framebuffer:
+        assert np.abs(row[:, 0].astype(float) - 255.0 * s).max() <= 1.0
+
+
+def test_texture_lookup_uses_interpolated_uvs() -> None:
+    checker = np.zeros((2, 2, 3), dtype=np.uint8)
+    checker[0, 0] = checker[1, 1] = 255  # white top-left and bottom-right
+    uvs = np.array(
+        [[[0, 0], [1, 0], [1, 1]], [[0, 0], [1, 1], [0, 1]]], dtype=float
+    )
+    fb = FrameBuffer(width=4, height=4)
+    fb.clear_framebuffer()
+    fb.draw_triangles_3d(
+        _square_at(0.0), np.zeros((2, 3, 3)), uvs=uvs, texture=checker
+    )
+    assert (fb._framebuffer[:2, :2] == 255).all()
+    assert (fb._framebuffer[2:, 2:] == 255).all()
+    assert not fb._framebuffer[:2, 2:].any()
+    assert not fb._framebuffer[2:, :2].any()
@@ -0,0 +1,246 @@
+# Copyright (c) 2018-2026 William Emerison Six
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+
+"""Microbenchmark the ``matrix_stack`` kernels against the baseline module.
+
+Times each kernel per call next to its baseline: the functions below marked
+``_before_*`` are copied verbatim from ``matrix_stack.py`` as it was before
+the stacks moved into preallocated blocks (commit a786956), docstrings
+dropped, and they run on that version's own list-of-arrays stacks.  Only
+``get_current_matrix`` is renamed, so the copies call each other rather than
+the current module.  The baseline kernels copy the whole 4x4 top with
+``np.copy`` for every rotation and ``m.copy()`` for every ``multiply``, and
+assign NumPy scalars one at a time.  The current kernels write the touched
+columns in place through per-stack scratch buffers.
+
+Run from the repo root, against the installed package (``pip install -e .``)
+or the source tree::
+
+    PYTHONPATH=src python tools/bench_matrix_stack.py [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import timeit
+import typing
+
+import numpy as np
+
+from modelviewprojection import matrix_stack
+from modelviewprojection.matrix_stack import MatrixStack
+
+# -- the baseline, verbatim -------------------------------------------------
+
+__modelStack__: list[np.ndarray] = [
+    np.array(
+        [
+            [1.0, 0.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0, 0.0],
+            [0.0, 0.0, 1.0, 0.0],
+            [0.0, 0.0, 0.0, 1.0],
+        ],
+        dtype=np.float32,
+    )
+]
+__viewStack__: list[np.ndarray] = [
+    np.array(
+        [
+            [1.0, 0.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0, 0.0],
+            [0.0, 0.0, 1.0, 0.0],
+            [0.0, 0.0, 0.0, 1.0],
+        ],
+        dtype=np.float32,
+    )
+]
+__projectionStack__: list[np.ndarray] = [
+    np.array(
+        [
+            [1.0, 0.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0, 0.0],
+            [0.0, 0.0, 1.0, 0.0],
+            [0.0, 0.0, 0.0, 1.0],
+        ],
+        dtype=np.float32,
+    )
+]
+
+
+def _before_get_current_matrix(matrix_stack: MatrixStack) -> np.ndarray:
+    match matrix_stack:
+        case MatrixStack.model:
+            return __modelStack__[-1]
+        case MatrixStack.view:
+            return __viewStack__[-1]
+        case MatrixStack.projection:
+            return __projectionStack__[-1]
+        case MatrixStack.modelview:
+            return np.matmul(
+                __viewStack__[-1],
+                __modelStack__[-1],
+            )
+        case MatrixStack.modelviewprojection:
+            return np.matmul(
+                __projectionStack__[-1],
+                np.matmul(
+                    __viewStack__[-1],
+                    __modelStack__[-1],
+                ),
+            )
+        case _:
+            raise ValueError(
+                f"get_current_matrix: unhandled MatrixStack member "
+                f"{matrix_stack!r}"
+            )
+
+
+def _before_rotate_x(matrix_stack: MatrixStack, rads: float) -> None:
+    m = _before_get_current_matrix(matrix_stack)
+    copy_of_m = np.copy(m)
+
+    c = math.cos(rads)
+    s = math.sin(rads)
+
+    m[0, 1] = copy_of_m[0, 1] * c + copy_of_m[0, 2] * s
+    m[1, 1] = copy_of_m[1, 1] * c + copy_of_m[1, 2] * s
+    m[2, 1] = copy_of_m[2, 1] * c + copy_of_m[2, 2] * s
+    m[3, 1] = copy_of_m[3, 1] * c + copy_of_m[3, 2] * s
+
+    m[0, 2] = copy_of_m[0, 1] * -s + copy_of_m[0, 2] * c
+    m[1, 2] = copy_of_m[1, 1] * -s + copy_of_m[1, 2] * c
+    m[2, 2] = copy_of_m[2, 1] * -s + copy_of_m[2, 2] * c
+    m[3, 2] = copy_of_m[3, 1] * -s + copy_of_m[3, 2] * c
+
+
+def _before_translate(
+    matrix_stack: MatrixStack, x: float, y: float, z: float
+) -> None:
+    m = _before_get_current_matrix(matrix_stack)
+
+    m[0, 3] = m[0, 0] * x + m[0, 1] * y + m[0, 2] * z + m[0, 3]
+    m[1, 3] = m[1, 0] * x + m[1, 1] * y + m[1, 2] * z + m[1, 3]
+    m[2, 3] = m[2, 0] * x + m[2, 1] * y + m[2, 2] * z + m[2, 3]
+    m[3, 3] = m[3, 0] * x + m[3, 1] * y + m[3, 2] * z + m[3, 3]
+
+
+def _before_scale(
+    matrix_stack: MatrixStack, x: float, y: float, z: float
+) -> None:
+    m = _before_get_current_matrix(matrix_stack)
+
+    m[0, 0] = m[0, 0] * x
+    m[1, 0] = m[1, 0] * x
+    m[2, 0] = m[2, 0] * x
+    m[3, 0] = m[3, 0] * x
+
+    m[0, 1] = m[0, 1] * y
+    m[1, 1] = m[1, 1] * y
+    m[2, 1] = m[2, 1] * y
+    m[3, 1] = m[3, 1] * y
+
+    m[0, 2] = m[0, 2] * z
+    m[1, 2] = m[1, 2] * z
+    m[2, 2] = m[2, 2] * z
+    m[3, 2] = m[3, 2] * z
+
+
+def _before_multiply(matrix_stack: MatrixStack, rhs: np.ndarray) -> None:
+    m = _before_get_current_matrix(matrix_stack)
+    m[0:4, 0:4] = np.matmul(m.copy(), rhs)
+
+
+# -- the cases ---------------------------------------------------------------
+
+# a rotation, so thousands of repeated products neither overflow nor vanish
+_RHS: np.ndarray = np.array(
+    [[0.0, -1.0, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0], [0, 0, 1, 0], [0, 0, 0, 1]],
+    dtype=np.float32,
+)
+
+#: (name, before, after) -- each a no-argument call of one kernel
+_CASES: typing.List[
+    typing.Tuple[str, typing.Callable[[], object], typing.Callable[[], object]]
+] = [
+    (
+        "rotate_x",
+        lambda: _before_rotate_x(MatrixStack.model, 0.001),
+        lambda: matrix_stack.rotate_x(MatrixStack.model, 0.001),
+    ),
+    (
+        "translate",
+        lambda: _before_translate(MatrixStack.model, 0.001, 0.0, 0.0),
+        lambda: matrix_stack.translate(MatrixStack.model, 0.001, 0.0, 0.0),
+    ),
+    (
+        "scale",
+        lambda: _before_scale(MatrixStack.model, 1.0, 1.0, 1.0),
+        lambda: matrix_stack.scale(MatrixStack.model, 1.0, 1.0, 1.0),
+    ),
+    (
+        "multiply",
+        lambda: _before_multiply(MatrixStack.model, _RHS),
+        lambda: matrix_stack.multiply(MatrixStack.model, _RHS),
+    ),
+    (
+        "get model",
+        lambda: _before_get_current_matrix(MatrixStack.model),
+        lambda: matrix_stack.get_current_matrix(MatrixStack.model),
+    ),
+    (
+        "get mvp",
+        lambda: _before_get_current_matrix(MatrixStack.modelviewprojection),
+        lambda: matrix_stack.get_current_matrix(
+            MatrixStack.modelviewprojection
+        ),
+    ),
+]
+
+
+def _per_call_us(
+    before: typing.Callable[[], object],
+    after: typing.Callable[[], object],
+    number: int,
+    rounds: int,
+) -> typing.Tuple[float, float]:
+    """Best of ``rounds`` runs of ``number`` calls of each, in microseconds
+    per call.  The runs alternate, so a noisy machine slows both alike."""
+    __modelStack__[-1][...] = np.identity(4)
+    matrix_stack.set_to_identity_matrix(MatrixStack.model)
+    before_us = after_us = math.inf
+    for _ in range(rounds):
+        before_us = min(before_us, timeit.timeit(before, number=number))
+        after_us = min(after_us, timeit.timeit(after, number=number))
+    return before_us / number * 1e6, after_us / number * 1e6
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--number", type=int, default=5000, help="calls per timing run"
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=20, help="timing runs per kernel"
+    )
+    args = parser.parse_args(argv)
+
+    print(f"{'kernel':<10} {'before us':>10} {'after us':>10} {'speedup':>8}")
+    for name, before, after in _CASES:
+        before_us, after_us = _per_call_us(
+            before, after, args.number, args.rounds
+        )
+        print(
+            f"{name:<10} {before_us:>10.3f} {after_us:>10.3f} "
+            f"{before_us / after_us:>7.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())